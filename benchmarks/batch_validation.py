@@ -0,0 +1,46 @@
+"""Compare validating geometries one by one and with `validate_many`.
+
+Run with `python -m benchmarks.batch_validation [row count]`.
+"""
+
+import sys
+import time
+from typing import Any
+
+import pydantic
+
+from geodantic import Geometry, validate_many
+
+
+def _rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "type": "Polygon",
+            "coordinates": [
+                [[i % 170, 0], [i % 170 + 1, 0], [i % 170 + 1, 1], [i % 170, 0]]
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    rows = _rows(count)
+    adapter: pydantic.TypeAdapter[Any] = pydantic.TypeAdapter(Geometry)
+
+    start = time.perf_counter()
+    for row in rows:
+        adapter.validate_python(row)
+    one_by_one = time.perf_counter() - start
+
+    start = time.perf_counter()
+    validate_many(Geometry, rows)
+    batched = time.perf_counter() - start
+
+    print(f"  one by one: {one_by_one:6.3f} s")
+    print(f"validate_many: {batched:6.3f} s, x{one_by_one / batched:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare the memory used per point feature by models and light tuples.
+
+Run with `python -m benchmarks.lightweight_memory [feature count]`.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from geodantic import Feature, FeatureCollection, Point, parse_light_features
+
+
+def _payload(count: int) -> bytes:
+    return json.dumps(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [i % 180, i % 90]},
+                    "properties": {"id": i},
+                }
+                for i in range(count)
+            ],
+        }
+    ).encode()
+
+
+def _measure(parse: Callable[[bytes], Any], payload: bytes) -> tuple[int, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = parse(payload)
+    elapsed = time.perf_counter() - start
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size, elapsed
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    payload = _payload(count)
+    model = FeatureCollection[Feature[Point, dict[str, Any]]]
+    for name, parse in [
+        ("models", model.model_validate_json),
+        ("light", parse_light_features),
+    ]:
+        size, elapsed = _measure(parse, payload)
+        print(f"{name:>8}: {size / count:8.0f} bytes per feature, {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare the memory used per feature by dict and compact properties.
+
+Run with `python -m benchmarks.properties_memory [feature count]`.
+"""
+
+import json
+import sys
+import tracemalloc
+from typing import Any
+
+from geodantic import CompactProperties, Feature, FeatureCollection, Point
+
+KEY_COUNT = 30
+
+
+def _payload(count: int) -> bytes:
+    return json.dumps(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [i % 180, i % 90]},
+                    "properties": {f"key_{k}": i * k for k in range(KEY_COUNT)},
+                }
+                for i in range(count)
+            ],
+        }
+    ).encode()
+
+
+def _measure(model: type[FeatureCollection[Any]], payload: bytes) -> int:
+    tracemalloc.start()
+    collection = model.model_validate_json(payload)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del collection
+    return size
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    payload = _payload(count)
+    for name, model in [
+        ("dict", FeatureCollection[Feature[Point, dict[str, Any]]]),
+        ("compact", FeatureCollection[Feature[Point, CompactProperties]]),
+    ]:
+        size = _measure(model, payload)
+        print(f"{name:>8}: {size / count:8.0f} bytes per feature")
+
+
+if __name__ == "__main__":
+    main()
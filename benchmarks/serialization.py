@@ -0,0 +1,59 @@
+"""Compare `dump_geojson` with `model_dump_json` on a feature collection.
+
+Run with `python -m benchmarks.serialization [feature count]`.
+"""
+
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from geodantic import Feature, FeatureCollection, Polygon, dump_geojson
+
+
+def _collection(count: int) -> FeatureCollection[Any]:
+    return FeatureCollection[Feature[Polygon, dict[str, Any]]].model_validate(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "Polygon",
+                        "coordinates": [
+                            [
+                                [i % 170, 0],
+                                [i % 170 + 1, 0],
+                                [i % 170 + 1, 1],
+                                [i % 170, 0],
+                            ]
+                        ],
+                    },
+                    "properties": {"name": f"feature {i}", "value": i},
+                }
+                for i in range(count)
+            ],
+        }
+    )
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    collection = _collection(count)
+    serializers: list[tuple[str, Callable[[], bytes | str]]] = [
+        ("model_dump_json", lambda: collection.model_dump_json()),
+        (
+            "model_dump_json(exclude_unset)",
+            lambda: collection.model_dump_json(exclude_unset=True),
+        ),
+        ("dump_geojson", lambda: dump_geojson(collection)),
+    ]
+    for name, serialize in serializers:
+        start = time.perf_counter()
+        output = serialize()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>30}: {elapsed:6.3f} s, {len(output):>10} bytes")
+
+
+if __name__ == "__main__":
+    main()
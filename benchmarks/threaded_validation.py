@@ -0,0 +1,57 @@
+"""Measure how validating payloads on threads scales with the thread count.
+
+Threads only validate in parallel on free-threaded builds of Python.
+
+Run with `python -m benchmarks.threaded_validation [payload count]`.
+"""
+
+import json
+import os
+import sys
+import time
+from typing import Any
+
+from geodantic import Feature, Polygon, validate_json_batch
+
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+def _payloads(count: int) -> list[bytes]:
+    return [
+        json.dumps(
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [
+                        [[i % 170, 0], [i % 170 + 1, 0], [i % 170 + 1, 1], [i % 170, 0]]
+                    ],
+                },
+                "properties": {"name": f"feature {i}", "value": i},
+            }
+        ).encode()
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    payloads = _payloads(count)
+    model: Any = Feature[Polygon, dict[str, Any]]
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}, {os.cpu_count()} CPUs")
+
+    baseline = None
+    for threads in THREAD_COUNTS:
+        start = time.perf_counter()
+        validate_json_batch(model, payloads, max_workers=threads, chunk_size=256)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"{threads:>3} threads: {elapsed:6.3f} s,"
+            f" {count / elapsed:10.0f} payloads/s, x{baseline / elapsed:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
-from .features import Feature, FeatureCollection
+from .batching import PartitionedBatch, validate_json_batch, validate_many
+from .caching import CacheInfo, ValidationCache
+from .features import Feature, FeatureCollection, FeatureCollectionBuilder
+from .geoarrow import GeoArrowArray, from_geoarrow, to_geoarrow
 from .geometries import (
     Geometry,
     GeometryCollection,
@@ -9,6 +12,28 @@ from .geometries import (
     Point,
     Polygon,
 )
+from .lightweight import LightFeature, LightGeometry
+from .packing import CoordinatePrecision, PackedPositions, pack_coordinates
+from .parsing import (
+    ParseLimits,
+    PartitionedFeatureCollection,
+    parse_feature_collection,
+    parse_light_features,
+    partition_feature_collection,
+)
+from .polyline import (
+    decode_delta_varint,
+    decode_polyline,
+    decode_polylines,
+    encode_delta_varint,
+    encode_polyline,
+)
+from .projections import CoordinateTransform
+from .properties import CompactProperties
+from .serialization import FeatureCollectionWriter, dump_geojson, write_geojson
+from .shared import SharedFeature, SharedFeatureCollection
+from .tiling import TileKey
+from .topojson import from_topojson, to_topojson
 from .types import (
     BoundingBox,
     BoundingBox2D,
@@ -28,12 +53,29 @@ __all__ = [
     "BoundingBox",
     "BoundingBox2D",
     "BoundingBox3D",
+    "CacheInfo",
+    "CompactProperties",
+    "CoordinatePrecision",
+    "CoordinateTransform",
+    "decode_delta_varint",
+    "decode_polyline",
+    "decode_polylines",
+    "dump_geojson",
+    "encode_delta_varint",
+    "encode_polyline",
     "Feature",
     "FeatureCollection",
+    "FeatureCollectionBuilder",
+    "FeatureCollectionWriter",
+    "from_geoarrow",
+    "from_topojson",
+    "GeoArrowArray",
     "GeoJSONObjectType",
     "Geometry",
     "GeometryCollection",
     "Latitude",
+    "LightFeature",
+    "LightGeometry",
     "LinearRing",
     "LineString",
     "LineStringCoordinates",
@@ -41,10 +83,27 @@ __all__ = [
     "MultiLineString",
     "MultiPoint",
     "MultiPolygon",
+    "pack_coordinates",
+    "PackedPositions",
+    "parse_feature_collection",
+    "parse_light_features",
+    "ParseLimits",
+    "partition_feature_collection",
+    "PartitionedBatch",
+    "PartitionedFeatureCollection",
     "Point",
     "Polygon",
     "PolygonCoordinates",
     "Position",
     "Position2D",
     "Position3D",
+    "SharedFeature",
+    "SharedFeatureCollection",
+    "TileKey",
+    "to_geoarrow",
+    "to_topojson",
+    "validate_json_batch",
+    "validate_many",
+    "ValidationCache",
+    "write_geojson",
 ]
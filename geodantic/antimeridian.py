@@ -0,0 +1,229 @@
+from collections.abc import Sequence
+from itertools import pairwise
+
+from geodantic import planar
+
+type _Position = tuple[float, ...]
+type _Ring = list[_Position]
+
+
+def _crosses(positions: Sequence[Sequence[float]]) -> bool:
+    # Consecutive positions more than 180 degrees of longitude apart are
+    # joined across the antimeridian, following RFC 7946 section 3.1.9
+    return any(abs(b[0] - a[0]) > 180 for a, b in pairwise(positions))
+
+
+def _longitude_ranges(west: float, east: float) -> tuple[tuple[float, float], ...]:
+    # Bboxes crossing the antimeridian have their west edge east of their
+    # east edge, following RFC 7946 section 5.2
+    if west <= east:
+        return ((west, east),)
+    return (west, 180.0), (-180.0, east)
+
+
+def longitudes_overlap(
+    first_west: float, first_east: float, second_west: float, second_east: float
+) -> bool:
+    return any(
+        a_west <= b_east and b_west <= a_east
+        for a_west, a_east in _longitude_ranges(first_west, first_east)
+        for b_west, b_east in _longitude_ranges(second_west, second_east)
+    )
+
+
+def center_longitude(west: float, east: float) -> float:
+    if west <= east:
+        return (west + east) / 2
+    center = (west + east + 360) / 2
+    return center - 360 if center > 180 else center
+
+
+def split_line(positions: Sequence[Sequence[float]]) -> list[list[_Position]]:
+    if not _crosses(positions):
+        return [[tuple(p) for p in positions]]
+    lines: list[list[_Position]] = []
+    line: list[_Position] = [tuple(positions[0])]
+    for a, b in pairwise(positions):
+        if abs(b[0] - a[0]) > 180:
+            meridian = 180.0 if a[0] > 0 else -180.0
+            crossing = _crossing(a, _unwrapped(a, b), meridian)
+            _append(line, crossing)
+            lines.append(line)
+            line = [(-meridian, *crossing[1:])]
+        _append(line, tuple(b))
+    lines.append(line)
+    return [line for line in lines if len(line) >= 2]
+
+
+def split_polygon(
+    rings: Sequence[Sequence[Sequence[float]]],
+) -> list[list[_Ring]]:
+    if not any(_crosses(ring) for ring in rings):
+        return [[[tuple(p) for p in ring] for ring in rings]] if rings else []
+
+    exterior = _unwrap(rings[0])
+    if exterior[-1][0] != exterior[0][0]:
+        # The ring goes around a pole, close it along the pole so that it
+        # becomes a plain ring spanning 360 degrees of longitude
+        latitude = 90.0 if exterior[-1][0] > exterior[0][0] else -90.0
+        exterior = [
+            *exterior,
+            (exterior[-1][0], latitude),
+            (exterior[0][0], latitude),
+            exterior[0],
+        ]
+    meridian = 180.0 if max(p[0] for p in exterior) > 180 else -180.0
+
+    holes: list[_Ring] = []
+    for ring in rings[1:]:
+        hole = _unwrap(ring)
+        if hole[-1][0] != hole[0][0]:
+            raise ValueError("holes cannot go around a pole")
+        holes.append(_shifted(hole, meridian))
+
+    # Orient the exterior counterclockwise and the holes clockwise, so that
+    # the interior is always on the left of the rings
+    if planar.ring_area_centroid(exterior)[0] < 0:
+        exterior.reverse()
+    for hole in holes:
+        if planar.ring_area_centroid(hole)[0] > 0:
+            hole.reverse()
+
+    polygons: list[list[_Ring]] = []
+    for west in (True, False):
+        chains: list[_Ring] = []
+        whole: list[_Ring] = []
+        for ring in (exterior, *holes):
+            cut = _cut(ring, meridian)
+            if cut is None:
+                if (ring[0][0] < meridian) == west:
+                    whole.append(ring)
+            else:
+                chains.extend(cut[0] if west else cut[1])
+        shells = _join(chains, west) + [r for r in whole if r is exterior]
+        shells = [
+            shell
+            for shell in shells
+            if len(shell) >= 4 and planar.ring_area_centroid(shell)[0] > 0
+        ]
+        side = [[shell] for shell in shells]
+        for hole in whole:
+            if hole is exterior:
+                continue
+            for polygon in side:
+                if planar.EdgeIndex(polygon[:1]).contains(hole[0][0], hole[0][1]):
+                    polygon.append(hole)
+                    break
+
+        offset = 0.0
+        if west and meridian < 0:
+            offset = 360.0
+        elif not west and meridian > 0:
+            offset = -360.0
+        polygons.extend(
+            [[(p[0] + offset, *p[1:]) for p in ring] for ring in polygon]
+            for polygon in side
+        )
+    return polygons
+
+
+def _append(positions: list[_Position], position: _Position) -> None:
+    if not positions or positions[-1] != position:
+        positions.append(position)
+
+
+def _unwrapped(a: Sequence[float], b: Sequence[float]) -> _Position:
+    # The position of b as seen from a, without crossing the antimeridian
+    x = b[0]
+    if x - a[0] > 180:
+        x -= 360
+    elif a[0] - x > 180:
+        x += 360
+    return (x, *b[1:])
+
+
+def _unwrap(ring: Sequence[Sequence[float]]) -> _Ring:
+    positions: _Ring = [tuple(ring[0])]
+    for position in ring[1:]:
+        positions.append(_unwrapped(positions[-1], position))
+    return positions
+
+
+def _shifted(ring: _Ring, meridian: float) -> _Ring:
+    # Moves the ring by whole turns next to the meridian
+    center = (min(p[0] for p in ring) + max(p[0] for p in ring)) / 2
+    turns = (center - meridian + 180) // 360
+    if not turns:
+        return ring
+    return [(p[0] - 360 * turns, *p[1:]) for p in ring]
+
+
+def _crossing(a: Sequence[float], b: Sequence[float], meridian: float) -> _Position:
+    # Positions already on the meridian are cut at without interpolating
+    if a[0] == meridian:
+        return tuple(a)
+    if b[0] == meridian:
+        return tuple(b)
+    t = (meridian - a[0]) / (b[0] - a[0])
+    return (meridian, *(u + (v - u) * t for u, v in zip(a[1:], b[1:])))
+
+
+def _cut(ring: _Ring, meridian: float) -> tuple[list[_Ring], list[_Ring]] | None:
+    # Cuts a closed ring where it crosses the meridian into chains on the
+    # west and on the east side, or returns None if it does not cross it
+    positions = ring[:-1]
+    count = len(positions)
+    sides = [p[0] < meridian for p in positions]
+    start = next((i for i in range(count) if sides[i - 1] != sides[i]), None)
+    if start is None:
+        return None
+
+    west: list[_Ring] = []
+    east: list[_Ring] = []
+    chain = [_crossing(positions[start - 1], positions[start], meridian)]
+    for k in range(count):
+        i = (start + k) % count
+        j = (i + 1) % count
+        _append(chain, positions[i])
+        if sides[i] != sides[j]:
+            crossing = _crossing(positions[i], positions[j], meridian)
+            _append(chain, crossing)
+            (west if sides[i] else east).append(chain)
+            chain = [crossing]
+    return west, east
+
+
+def _join(chains: list[_Ring], west: bool) -> list[_Ring]:
+    # Chains start and end on the meridian. With the interior on their left,
+    # the boundary of the west side runs north along the meridian from the
+    # end of a chain to the start of the next one, and south on the east side
+    rings: list[_Ring] = []
+    unused = list(chains)
+    while unused:
+        first = unused.pop(0)
+        ring = list(first)
+        while True:
+            end = ring[-1][1]
+            candidates = [first, *unused]
+            if west:
+                following = min(
+                    (c for c in candidates if c[0][1] >= end),
+                    key=lambda c: c[0][1],
+                    default=None,
+                )
+            else:
+                following = max(
+                    (c for c in candidates if c[0][1] <= end),
+                    key=lambda c: c[0][1],
+                    default=None,
+                )
+            if following is None:
+                raise ValueError("rings must not intersect themselves or each other")
+            if following is first:
+                _append(ring, first[0])
+                break
+            unused.remove(following)
+            for position in following:
+                _append(ring, position)
+        rings.append(ring)
+    return rings
@@ -1,15 +1,43 @@
+import threading
 from abc import ABC
-from typing import Any
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Self
 
 import pydantic
 
+from geodantic.hashing import Digest, new_digest, update_count, update_floats
 from geodantic.types import BoundingBox, GeoJSONObjectType
 
+# Parametrized generic models by origin and arguments. Lookups do not take
+# the lock, so that threads only contend while a model is first built.
+_parametrized: dict[tuple[type, Any], type] = {}
+_parametrize_lock = threading.RLock()
+
 
 class _GeoJSONObject(pydantic.BaseModel, ABC, frozen=True):
     type: GeoJSONObjectType
     bbox: BoundingBox | None = None
 
+    def __class_getitem__(cls, params: Any) -> Any:
+        key = (cls, params)
+        try:
+            return _parametrized[key]
+        except KeyError:
+            pass
+        except TypeError:
+            return super().__class_getitem__(params)
+        # Building a model twice would give two distinct classes for the same
+        # parametrization, which then fail isinstance checks between threads
+        with _parametrize_lock:
+            if key in _parametrized:
+                return _parametrized[key]
+            model = super().__class_getitem__(params)
+            # Recursive references are only placeholders while building
+            if isinstance(model, type):
+                _parametrized[key] = model
+            return model
+
     @pydantic.field_validator("bbox")
     @classmethod
     def _bbox_is_not_none(cls, bbox: Any) -> Any:
@@ -17,3 +45,29 @@ class _GeoJSONObject(pydantic.BaseModel, ABC, frozen=True):
         if bbox is None:
             raise ValueError("bbox cannot be None if present")
         return bbox
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            # Cached properties describe the content before the update
+            for cls in type(copy).__mro__:
+                for name, value in vars(cls).items():
+                    if isinstance(value, cached_property):
+                        vars(copy).pop(name, None)
+        return copy
+
+    @cached_property
+    def content_hash(self) -> bytes:
+        """Stable digest of the object content, computed once per instance."""
+        digest = new_digest()
+        self._update_content_hash(digest)
+        return digest.digest()
+
+    def _update_content_hash(self, digest: Digest) -> None:
+        digest.update(self.type.encode())
+        if self.bbox is None:
+            update_count(digest, 0)
+        else:
+            update_floats(digest, self.bbox)
@@ -0,0 +1,128 @@
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import batched
+from types import NoneType, UnionType
+from typing import Annotated, Any, TypeAliasType, Union, get_args, get_origin
+
+import pydantic
+import pydantic_core
+
+from geodantic.caching import type_adapter
+
+# Unions of GeoJSON objects are told apart by their type, as in
+# Feature.geometry, instead of trying every member on each item
+_BY_TYPE = pydantic.Field(discriminator="type")
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionedBatch[T]:
+    """Valid values of a batch and the errors of the invalid items.
+
+    Both are keyed by the index of the item in the input, and error
+    locations are relative to that item.
+    """
+
+    valid: Mapping[int, T]
+    errors: Mapping[int, list[pydantic_core.ErrorDetails]]
+
+
+def validate_many(
+    type_: Any, items: Iterable[Any], *, include_input: bool = False
+) -> PartitionedBatch[Any]:
+    """Validate Python objects as `type_` in a single call.
+
+    The whole batch is validated as one list, which avoids the overhead of
+    a call per item. Every item is validated once, and the errors of the
+    invalid ones are collected without stopping the batch.
+    """
+    item_type: Any = _discriminated(type_)
+    adapter = type_adapter(
+        list[Annotated[item_type, pydantic.WrapValidator(_item_or_error)]]
+    )
+    valid: dict[int, Any] = {}
+    errors: dict[int, list[pydantic_core.ErrorDetails]] = {}
+    for index, value in enumerate(adapter.validate_python(items)):
+        if isinstance(value, _InvalidItem):
+            errors[index] = value.error.errors(
+                include_url=False, include_input=include_input
+            )
+        else:
+            valid[index] = value
+    return PartitionedBatch(valid, errors)
+
+
+def validate_json_batch(
+    type_: Any,
+    payloads: Iterable[str | bytes | bytearray],
+    *,
+    max_workers: int | None = None,
+    chunk_size: int = 64,
+) -> list[Any]:
+    """Validate JSON payloads as `type_` on a pool of threads.
+
+    Payloads are handed to the threads in chunks of `chunk_size`, which all
+    share one validator, and results are returned in the order of the
+    payloads. The first invalid payload raises its `ValidationError`.
+
+    Threads only validate in parallel on free-threaded builds of Python;
+    elsewhere this is about as fast as validating the payloads in a loop.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    adapter = type_adapter(_discriminated(type_))
+
+    def validate(chunk: Sequence[str | bytes | bytearray]) -> list[Any]:
+        return [adapter.validate_json(payload) for payload in chunk]
+
+    executor = ThreadPoolExecutor(max_workers)
+    try:
+        return [
+            value
+            for values in executor.map(validate, batched(payloads, chunk_size))
+            for value in values
+        ]
+    finally:
+        # Chunks which have not started yet are dropped after an error
+        executor.shutdown(cancel_futures=True)
+
+
+class _InvalidItem:
+    # Stands in for an invalid item in a validated batch
+    __slots__ = ("error",)
+
+    def __init__(self, error: pydantic.ValidationError) -> None:
+        self.error = error
+
+
+def _item_or_error(value: Any, handler: pydantic.ValidatorFunctionWrapHandler) -> Any:
+    # Error locations are relative to the item
+    try:
+        return handler(value)
+    except pydantic.ValidationError as e:
+        return _InvalidItem(e)
+
+
+def _discriminated(type_: Any) -> Any:
+    members = _union_members(type_)
+    if len(members) > 1 and all(
+        member is NoneType
+        or (
+            isinstance(member, type)
+            and issubclass(member, pydantic.BaseModel)
+            and "type" in member.model_fields
+        )
+        for member in members
+    ):
+        # The members are listed directly, since older pydantic versions
+        # ignore discriminators on type aliases
+        return Annotated[Union[tuple(members)], _BY_TYPE]
+    return type_
+
+
+def _union_members(type_: Any) -> list[Any]:
+    if isinstance(type_, TypeAliasType):
+        return _union_members(type_.__value__)
+    if get_origin(type_) in (Union, UnionType):
+        return [member for arg in get_args(type_) for member in _union_members(arg)]
+    return [type_]
@@ -0,0 +1,87 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import pydantic
+
+from geodantic.hashing import new_digest
+
+# Type adapters by validated type, built once and shared by all threads
+_adapters: dict[Any, pydantic.TypeAdapter[Any]] = {}
+_adapters_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+class ValidationCache[T]:
+    """LRU cache of validated objects keyed by a digest of their raw JSON.
+
+    Identical payloads return the very same instance, so the validated type
+    must be immutable, such as the frozen geometry models. Invalid payloads
+    are not cached. The cache is safe to share between threads.
+    """
+
+    def __init__(self, type_: Any, *, maxsize: int = 128) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self._adapter: pydantic.TypeAdapter[T] = type_adapter(type_)
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, T] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def validate_json(self, data: str | bytes | bytearray) -> T:
+        digest = new_digest()
+        digest.update(data.encode() if isinstance(data, str) else data)
+        key = digest.digest()
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+            self._misses += 1
+
+        # Validate without holding the lock, so that other payloads are not
+        # blocked meanwhile
+        value = self._adapter.validate_json(data)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return value
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self._maxsize,
+            )
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+def type_adapter(type_: Any) -> pydantic.TypeAdapter[Any]:
+    adapter = _adapters.get(type_)
+    if adapter is None:
+        with _adapters_lock:
+            adapter = _adapters.get(type_)
+            if adapter is None:
+                adapter = _adapters[type_] = pydantic.TypeAdapter(type_)
+    return adapter
@@ -1,11 +1,19 @@
-from collections.abc import Mapping, Sequence
-from typing import Annotated, Any, Literal
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Annotated, Any, Literal, Self, TypeVar, get_args
 
 import pydantic
 
+from geodantic import tiling
 from geodantic.base import _GeoJSONObject
 from geodantic.geometries import Geometry
-from geodantic.types import GeoJSONObjectType
+from geodantic.hashing import Digest, update_count, update_value
+from geodantic.sequences import ConcatenatedSequence, SequenceView, SlicedSequence
+from geodantic.tiling import TileKey
+from geodantic.types import BoundingBox, GeoJSONObjectType
+
+bbox_adapter: pydantic.TypeAdapter[BoundingBox] = pydantic.TypeAdapter(BoundingBox)
 
 
 class Feature[
@@ -25,6 +33,16 @@ class Feature[
             raise ValueError("id cannot be None if present")
         return value
 
+    def _update_content_hash(self, digest: Digest) -> None:
+        super()._update_content_hash(digest)
+        if self.geometry is None:
+            update_count(digest, 0)
+        else:
+            update_count(digest, 1)
+            digest.update(self.geometry.content_hash)
+        update_value(digest, self.properties)
+        update_value(digest, self.id)
+
 
 class FeatureCollection[
     FeatureT: Feature[
@@ -34,3 +52,221 @@ class FeatureCollection[
 ](_GeoJSONObject, frozen=True):
     type: Literal[GeoJSONObjectType.FEATURE_COLLECTION]
     features: Sequence[FeatureT]
+
+    @pydantic.field_serializer("features", mode="wrap")
+    def _serialize_features(
+        self,
+        features: Sequence[FeatureT],
+        handler: pydantic.SerializerFunctionWrapHandler,
+    ) -> Any:
+        # Views shared between derived collections are serialized as lists
+        if isinstance(features, SequenceView):
+            return handler(list(features))
+        return handler(features)
+
+    @classmethod
+    def from_features(
+        cls, features: Iterable[FeatureT], *, bbox: BoundingBox | None = None
+    ) -> Self:
+        """Build a collection from already validated features without revalidation.
+
+        Features of another feature class, such as `Feature` for a collection
+        of `Feature[Point, dict]`, are validated against the feature class of
+        the collection.
+        """
+        features = _check_features(cls, features)
+        if bbox is not None:
+            bbox = bbox_adapter.validate_python(bbox)
+        return _construct(cls, features, bbox)
+
+    def concat(self, *others: "FeatureCollection[FeatureT]") -> Self:
+        """Concatenate collections, sharing their features instead of copying them."""
+        feature_class = _feature_class(type(self))
+        parts = [self.features]
+        for other in others:
+            if issubclass(_feature_class(type(other)), feature_class):
+                parts.append(other.features)
+            else:
+                parts.append(_check_features(type(self), other.features))
+        return _construct(type(self), ConcatenatedSequence(parts))
+
+    def append(self, *features: FeatureT) -> Self:
+        """Add features to a new collection which shares the existing ones.
+
+        Use `FeatureCollectionBuilder` to add many features one at a time.
+        """
+        checked = _check_features(type(self), features)
+        return _construct(type(self), ConcatenatedSequence([self.features, checked]))
+
+    def sliced(
+        self, start: int | None = None, stop: int | None = None, step: int | None = None
+    ) -> Self:
+        """Select a range of features without copying them."""
+        indices = range(len(self.features))[start:stop:step]
+        return _construct(type(self), SlicedSequence(self.features, indices))
+
+    def deduplicate(self) -> Self:
+        """Keep the first of the features with the same content hash."""
+        seen: set[bytes] = set()
+        features: list[FeatureT] = []
+        for feature in self.features:
+            content_hash = feature.content_hash
+            if content_hash not in seen:
+                seen.add(content_hash)
+                features.append(feature)
+        return _construct(type(self), features, self.bbox)
+
+    def geohashes(self, precision: int = 6) -> list[str | None]:
+        """Geohash of each feature geometry, None if it is missing or empty.
+
+        Points are keyed by their position and other geometries by the center
+        of their bbox.
+        """
+        return tiling.geohashes(tiling.geometry_centers(self._geometries()), precision)
+
+    def tile_keys(self, zoom: int) -> list[TileKey | None]:
+        """Web Mercator tile of each feature geometry, keyed like `geohashes`."""
+        return tiling.tile_keys(tiling.geometry_centers(self._geometries()), zoom)
+
+    def partition_by[KeyT](self, keys: Sequence[KeyT]) -> dict[KeyT, Self]:
+        """Group the features by key into collections which share them.
+
+        `keys` holds the key of each feature, such as the result of
+        `geohashes` or `tile_keys`. Groups are ordered by first occurrence.
+        """
+        if len(keys) != len(self.features):
+            raise ValueError("there must be exactly one key per feature")
+        groups: dict[KeyT, list[FeatureT]] = {}
+        for key, feature in zip(keys, self.features):
+            groups.setdefault(key, []).append(feature)
+        return {key: _construct(type(self), group) for key, group in groups.items()}
+
+    def _geometries(self) -> Iterator[Geometry | None]:
+        return (feature.geometry for feature in self.features)
+
+    def _update_content_hash(self, digest: Digest) -> None:
+        super()._update_content_hash(digest)
+        update_count(digest, len(self.features))
+        for feature in self.features:
+            digest.update(feature.content_hash)
+
+    def lengths(self, *, geodesic: bool = True) -> array[float]:
+        """Length of each feature geometry, NaN if the geometry is not linear."""
+        return self._measure("geodesic_length" if geodesic else "length")
+
+    def areas(self, *, geodesic: bool = True) -> array[float]:
+        """Area of each feature geometry, NaN if the geometry is not polygonal."""
+        return self._measure("geodesic_area" if geodesic else "area")
+
+    def centroids(self) -> array[float]:
+        """Interleaved planar centroids of polygonal feature geometries."""
+        nan = (math.nan, math.nan)
+        return array(
+            "d",
+            (
+                value
+                for feature in self.features
+                for value in getattr(feature.geometry, "centroid", nan)
+            ),
+        )
+
+    def _measure(self, attribute: str) -> array[float]:
+        return array(
+            "d",
+            (
+                getattr(feature.geometry, attribute, math.nan)
+                for feature in self.features
+            ),
+        )
+
+
+class FeatureCollectionBuilder[
+    FeatureT: Feature[
+        Geometry | None,
+        Mapping[str, Any] | pydantic.BaseModel | None,
+    ]
+]:
+    """Accumulate validated features into collections without revalidating them.
+
+    Collections built earlier share their features with the later ones.
+    """
+
+    def __init__(self, model: type[FeatureCollection[FeatureT]]) -> None:
+        self._model = model
+        self._parts: list[Sequence[FeatureT]] = []
+        self._pending: list[FeatureT] = []
+
+    def __len__(self) -> int:
+        return sum(len(part) for part in self._parts) + len(self._pending)
+
+    def append(self, feature: FeatureT) -> None:
+        self._pending.extend(_check_features(self._model, (feature,)))
+
+    def extend(self, features: Iterable[FeatureT]) -> None:
+        checked = _check_features(self._model, features)
+        if isinstance(checked, SequenceView):
+            self._flush()
+            self._parts.append(checked)
+        else:
+            self._pending.extend(checked)
+
+    def build(self, *, bbox: BoundingBox | None = None) -> FeatureCollection[FeatureT]:
+        self._flush()
+        features: Sequence[FeatureT] = (
+            self._parts[0]
+            if len(self._parts) == 1
+            else ConcatenatedSequence(self._parts)
+        )
+        if bbox is not None:
+            bbox = bbox_adapter.validate_python(bbox)
+        return _construct(self._model, features, bbox)
+
+    def _flush(self) -> None:
+        # Built collections own the pending features, so they are never
+        # modified afterwards and new features go into a fresh list
+        if self._pending:
+            self._parts.append(self._pending)
+            self._pending = []
+
+
+def _construct[CollectionT: "FeatureCollection[Any]"](
+    model: type[CollectionT], features: Sequence[Any], bbox: BoundingBox | None = None
+) -> CollectionT:
+    # Leaves the bbox unset when there is none, as validation would
+    if bbox is None:
+        return model.model_construct(
+            type=GeoJSONObjectType.FEATURE_COLLECTION, features=features
+        )
+    return model.model_construct(
+        type=GeoJSONObjectType.FEATURE_COLLECTION, features=features, bbox=bbox
+    )
+
+
+def _feature_class(
+    model: "type[FeatureCollection[Any]]",
+) -> "type[Feature[Any, Any]]":
+    # Unparametrized collections accept any feature
+    (feature_class,) = get_args(model.model_fields["features"].annotation)
+    return Feature if isinstance(feature_class, TypeVar) else feature_class
+
+
+def _check_features[FeatureT: "Feature[Any, Any]"](
+    model: "type[FeatureCollection[FeatureT]]", features: Iterable[Any]
+) -> Sequence[FeatureT]:
+    # Views hold the features of other collections and are kept to share them
+    # when all of them are instances of the feature class
+    feature_class = _feature_class(model)
+    if isinstance(features, SequenceView):
+        view: Sequence[Any] = features
+        if feature_class is Feature or all(isinstance(f, feature_class) for f in view):
+            return view
+    checked: list[Any] = []
+    for feature in features:
+        if not isinstance(feature, Feature):
+            raise TypeError(f"expected a Feature, got {type(feature).__name__}")
+        if not isinstance(feature, feature_class):
+            feature = feature_class.model_validate(
+                feature.model_dump(exclude_unset=True)
+            )
+        checked.append(feature)
+    return checked
@@ -0,0 +1,214 @@
+import math
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any
+
+from geodantic.features import Feature, FeatureCollection
+from geodantic.geometries import (
+    GEOMETRY_CLASSES,
+    NESTING,
+    Geometry,
+    GeometryCollection,
+)
+from geodantic.packing import check_bounds
+from geodantic.types import GeoJSONObjectType
+
+_EXTENSION_NAMES = {
+    GeoJSONObjectType.POINT: "geoarrow.point",
+    GeoJSONObjectType.MULTI_POINT: "geoarrow.multipoint",
+    GeoJSONObjectType.LINE_STRING: "geoarrow.linestring",
+    GeoJSONObjectType.MULTI_LINE_STRING: "geoarrow.multilinestring",
+    GeoJSONObjectType.POLYGON: "geoarrow.polygon",
+    GeoJSONObjectType.MULTI_POLYGON: "geoarrow.multipolygon",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class GeoArrowArray:
+    """Geometries in the native GeoArrow memory layout.
+
+    `coords` holds interleaved float64 coordinates, `offsets` holds the int32
+    offset buffers from the outermost to the innermost nesting level, and
+    `validity` is an optional Arrow bitmap marking non-null geometries.
+    """
+
+    geometry_type: GeoJSONObjectType
+    dimensions: int
+    coords: memoryview
+    offsets: tuple[memoryview, ...] = ()
+    validity: memoryview | None = None
+
+    def __post_init__(self) -> None:
+        if self.geometry_type not in NESTING:
+            raise ValueError(f"unsupported geometry type {self.geometry_type}")
+        if self.dimensions not in (2, 3):
+            raise ValueError("dimensions must be 2 or 3")
+        # There is one offset buffer per nesting level of the coordinates
+        if len(self.offsets) != NESTING[self.geometry_type]:
+            raise ValueError(
+                f"{self.geometry_type} requires "
+                f"{NESTING[self.geometry_type]} offset buffers"
+            )
+        if self.coords.format != "d" or self.coords.ndim != 1:
+            raise ValueError("coords must be a one-dimensional float64 buffer")
+        if any(o.format not in "bBhHiIlLqQ" or o.ndim != 1 for o in self.offsets):
+            raise ValueError("offsets must be one-dimensional integer buffers")
+
+    @property
+    def extension_name(self) -> str:
+        return _EXTENSION_NAMES[self.geometry_type]
+
+    def __len__(self) -> int:
+        if self.offsets:
+            return len(self.offsets[0]) - 1
+        return len(self.coords) // self.dimensions
+
+    def is_valid(self, index: int) -> bool:
+        if self.validity is None:
+            return True
+        return bool(self.validity[index // 8] >> (index % 8) & 1)
+
+
+def to_geoarrow(
+    collection: "FeatureCollection[Any] | GeometryCollection[Any]",
+) -> GeoArrowArray:
+    """Pack the geometries of a collection into GeoArrow buffers."""
+    geometries: Sequence[Geometry | None]
+    if isinstance(collection, GeometryCollection):
+        geometries = collection.geometries
+    else:
+        geometries = [feature.geometry for feature in collection.features]
+
+    types = {geometry.type for geometry in geometries if geometry is not None}
+    if len(types) != 1:
+        raise ValueError("collection must contain geometries of exactly one type")
+    geometry_type = types.pop()
+    if geometry_type not in NESTING:
+        raise ValueError(f"unsupported geometry type {geometry_type}")
+    depth = NESTING[geometry_type]
+    dimensions = coordinate_dimensions(geometries, depth)
+
+    coords = array("d")
+    offsets = [array("i", [0]) for _ in range(depth)]
+    validity = bytearray((len(geometries) + 7) // 8)
+    has_nulls = False
+    positions = 0
+
+    def append(items: Sequence[Any], level: int) -> None:
+        nonlocal positions
+        if level == depth - 1:
+            coords.extend(chain.from_iterable(items))
+            positions += len(items)
+            offsets[level].append(positions)
+        else:
+            for item in items:
+                append(item, level + 1)
+            offsets[level].append(len(offsets[level + 1]) - 1)
+
+    for i, geometry in enumerate(geometries):
+        if geometry is None:
+            has_nulls = True
+            if depth:
+                offsets[0].append(offsets[0][-1])
+            else:
+                coords.extend([math.nan] * dimensions)
+                positions += 1
+            continue
+
+        validity[i // 8] |= 1 << (i % 8)
+        coordinates: Any = geometry.coordinates  # type: ignore[union-attr]
+        if depth:
+            append(coordinates, 0)
+        else:
+            coords.extend(coordinates)
+            positions += 1
+
+    if len(coords) != positions * dimensions:
+        raise ValueError("positions must all have the same number of dimensions")
+
+    return GeoArrowArray(
+        geometry_type=geometry_type,
+        dimensions=dimensions,
+        coords=memoryview(coords),
+        offsets=tuple(memoryview(o) for o in offsets),
+        validity=memoryview(validity) if has_nulls else None,
+    )
+
+
+def from_geoarrow(
+    data: GeoArrowArray,
+) -> FeatureCollection[Feature[Geometry | None, None]]:
+    """Build a collection of features without properties from GeoArrow buffers.
+
+    Coordinate bounds and ring closure are checked over the whole buffers at
+    once instead of validating every position individually.
+    """
+    cls = GEOMETRY_CLASSES[data.geometry_type]
+    depth = NESTING[data.geometry_type]
+    dimensions = data.dimensions
+    coords = data.coords
+    offsets = data.offsets
+    is_polygonal = data.geometry_type in (
+        GeoJSONObjectType.POLYGON,
+        GeoJSONObjectType.MULTI_POLYGON,
+    )
+    is_linear = data.geometry_type in (
+        GeoJSONObjectType.LINE_STRING,
+        GeoJSONObjectType.MULTI_LINE_STRING,
+    )
+    if depth:
+        check_bounds(coords, dimensions)
+
+    def read_positions(start: int, end: int) -> list[tuple[float, ...]]:
+        values = iter(coords[start * dimensions : end * dimensions].tolist())
+        return list(zip(*[values] * dimensions))
+
+    def read(level: int, index: int) -> list[Any]:
+        start, end = offsets[level][index], offsets[level][index + 1]
+        if level < depth - 1:
+            return [read(level + 1, i) for i in range(start, end)]
+        positions = read_positions(start, end)
+        if is_linear and len(positions) < 2:
+            raise ValueError("line strings must have at least 2 positions")
+        if is_polygonal and (len(positions) < 4 or positions[0] != positions[-1]):
+            raise ValueError("linear rings must be closed with at least 4 positions")
+        return positions
+
+    features: list[Feature[Geometry | None, None]] = []
+    for i in range(len(data)):
+        geometry: Geometry | None = None
+        if data.is_valid(i):
+            if depth:
+                coordinates: Any = read(0, i)
+            else:
+                coordinates = read_positions(i, i + 1)[0]
+                if not (-180 <= coordinates[0] <= 180 and -90 <= coordinates[1] <= 90):
+                    raise ValueError("coordinates must be within [-180, 180, -90, 90]")
+            geometry = cls.model_construct(
+                type=data.geometry_type, coordinates=coordinates
+            )
+        features.append(
+            Feature[Geometry | None, None].model_construct(
+                type=GeoJSONObjectType.FEATURE, geometry=geometry, properties=None
+            )
+        )
+
+    return FeatureCollection[Feature[Geometry | None, None]].model_construct(
+        type=GeoJSONObjectType.FEATURE_COLLECTION, features=features
+    )
+
+
+def coordinate_dimensions(geometries: Sequence[Geometry | None], depth: int) -> int:
+    for geometry in geometries:
+        if geometry is None:
+            continue
+        value: Any = geometry.coordinates  # type: ignore[union-attr]
+        for _ in range(depth):
+            if not value:
+                break
+            value = value[0]
+        else:
+            return len(value)
+    return 2
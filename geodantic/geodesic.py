@@ -0,0 +1,125 @@
+import math
+from collections.abc import Iterable, Sequence
+from itertools import pairwise
+
+# WGS84 ellipsoid
+_A = 6378137.0
+_F = 1 / 298.257223563
+_B = _A * (1 - _F)
+_E2 = _F * (2 - _F)
+_E = math.sqrt(_E2)
+
+_MEAN_RADIUS = (2 * _A + _B) / 3
+_AUTHALIC_RADIUS = math.sqrt(_A**2 / 2 * (1 + (1 - _E2) / _E * math.atanh(_E)))
+
+_MAX_ITERATIONS = 200
+_TOLERANCE = 1e-12
+
+
+def _distance(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    # Vincenty's inverse formula on the WGS84 ellipsoid
+    delta = math.radians(lon2 - lon1)
+    u1 = math.atan((1 - _F) * math.tan(math.radians(lat1)))
+    u2 = math.atan((1 - _F) * math.tan(math.radians(lat2)))
+    sin_u1, cos_u1 = math.sin(u1), math.cos(u1)
+    sin_u2, cos_u2 = math.sin(u2), math.cos(u2)
+
+    lambda_ = delta
+    for _ in range(_MAX_ITERATIONS):
+        sin_lambda, cos_lambda = math.sin(lambda_), math.cos(lambda_)
+        sin_sigma = math.hypot(
+            cos_u2 * sin_lambda, cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lambda
+        )
+        if not sin_sigma:
+            return 0.0
+        cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lambda
+        sigma = math.atan2(sin_sigma, cos_sigma)
+        sin_alpha = cos_u1 * cos_u2 * sin_lambda / sin_sigma
+        cos2_alpha = 1 - sin_alpha**2
+        cos_2sigma_m = (
+            cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha if cos2_alpha else 0.0
+        )
+        c = _F / 16 * cos2_alpha * (4 + _F * (4 - 3 * cos2_alpha))
+        previous = lambda_
+        lambda_ = delta + (1 - c) * _F * sin_alpha * (
+            sigma
+            + c * sin_sigma * (cos_2sigma_m + c * cos_sigma * (2 * cos_2sigma_m**2 - 1))
+        )
+        if abs(lambda_ - previous) < _TOLERANCE:
+            break
+    else:
+        # Nearly antipodal points may not converge, use the great circle
+        return _great_circle_distance(lon1, lat1, lon2, lat2)
+
+    u2_ = cos2_alpha * (_A**2 - _B**2) / _B**2
+    a = 1 + u2_ / 16384 * (4096 + u2_ * (-768 + u2_ * (320 - 175 * u2_)))
+    b = u2_ / 1024 * (256 + u2_ * (-128 + u2_ * (74 - 47 * u2_)))
+    delta_sigma = (
+        b
+        * sin_sigma
+        * (
+            cos_2sigma_m
+            + b
+            / 4
+            * (
+                cos_sigma * (2 * cos_2sigma_m**2 - 1)
+                - b
+                / 6
+                * cos_2sigma_m
+                * (4 * sin_sigma**2 - 3)
+                * (4 * cos_2sigma_m**2 - 3)
+            )
+        )
+    )
+    return _B * a * (sigma - delta_sigma)
+
+
+def _great_circle_distance(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    h = (
+        math.sin((phi2 - phi1) / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return 2 * _MEAN_RADIUS * math.asin(min(1.0, math.sqrt(h)))
+
+
+def length(positions: Sequence[Sequence[float]]) -> float:
+    return math.fsum(
+        _distance(x1, y1, x2, y2) for (x1, y1, *_), (x2, y2, *_) in pairwise(positions)
+    )
+
+
+def _q(sin_phi: float) -> float:
+    e_sin_phi = _E * sin_phi
+    return (1 - _E2) * (
+        sin_phi / (1 - e_sin_phi**2)
+        - math.log((1 - e_sin_phi) / (1 + e_sin_phi)) / (2 * _E)
+    )
+
+
+_Q_POLE = _q(1.0)
+
+
+def _authalic_latitude(lat: float) -> float:
+    return math.asin(max(-1.0, min(1.0, _q(math.sin(math.radians(lat))) / _Q_POLE)))
+
+
+def _ring_area(ring: Sequence[Sequence[float]]) -> float:
+    # Spherical excess of the ring on the authalic sphere, which has the same
+    # surface area as the WGS84 ellipsoid, using authalic latitudes
+    excess = 0.0
+    for (lon1, lat1, *_), (lon2, lat2, *_) in pairwise(ring):
+        delta = math.remainder(math.radians(lon2 - lon1), math.tau)
+        t1 = math.tan(_authalic_latitude(lat1) / 2)
+        t2 = math.tan(_authalic_latitude(lat2) / 2)
+        excess += 2 * math.atan2(math.tan(delta / 2) * (t1 + t2), 1 + t1 * t2)
+    return abs(excess) * _AUTHALIC_RADIUS**2
+
+
+def polygons_area(polygons: Iterable[Sequence[Sequence[Sequence[float]]]]) -> float:
+    area = 0.0
+    for polygon in polygons:
+        for i, ring in enumerate(polygon):
+            # The first ring is the exterior, the rest are holes
+            area += _ring_area(ring) if i == 0 else -_ring_area(ring)
+    return area
@@ -1,9 +1,22 @@
-from collections.abc import Sequence
-from typing import Annotated, Literal
+import math
+from abc import abstractmethod
+from array import array
+from collections.abc import Iterable, Iterator, MutableSequence, Sequence
+from functools import cached_property
+from itertools import islice
+from typing import Annotated, Any, Literal, Self
 
 import pydantic
 
+from geodantic import antimeridian, geodesic, planar, projections
 from geodantic.base import _GeoJSONObject
+from geodantic.hashing import (
+    Digest,
+    update_coordinates,
+    update_count,
+    update_positions,
+)
+from geodantic.projections import CoordinateTransform
 from geodantic.types import (
     GeoJSONObjectType,
     LineStringCoordinates,
@@ -12,37 +25,362 @@ from geodantic.types import (
 )
 
 
-class Point(_GeoJSONObject, frozen=True):
+class _Geometry(_GeoJSONObject, frozen=True):
+    # Spatial predicates are planar, in coordinate units. Lines and polygon
+    # boundaries are compared at their vertices and edge midpoints, which is
+    # exact unless edges overlap only partially between those samples.
+    @cached_property
+    def _shape(self) -> planar.Shape:
+        points: list[planar.XY] = []
+        lines: list[list[planar.XY]] = []
+        polygons: list[list[list[planar.XY]]] = []
+        self._collect_parts(points, lines, polygons)
+        return planar.Shape(points, lines, polygons)
+
+    @abstractmethod
+    def _collect_parts(
+        self,
+        points: list[planar.XY],
+        lines: list[list[planar.XY]],
+        polygons: list[list[list[planar.XY]]],
+    ) -> None: ...
+
+    def intersects(self, other: "Geometry") -> bool:
+        """Test whether the geometries share any point."""
+        return planar.intersects(self._shape, other._shape)
+
+    def contains(self, other: "Geometry") -> bool:
+        """Test whether the other geometry lies in this one, not only on its edge."""
+        return planar.contains(self._shape, other._shape)
+
+    def within(self, other: "Geometry") -> bool:
+        """Test whether this geometry lies in the other one."""
+        return planar.contains(other._shape, self._shape)
+
+    def touches(self, other: "Geometry") -> bool:
+        """Test whether the geometries share boundary points but no interior point."""
+        return planar.touches(self._shape, other._shape)
+
+    def equals_exact(self, other: "Geometry", tolerance: float = 0.0) -> bool:
+        """Test whether the geometries have the same structure and positions.
+
+        Positions match if their distance is at most `tolerance`.
+        """
+        if self.type != other.type:
+            return False
+        positions: list[Position] = []
+        lengths: list[int] = []
+        other_positions: list[Position] = []
+        other_lengths: list[int] = []
+        depth = NESTING[self.type]
+        flatten_coordinates(getattr(self, "coordinates"), depth, positions, lengths)
+        flatten_coordinates(
+            getattr(other, "coordinates"), depth, other_positions, other_lengths
+        )
+        if lengths != other_lengths:
+            return False
+        if not tolerance:
+            return positions == other_positions
+        return all(
+            len(p) == len(q) and math.dist(p, q) <= tolerance
+            for p, q in zip(positions, other_positions)
+        )
+
+    def transform(self, func: CoordinateTransform) -> Self:
+        """Transform the coordinates of all positions with a single call.
+
+        `func` gets arrays of the x and y coordinates and returns the new
+        ones, like `pyproj.Transformer.transform`. Altitudes are kept. The
+        result is built without validation, and a bbox is recomputed.
+
+        Coordinates outside of the WGS84 ranges, such as projected meters,
+        are kept as they are. Such results are not valid GeoJSON, so their
+        dumps cannot be validated into models again.
+        """
+        positions: list[Position] = []
+        lengths: list[int] = []
+        self._flatten_into(positions, lengths)
+        xs, ys = func(
+            array("d", [p[0] for p in positions]),
+            array("d", [p[1] for p in positions]),
+        )
+        if len(xs) != len(positions) or len(ys) != len(positions):
+            raise ValueError("transform must return one x and y per position")
+        transformed: list[Any] = [(x, y, *p[2:]) for x, y, p in zip(xs, ys, positions)]
+        return self._rebuild(iter(transformed), iter(lengths))
+
+    def to_web_mercator(self) -> Self:
+        """Project WGS84 coordinates to Web Mercator meters, as in EPSG:3857.
+
+        Latitudes are clamped to the extent of Web Mercator tiles. The result
+        holds meters without validation and cannot be validated again, see
+        `transform`.
+        """
+        return self.transform(projections.web_mercator)
+
+    def affine(self, matrix: tuple[float, float, float, float, float, float]) -> Self:
+        """Apply the affine transform `(a, b, d, e, x_offset, y_offset)`.
+
+        Positions are mapped to `a * x + b * y + x_offset` and
+        `d * x + e * y + y_offset`. The result is not validated, see
+        `transform`.
+        """
+        return self.transform(projections.affine(matrix))
+
+    def _flatten_into(self, positions: list[Position], lengths: list[int]) -> None:
+        coordinates = getattr(self, "coordinates")
+        flatten_coordinates(coordinates, NESTING[self.type], positions, lengths)
+
+    def _rebuild(self, positions: Iterator[Position], lengths: Iterator[int]) -> Self:
+        depth = NESTING[self.type]
+        return self._construct(
+            coordinates=unflatten_coordinates(positions, depth, lengths)
+        )
+
+    def _construct(self, **fields: Any) -> Self:
+        geometry = self.model_construct(type=self.type, **fields)
+        if self.bbox is None:
+            return geometry
+        positions: list[Position] = []
+        geometry._flatten_into(positions, [])
+        if not positions:
+            return geometry
+        return self.model_construct(
+            type=self.type, bbox=_extent(positions, len(self.bbox)), **fields
+        )
+
+
+class Point(_Geometry, frozen=True):
     type: Literal[GeoJSONObjectType.POINT]
     coordinates: Position
 
+    def _update_content_hash(self, digest: Digest) -> None:
+        super()._update_content_hash(digest)
+        update_positions(digest, [self.coordinates])
+
+    def _collect_parts(
+        self,
+        points: list[planar.XY],
+        lines: list[list[planar.XY]],
+        polygons: list[list[list[planar.XY]]],
+    ) -> None:
+        points.append((self.coordinates[0], self.coordinates[1]))
+
 
-class MultiPoint(_GeoJSONObject, frozen=True):
+class MultiPoint(_Geometry, frozen=True):
     type: Literal[GeoJSONObjectType.MULTI_POINT]
     coordinates: Sequence[Position]
 
+    def _update_content_hash(self, digest: Digest) -> None:
+        super()._update_content_hash(digest)
+        update_positions(digest, self.coordinates)
+
+    def _collect_parts(
+        self,
+        points: list[planar.XY],
+        lines: list[list[planar.XY]],
+        polygons: list[list[list[planar.XY]]],
+    ) -> None:
+        points.extend(_positions_2d(self.coordinates))
+
 
-class LineString(_GeoJSONObject, frozen=True):
+class LineString(_Geometry, frozen=True):
     type: Literal[GeoJSONObjectType.LINE_STRING]
     coordinates: LineStringCoordinates
 
+    def _update_content_hash(self, digest: Digest) -> None:
+        super()._update_content_hash(digest)
+        update_positions(digest, self.coordinates)
+
+    def _collect_parts(
+        self,
+        points: list[planar.XY],
+        lines: list[list[planar.XY]],
+        polygons: list[list[list[planar.XY]]],
+    ) -> None:
+        lines.append(_positions_2d(self.coordinates))
+
+    @cached_property
+    def length(self) -> float:
+        """Planar length in coordinate units."""
+        return planar.length(self.coordinates)
+
+    @cached_property
+    def geodesic_length(self) -> float:
+        """Length on the WGS84 ellipsoid in meters."""
+        return geodesic.length(self.coordinates)
+
+    def split_antimeridian(self) -> "MultiLineString":
+        """Split the line where it crosses the antimeridian.
 
-class MultiLineString(_GeoJSONObject, frozen=True):
+        Consecutive positions more than 180 degrees of longitude apart are
+        taken to cross it, and the line is cut at the crossing latitude.
+        """
+        return MultiLineString.model_construct(
+            type=GeoJSONObjectType.MULTI_LINE_STRING,
+            coordinates=antimeridian.split_line(self.coordinates),
+            **_bbox_field(self),
+        )
+
+
+class MultiLineString(_Geometry, frozen=True):
     type: Literal[GeoJSONObjectType.MULTI_LINE_STRING]
     coordinates: Sequence[LineStringCoordinates]
 
+    def _update_content_hash(self, digest: Digest) -> None:
+        super()._update_content_hash(digest)
+        update_coordinates(digest, self.coordinates, 1)
+
+    def _collect_parts(
+        self,
+        points: list[planar.XY],
+        lines: list[list[planar.XY]],
+        polygons: list[list[list[planar.XY]]],
+    ) -> None:
+        lines.extend(_positions_2d(line) for line in self.coordinates)
+
+    @cached_property
+    def length(self) -> float:
+        """Planar length in coordinate units."""
+        return math.fsum(planar.length(line) for line in self.coordinates)
+
+    @cached_property
+    def geodesic_length(self) -> float:
+        """Length on the WGS84 ellipsoid in meters."""
+        return math.fsum(geodesic.length(line) for line in self.coordinates)
 
-class Polygon(_GeoJSONObject, frozen=True):
+    def split_antimeridian(self) -> "MultiLineString":
+        """Split the lines where they cross the antimeridian."""
+        return MultiLineString.model_construct(
+            type=GeoJSONObjectType.MULTI_LINE_STRING,
+            coordinates=[
+                part
+                for line in self.coordinates
+                for part in antimeridian.split_line(line)
+            ],
+            **_bbox_field(self),
+        )
+
+
+class Polygon(_Geometry, frozen=True):
     type: Literal[GeoJSONObjectType.POLYGON]
     coordinates: PolygonCoordinates
 
+    def _update_content_hash(self, digest: Digest) -> None:
+        super()._update_content_hash(digest)
+        update_coordinates(digest, self.coordinates, 1)
+
+    def _collect_parts(
+        self,
+        points: list[planar.XY],
+        lines: list[list[planar.XY]],
+        polygons: list[list[list[planar.XY]]],
+    ) -> None:
+        polygons.append([_positions_2d(ring) for ring in self.coordinates])
+
+    @cached_property
+    def _edge_indexes(self) -> tuple[planar.EdgeIndex, ...]:
+        return (planar.EdgeIndex(self.coordinates),) if self.coordinates else ()
 
-class MultiPolygon(_GeoJSONObject, frozen=True):
+    @cached_property
+    def _area_centroid(self) -> tuple[float, float, float]:
+        return planar.polygons_area_centroid([self.coordinates])
+
+    @cached_property
+    def area(self) -> float:
+        """Planar area in squared coordinate units, excluding holes."""
+        return self._area_centroid[0]
+
+    @cached_property
+    def geodesic_area(self) -> float:
+        """Area on the WGS84 ellipsoid in square meters, excluding holes."""
+        return geodesic.polygons_area([self.coordinates])
+
+    @cached_property
+    def centroid(self) -> tuple[float, float]:
+        """Planar centroid, or NaNs if the polygon has no rings."""
+        return self._area_centroid[1:]
+
+    def contains_points(self, points: Iterable[Sequence[float]]) -> list[bool]:
+        """Test which positions lie inside the polygon, outside of its holes."""
+        return planar.contains_points(self._edge_indexes, points)
+
+    def split_antimeridian(self) -> "MultiPolygon":
+        """Split the polygon where it crosses the antimeridian.
+
+        Edges more than 180 degrees of longitude long are taken to cross it.
+        Polygons going around a pole are closed along that pole. The rings
+        of split polygons are oriented counterclockwise, and their holes
+        clockwise.
+        """
+        return MultiPolygon.model_construct(
+            type=GeoJSONObjectType.MULTI_POLYGON,
+            coordinates=antimeridian.split_polygon(self.coordinates),
+            **_bbox_field(self),
+        )
+
+
+class MultiPolygon(_Geometry, frozen=True):
     type: Literal[GeoJSONObjectType.MULTI_POLYGON]
     coordinates: Sequence[PolygonCoordinates]
 
+    def _update_content_hash(self, digest: Digest) -> None:
+        super()._update_content_hash(digest)
+        update_coordinates(digest, self.coordinates, 2)
+
+    def _collect_parts(
+        self,
+        points: list[planar.XY],
+        lines: list[list[planar.XY]],
+        polygons: list[list[list[planar.XY]]],
+    ) -> None:
+        polygons.extend(
+            [_positions_2d(ring) for ring in polygon] for polygon in self.coordinates
+        )
 
-class GeometryCollection[GeometryT: "Geometry"](_GeoJSONObject, frozen=True):
+    @cached_property
+    def _edge_indexes(self) -> tuple[planar.EdgeIndex, ...]:
+        return tuple(
+            planar.EdgeIndex(polygon) for polygon in self.coordinates if polygon
+        )
+
+    @cached_property
+    def _area_centroid(self) -> tuple[float, float, float]:
+        return planar.polygons_area_centroid(self.coordinates)
+
+    @cached_property
+    def area(self) -> float:
+        """Planar area in squared coordinate units, excluding holes."""
+        return self._area_centroid[0]
+
+    @cached_property
+    def geodesic_area(self) -> float:
+        """Area on the WGS84 ellipsoid in square meters, excluding holes."""
+        return geodesic.polygons_area(self.coordinates)
+
+    @cached_property
+    def centroid(self) -> tuple[float, float]:
+        """Planar centroid, or NaNs if there are no polygons."""
+        return self._area_centroid[1:]
+
+    def contains_points(self, points: Iterable[Sequence[float]]) -> list[bool]:
+        """Test which positions lie inside any of the polygons."""
+        return planar.contains_points(self._edge_indexes, points)
+
+    def split_antimeridian(self) -> "MultiPolygon":
+        """Split the polygons where they cross the antimeridian."""
+        return MultiPolygon.model_construct(
+            type=GeoJSONObjectType.MULTI_POLYGON,
+            coordinates=[
+                part
+                for polygon in self.coordinates
+                for part in antimeridian.split_polygon(polygon)
+            ],
+            **_bbox_field(self),
+        )
+
+
+class GeometryCollection[GeometryT: "Geometry"](_Geometry, frozen=True):
     type: Literal[GeoJSONObjectType.GEOMETRY_COLLECTION]
     geometries: Sequence[
         Annotated[
@@ -51,6 +389,43 @@ class GeometryCollection[GeometryT: "Geometry"](_GeoJSONObject, frozen=True):
         ]
     ]
 
+    def _update_content_hash(self, digest: Digest) -> None:
+        super()._update_content_hash(digest)
+        update_count(digest, len(self.geometries))
+        for geometry in self.geometries:
+            digest.update(geometry.content_hash)
+
+    def _collect_parts(
+        self,
+        points: list[planar.XY],
+        lines: list[list[planar.XY]],
+        polygons: list[list[list[planar.XY]]],
+    ) -> None:
+        for geometry in self.geometries:
+            geometry._collect_parts(points, lines, polygons)
+
+    def _flatten_into(self, positions: list[Position], lengths: list[int]) -> None:
+        for geometry in self.geometries:
+            geometry._flatten_into(positions, lengths)
+
+    def _rebuild(self, positions: Iterator[Position], lengths: Iterator[int]) -> Self:
+        return self._construct(
+            geometries=[
+                geometry._rebuild(positions, lengths) for geometry in self.geometries
+            ]
+        )
+
+    def equals_exact(self, other: "Geometry", tolerance: float = 0.0) -> bool:
+        """Test whether the collections hold exactly equal geometries in order."""
+        return (
+            isinstance(other, GeometryCollection)
+            and len(self.geometries) == len(other.geometries)
+            and all(
+                a.equals_exact(b, tolerance)
+                for a, b in zip(self.geometries, other.geometries)
+            )
+        )
+
 
 type Geometry = (
     Point
@@ -61,3 +436,77 @@ type Geometry = (
     | MultiPolygon
     | GeometryCollection
 )
+
+# Classes of the geometries which have coordinates, by type
+GEOMETRY_CLASSES: dict[
+    GeoJSONObjectType,
+    type[Point | MultiPoint | LineString | MultiLineString | Polygon | MultiPolygon],
+] = {
+    GeoJSONObjectType.POINT: Point,
+    GeoJSONObjectType.MULTI_POINT: MultiPoint,
+    GeoJSONObjectType.LINE_STRING: LineString,
+    GeoJSONObjectType.MULTI_LINE_STRING: MultiLineString,
+    GeoJSONObjectType.POLYGON: Polygon,
+    GeoJSONObjectType.MULTI_POLYGON: MultiPolygon,
+}
+
+# Nesting level of the coordinates of these geometries
+NESTING = {
+    GeoJSONObjectType.POINT: 0,
+    GeoJSONObjectType.MULTI_POINT: 1,
+    GeoJSONObjectType.LINE_STRING: 1,
+    GeoJSONObjectType.MULTI_LINE_STRING: 2,
+    GeoJSONObjectType.POLYGON: 2,
+    GeoJSONObjectType.MULTI_POLYGON: 3,
+}
+
+
+def _bbox_field(geometry: _Geometry) -> dict[str, Any]:
+    # Splitting does not change the extent, so a set bbox is kept
+    return {} if geometry.bbox is None else {"bbox": geometry.bbox}
+
+
+def _positions_2d(positions: Iterable[Sequence[float]]) -> list[planar.XY]:
+    return [(p[0], p[1]) for p in positions]
+
+
+def _extent(positions: Sequence[Position], size: int) -> Any:
+    axes = size // 2
+    if any(len(p) < axes for p in positions):
+        axes = 2
+    return (
+        *(min(p[i] for p in positions) for i in range(axes)),
+        *(max(p[i] for p in positions) for i in range(axes)),
+    )
+
+
+def flatten_coordinates(
+    coordinates: Any,
+    depth: int,
+    positions: list[Position],
+    lengths: MutableSequence[int],
+) -> None:
+    # Collects the positions and the length of every nested sequence, for
+    # coordinates nested `depth` levels deep as in NESTING
+    if depth == 0:
+        positions.append(coordinates)
+    elif depth == 1:
+        lengths.append(len(coordinates))
+        positions.extend(coordinates)
+    else:
+        lengths.append(len(coordinates))
+        for item in coordinates:
+            flatten_coordinates(item, depth - 1, positions, lengths)
+
+
+def unflatten_coordinates(
+    positions: Iterator[Position], depth: int, lengths: Iterator[int]
+) -> Any:
+    if depth == 0:
+        return next(positions)
+    if depth == 1:
+        return list(islice(positions, next(lengths)))
+    return [
+        unflatten_coordinates(positions, depth - 1, lengths)
+        for _ in range(next(lengths))
+    ]
@@ -0,0 +1,72 @@
+import hashlib
+import json
+import struct
+import sys
+from array import array
+from collections.abc import Mapping, Sequence
+from itertools import chain
+from typing import Any, Protocol, cast
+
+import pydantic_core
+
+_COUNT = struct.Struct("<Q")
+
+
+class Digest(Protocol):
+    def update(self, data: bytes, /) -> None: ...
+
+
+def new_digest() -> "hashlib.blake2b":
+    return hashlib.blake2b(digest_size=16)
+
+
+def update_count(digest: Digest, count: int) -> None:
+    digest.update(_COUNT.pack(count))
+
+
+def update_floats(digest: Digest, values: Sequence[float]) -> None:
+    packed = array("d", values)
+    # Little-endian, so that hashes are stable across platforms
+    if sys.byteorder == "big":
+        packed.byteswap()
+    update_count(digest, len(packed))
+    digest.update(packed.tobytes())
+
+
+def update_positions(digest: Digest, positions: Sequence[Sequence[float]]) -> None:
+    values = array("d", chain.from_iterable(positions))
+    update_count(digest, len(positions))
+    # Mixing 2D and 3D positions is the only way the number of values is not
+    # a multiple of the number of positions, so the dimensions only need to
+    # be encoded per position in that case
+    if len(values) not in (2 * len(positions), 3 * len(positions)):
+        digest.update(bytes(len(position) for position in positions))
+    update_floats(digest, values)
+
+
+def update_coordinates(digest: Digest, coordinates: Any, depth: int) -> None:
+    if depth == 0:
+        update_positions(digest, coordinates)
+        return
+    update_count(digest, len(coordinates))
+    for item in coordinates:
+        update_coordinates(digest, item, depth - 1)
+
+
+def update_value(digest: Digest, value: Any) -> None:
+    # Mappings are encoded with sorted keys, so that equal mappings hash the
+    # same regardless of their insertion order
+    if isinstance(value, Mapping):
+        name = "dict"
+        encoded = json.dumps(
+            value if isinstance(value, dict) else dict(cast(Mapping[str, Any], value)),
+            sort_keys=True,
+            separators=(",", ":"),
+            default=pydantic_core.to_jsonable_python,
+        ).encode()
+    else:
+        name = type(value).__qualname__
+        encoded = pydantic_core.to_json(value)
+    digest.update(name.encode())
+    update_count(digest, len(encoded))
+    digest.update(encoded)
@@ -0,0 +1,151 @@
+from collections.abc import Sequence
+from typing import Annotated, Any, Literal, NamedTuple, NotRequired, TypedDict
+
+import pydantic
+
+from geodantic.features import Feature
+from geodantic.geometries import GEOMETRY_CLASSES, Geometry
+from geodantic.types import (
+    BoundingBox,
+    GeoJSONObjectType,
+    LineStringCoordinates,
+    PolygonCoordinates,
+    Position,
+)
+
+
+class LightGeometry(NamedTuple):
+    """Read-only geometry without the per-instance overhead of a model.
+
+    Geometry collections are not supported.
+    """
+
+    type: GeoJSONObjectType
+    coordinates: Any
+    bbox: BoundingBox | None = None
+
+    @classmethod
+    def from_model(cls, geometry: Geometry) -> "LightGeometry":
+        if geometry.type not in GEOMETRY_CLASSES:
+            raise ValueError(f"unsupported geometry type {geometry.type}")
+        coordinates: Any = geometry.coordinates  # type: ignore[union-attr]
+        return cls(geometry.type, coordinates, geometry.bbox)
+
+    def to_model(self) -> Geometry:
+        data: dict[str, Any] = {"type": self.type, "coordinates": self.coordinates}
+        if self.bbox is not None:
+            data["bbox"] = self.bbox
+        return GEOMETRY_CLASSES[self.type].model_validate(data)
+
+
+class LightFeature(NamedTuple):
+    """Read-only feature without the per-instance overhead of a model."""
+
+    geometry: LightGeometry | None
+    properties: Any
+    id: str | int | None = None
+    bbox: BoundingBox | None = None
+
+    @classmethod
+    def from_model(cls, feature: "Feature[Any, Any]") -> "LightFeature":
+        geometry = feature.geometry
+        return cls(
+            None if geometry is None else LightGeometry.from_model(geometry),
+            feature.properties,
+            feature.id,
+            feature.bbox,
+        )
+
+    def to_model[FeatureT: Feature[Any, Any]](
+        self, model: type[FeatureT] = Feature  # type: ignore[assignment]
+    ) -> FeatureT:
+        data: dict[str, Any] = {
+            "type": GeoJSONObjectType.FEATURE,
+            "geometry": None if self.geometry is None else self.geometry.to_model(),
+            "properties": self.properties,
+        }
+        if self.id is not None:
+            data["id"] = self.id
+        if self.bbox is not None:
+            data["bbox"] = self.bbox
+        return model.model_validate(data)
+
+
+class _RawPoint(TypedDict):
+    type: Literal[GeoJSONObjectType.POINT]
+    coordinates: Position
+    bbox: NotRequired[BoundingBox]
+
+
+class _RawMultiPoint(TypedDict):
+    type: Literal[GeoJSONObjectType.MULTI_POINT]
+    coordinates: Sequence[Position]
+    bbox: NotRequired[BoundingBox]
+
+
+class _RawLineString(TypedDict):
+    type: Literal[GeoJSONObjectType.LINE_STRING]
+    coordinates: LineStringCoordinates
+    bbox: NotRequired[BoundingBox]
+
+
+class _RawMultiLineString(TypedDict):
+    type: Literal[GeoJSONObjectType.MULTI_LINE_STRING]
+    coordinates: Sequence[LineStringCoordinates]
+    bbox: NotRequired[BoundingBox]
+
+
+class _RawPolygon(TypedDict):
+    type: Literal[GeoJSONObjectType.POLYGON]
+    coordinates: PolygonCoordinates
+    bbox: NotRequired[BoundingBox]
+
+
+class _RawMultiPolygon(TypedDict):
+    type: Literal[GeoJSONObjectType.MULTI_POLYGON]
+    coordinates: Sequence[PolygonCoordinates]
+    bbox: NotRequired[BoundingBox]
+
+
+# Validated like the models, but into plain dicts that are converted to
+# light tuples without building any model instance
+class _RawFeature(TypedDict):
+    type: Literal[GeoJSONObjectType.FEATURE]
+    geometry: Annotated[
+        _RawPoint
+        | _RawMultiPoint
+        | _RawLineString
+        | _RawMultiLineString
+        | _RawPolygon
+        | _RawMultiPolygon
+        | None,
+        pydantic.Field(discriminator="type"),
+    ]
+    properties: dict[str, Any] | None
+    id: NotRequired[str | int]
+    bbox: NotRequired[BoundingBox]
+
+
+class _RawFeatureCollection(TypedDict):
+    type: Literal[GeoJSONObjectType.FEATURE_COLLECTION]
+    features: list[_RawFeature]
+    bbox: NotRequired[BoundingBox]
+
+
+raw_collection_adapter = pydantic.TypeAdapter(_RawFeatureCollection)
+
+
+def light_feature(raw: _RawFeature) -> LightFeature:
+    geometry: Any = raw["geometry"]
+    return LightFeature(
+        (
+            None
+            if geometry is None
+            else LightGeometry(
+                geometry["type"], geometry["coordinates"], geometry.get("bbox")
+            )
+        ),
+        raw["properties"],
+        raw.get("id"),
+        raw.get("bbox"),
+    )
@@ -0,0 +1,201 @@
+import math
+from array import array
+from collections.abc import Iterator, Sequence
+from itertools import chain, cycle
+from typing import Any, Literal, Self, overload
+
+from pydantic_core import SchemaSerializer, core_schema
+
+from geodantic.base import _GeoJSONObject
+from geodantic.features import Feature, FeatureCollection
+from geodantic.geometries import (
+    NESTING,
+    GeometryCollection,
+    LineString,
+    MultiLineString,
+    MultiPoint,
+    MultiPolygon,
+    Point,
+    Polygon,
+)
+from geodantic.sequences import SequenceView
+from geodantic.types import Position
+
+type CoordinatePrecision = Literal["float32", "fixed"]
+
+# Fixed-point scales per dimension, which fit any longitude and latitude and
+# altitudes of up to about 2000 km into 32-bit integers
+FIXED_SCALES = (1e7, 1e7, 1e3)
+
+
+class PackedPositions(SequenceView[Position]):
+    """Positions stored in a compact array instead of tuples of floats.
+
+    With the "float32" precision, longitudes are off by at most 7.7e-6 and
+    latitudes by at most 3.9e-6 degrees, which is under a meter. With the
+    "fixed" precision, coordinates are stored as 32-bit integers in units of
+    1e-7 degrees, so they are off by at most 5e-8 degrees, which is under a
+    centimeter, and altitudes by at most half a millimeter.
+    """
+
+    __slots__ = ("_values", "_dimensions", "_precision")
+    _values: array[Any]
+    _dimensions: int
+    _precision: CoordinatePrecision
+
+    # Serialized like a list of positions wherever pydantic meets one, so that
+    # models without packed coordinates need no serialization hook
+    __pydantic_serializer__ = SchemaSerializer(
+        core_schema.any_schema(
+            serialization=core_schema.plain_serializer_function_ser_schema(list)
+        )
+    )
+
+    def __init__(
+        self,
+        positions: Sequence[Sequence[float]],
+        precision: CoordinatePrecision = "float32",
+    ) -> None:
+        dimensions = len(positions[0]) if positions else 2
+        values = array("d", chain.from_iterable(positions))
+        if len(values) != dimensions * len(positions):
+            raise ValueError("positions must all have the same number of dimensions")
+        check_bounds(values, dimensions)
+
+        self._dimensions = dimensions
+        self._precision = precision
+        if precision == "float32":
+            self._values = array("f", values)
+        elif precision == "fixed":
+            scales = cycle(FIXED_SCALES[:dimensions])
+            try:
+                self._values = array(
+                    "i", [round(v * s) for v, s in zip(values, scales)]
+                )
+            except OverflowError:
+                raise ValueError("altitudes are out of the fixed-point range") from None
+        else:
+            raise ValueError(f"unknown precision {precision!r}")
+
+    @classmethod
+    def from_fixed(cls, values: array[int], dimensions: int) -> Self:
+        """Adopt interleaved fixed-point coordinates without copying them.
+
+        Values are in the units of the "fixed" precision, and the array must
+        not be modified afterwards.
+        """
+        check_bounds(values, dimensions, FIXED_SCALES[0])
+        self = cls.__new__(cls)
+        self._values = values
+        self._dimensions = dimensions
+        self._precision = "fixed"
+        return self
+
+    @property
+    def precision(self) -> CoordinatePrecision:
+        return self._precision
+
+    @property
+    def dimensions(self) -> int:
+        return self._dimensions
+
+    @property
+    def values(self) -> array[Any]:
+        """The interleaved coordinates as stored, which must not be modified."""
+        return self._values
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._values) * self._values.itemsize
+
+    def __len__(self) -> int:
+        return len(self._values) // self._dimensions
+
+    @overload
+    def __getitem__(self, index: int) -> Position: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Position]: ...
+
+    def __getitem__(self, index: int | slice) -> Position | Sequence[Position]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index out of range")
+        start = index * self._dimensions
+        return self._position(self._values[start : start + self._dimensions])
+
+    def __iter__(self) -> Iterator[Position]:
+        values = iter(self._values)
+        return map(self._position, zip(*[values] * self._dimensions))
+
+    def _position(self, values: Sequence[float]) -> Position:
+        if self._precision == "fixed":
+            return tuple(v / s for v, s in zip(values, FIXED_SCALES))  # type: ignore[return-value]
+        return tuple(values)  # type: ignore[return-value]
+
+
+@overload
+def pack_coordinates[ObjectT: _GeoJSONObject](
+    obj: ObjectT, precision: CoordinatePrecision = "float32"
+) -> ObjectT: ...
+
+
+@overload
+def pack_coordinates(obj: None, precision: CoordinatePrecision = "float32") -> None: ...
+
+
+def pack_coordinates(
+    obj: _GeoJSONObject | None, precision: CoordinatePrecision = "float32"
+) -> _GeoJSONObject | None:
+    """Copy a GeoJSON object with its coordinates stored as `PackedPositions`.
+
+    Point coordinates stay tuples, rounded to the same precision. Features
+    and collections are copied with all of their geometries packed.
+    """
+    if obj is None:
+        return None
+    if isinstance(obj, Point):
+        packed: Any = PackedPositions([obj.coordinates], precision)[0]
+        return obj.model_copy(update={"coordinates": packed})
+    if isinstance(obj, GeometryCollection):
+        geometries = [
+            pack_coordinates(geometry, precision) for geometry in obj.geometries
+        ]
+        return obj.model_copy(update={"geometries": geometries})
+    if isinstance(obj, Feature):
+        geometry = pack_coordinates(obj.geometry, precision)
+        return obj.model_copy(update={"geometry": geometry})
+    if isinstance(obj, FeatureCollection):
+        features = [pack_coordinates(feature, precision) for feature in obj.features]
+        return obj.model_copy(update={"features": features})
+    if isinstance(
+        obj, MultiPoint | LineString | MultiLineString | Polygon | MultiPolygon
+    ):
+        coordinates = _pack(obj.coordinates, NESTING[obj.type], precision)
+        return obj.model_copy(update={"coordinates": coordinates})
+    raise TypeError(f"cannot pack {type(obj).__name__}")
+
+
+def _pack(coordinates: Any, depth: int, precision: CoordinatePrecision) -> Any:
+    # Sequences of positions are at the last nesting level
+    if depth == 1:
+        return PackedPositions(coordinates, precision)
+    return [_pack(item, depth - 1, precision) for item in coordinates]
+
+
+def check_bounds(
+    values: array[float] | array[int] | memoryview,
+    dimensions: int,
+    scale: float = 1.0,
+) -> None:
+    # Checks the longitudes and latitudes of interleaved coordinates at once,
+    # which are multiplied by the scale if they are fixed-point values
+    for start, limit in ((0, 180.0), (1, 90.0)):
+        axis = values[start::dimensions]
+        low, high = -limit * scale, limit * scale
+        # The sum is NaN if any of the values is NaN
+        if axis and (math.isnan(sum(axis)) or min(axis) < low or max(axis) > high):
+            raise ValueError(f"coordinates must be within [-{limit}, {limit}]")
@@ -0,0 +1,464 @@
+import json
+import math
+from collections.abc import Callable, Collection, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, LiteralString, TypeVar, cast, get_args
+
+import pydantic
+import pydantic_core
+from pydantic_core import core_schema
+
+from geodantic import antimeridian
+from geodantic.caching import type_adapter
+from geodantic.features import FeatureCollection, bbox_adapter
+from geodantic.geometries import NESTING
+from geodantic.lightweight import (
+    LightFeature,
+    light_feature,
+    raw_collection_adapter,
+)
+from geodantic.types import BoundingBox, GeoJSONObjectType
+
+type PropertiesPredicate = Callable[[Mapping[str, Any] | None], bool]
+
+type _Location = tuple[int | str, ...]
+
+_ERROR_TYPES = frozenset(get_args(core_schema.ErrorType))
+
+
+@dataclass(frozen=True, slots=True)
+class PartitionedFeatureCollection[FeatureCollectionT: FeatureCollection[Any]]:
+    """Valid features of a collection and the errors of the invalid ones.
+
+    Errors are keyed by the index of the feature in the input data and do
+    not include the invalid input values.
+    """
+
+    valid: FeatureCollectionT
+    errors: Mapping[int, list[pydantic_core.ErrorDetails]]
+
+
+@dataclass(frozen=True, slots=True)
+class ParseLimits:
+    """Bounds on untrusted input, checked before any feature is validated.
+
+    `max_bytes` bounds the size of JSON input in bytes, with strings measured
+    in UTF-8. Input which is already parsed is not measured, but the other
+    bounds still apply.
+    `max_depth` bounds the nesting of geometry collections, a collection of
+    plain geometries being 1 deep. `max_vertices` bounds the number of
+    positions of all geometries together. None leaves a bound unchecked.
+    """
+
+    max_bytes: int | None = None
+    max_depth: int | None = None
+    max_vertices: int | None = None
+    max_features: int | None = None
+
+
+def parse_feature_collection[FeatureCollectionT: FeatureCollection[Any]](
+    model: type[FeatureCollectionT],
+    data: str | bytes | Mapping[str, Any],
+    *,
+    properties: Collection[str] | None = None,
+    where: PropertiesPredicate | None = None,
+    intersecting: BoundingBox | None = None,
+    max_errors: int | None = None,
+    limits: ParseLimits | None = None,
+) -> FeatureCollectionT:
+    """Parse a feature collection, filtering raw features before validation.
+
+    Features for which `where` returns false are dropped before any of their
+    fields are validated. If `properties` is given, only those keys are kept
+    from the properties of each remaining feature.
+
+    If `intersecting` is given, features outside of that bounding box are
+    dropped as well. They are matched by their own bbox if they have one,
+    otherwise by the extent of their raw coordinates.
+
+    If `max_errors` is given, features are validated one by one and parsing
+    stops as soon as that many features turn out to be invalid.
+
+    If `limits` are given, input exceeding them is rejected with a
+    `limit_exceeded` error before any feature is validated.
+    """
+    raw, features, indices = _filter(
+        data, properties, where, intersecting, limits, model.__name__
+    )
+    if features is None:
+        return model.model_validate(raw)
+
+    if max_errors is None:
+        try:
+            return model.model_validate({**raw, "features": features})
+        except pydantic.ValidationError as e:
+            raise _with_feature_indices(model.__name__, e, indices) from None
+
+    if max_errors < 1:
+        raise ValueError("max_errors must be at least 1")
+    collection, errors = _validate_features(
+        model, raw, features, indices, max_errors=max_errors, include_input=True
+    )
+    if errors:
+        raise pydantic.ValidationError.from_exception_data(
+            model.__name__,
+            [
+                _line_error(("features", index, *error["loc"]), error)
+                for index, index_errors in errors.items()
+                for error in index_errors
+            ],
+        )
+    return collection
+
+
+def partition_feature_collection[FeatureCollectionT: FeatureCollection[Any]](
+    model: type[FeatureCollectionT],
+    data: str | bytes | Mapping[str, Any],
+    *,
+    properties: Collection[str] | None = None,
+    where: PropertiesPredicate | None = None,
+    intersecting: BoundingBox | None = None,
+    limits: ParseLimits | None = None,
+) -> PartitionedFeatureCollection[FeatureCollectionT]:
+    """Parse the valid features of a collection and report the invalid ones.
+
+    Accepts the same filters and limits as `parse_feature_collection`. Errors
+    outside of the features, such as an invalid collection bbox, and
+    exceeded limits are still raised.
+    """
+    raw, features, indices = _filter(
+        data, properties, where, intersecting, limits, model.__name__
+    )
+    if features is None:
+        # Not a mapping with a list of features, so nothing to partition
+        return PartitionedFeatureCollection(model.model_validate(raw), {})
+    collection, errors = _validate_features(
+        model, raw, features, indices, max_errors=None, include_input=False
+    )
+    return PartitionedFeatureCollection(collection, errors)
+
+
+def parse_light_features(
+    data: str | bytes | Mapping[str, Any],
+    *,
+    properties: Collection[str] | None = None,
+    where: PropertiesPredicate | None = None,
+    intersecting: BoundingBox | None = None,
+    limits: ParseLimits | None = None,
+) -> list[LightFeature]:
+    """Parse the features of a collection into light tuples.
+
+    The features are validated like `FeatureCollection` would, but no model
+    instance is ever built, which keeps collections of many small geometries
+    cheap to hold in memory. Accepts the same filters and limits as
+    `parse_feature_collection`.
+    """
+    if (
+        isinstance(data, str | bytes)
+        and properties is None
+        and where is None
+        and intersecting is None
+        and limits is None
+    ):
+        collection = raw_collection_adapter.validate_json(data)
+        return [light_feature(feature) for feature in collection["features"]]
+
+    raw, features, indices = _filter(
+        data, properties, where, intersecting, limits, "FeatureCollection"
+    )
+    try:
+        collection = raw_collection_adapter.validate_python(
+            raw if features is None else {**raw, "features": features}
+        )
+    except pydantic.ValidationError as e:
+        raise _with_feature_indices("FeatureCollection", e, indices) from None
+    return [light_feature(feature) for feature in collection["features"]]
+
+
+def _filter(
+    data: str | bytes | Mapping[str, Any],
+    properties: Collection[str] | None,
+    where: PropertiesPredicate | None,
+    intersecting: BoundingBox | None,
+    limits: ParseLimits | None,
+    title: str,
+) -> tuple[Any, list[Any] | None, Sequence[int]]:
+    # Returns the raw collection, its remaining raw features and their
+    # indices in the input data
+    raw: Any
+    if not isinstance(data, str | bytes):
+        raw = data
+    elif limits is None:
+        raw = json.loads(data)
+    else:
+        if limits.max_bytes is not None and _longer_than(data, limits.max_bytes):
+            raise _limit_error(
+                title,
+                (),
+                "input is longer than {max_bytes}",
+                max_bytes=limits.max_bytes,
+            )
+        try:
+            raw = json.loads(data)
+        except RecursionError:
+            raise _limit_error(title, (), "input is nested too deeply") from None
+    value = _member(raw, "features")
+    if not isinstance(value, list | tuple):
+        return raw, None, ()
+    raw_features = cast(Sequence[Any], value)
+    if limits is not None:
+        _check_limits(raw_features, limits, title)
+    if properties is None and where is None and intersecting is None:
+        return raw, list(raw_features), range(len(raw_features))
+
+    keys = None if properties is None else frozenset(properties)
+    region = None
+    if intersecting is not None:
+        region = _bbox_2d(bbox_adapter.validate_python(intersecting))
+    features: list[Any] = []
+    indices: list[int] = []
+    for index, item in enumerate(raw_features):
+        if not isinstance(item, Mapping):
+            # Let the model report the invalid feature
+            features.append(item)
+            indices.append(index)
+            continue
+
+        raw_feature = cast(Mapping[str, Any], item)
+        value = raw_feature.get("properties")
+        raw_properties = (
+            cast(Mapping[str, Any], value) if isinstance(value, Mapping) else None
+        )
+        if where is not None and not where(raw_properties):
+            continue
+        if region is not None and not _raw_feature_intersects(raw_feature, region):
+            continue
+        if keys is not None and raw_properties is not None:
+            raw_feature = {
+                **raw_feature,
+                "properties": {
+                    key: value for key, value in raw_properties.items() if key in keys
+                },
+            }
+        features.append(raw_feature)
+        indices.append(index)
+
+    return raw, features, indices
+
+
+def _longer_than(data: str | bytes, max_bytes: int) -> bool:
+    # Strings take one to four bytes per character in UTF-8, so they are only
+    # encoded if their length does not settle it
+    if isinstance(data, bytes) or not len(data) <= max_bytes < len(data) * 4:
+        return len(data) > max_bytes
+    return len(data.encode(errors="surrogatepass")) > max_bytes
+
+
+def _member(raw: Any, key: str) -> Any:
+    # Members of raw JSON objects, None for other values
+    if isinstance(raw, Mapping):
+        return cast(Mapping[str, Any], raw).get(key)
+    return None
+
+
+def _check_limits(raw_features: Sequence[Any], limits: ParseLimits, title: str) -> None:
+    max_features, max_depth = limits.max_features, limits.max_depth
+    if max_features is not None and len(raw_features) > max_features:
+        raise _limit_error(
+            title,
+            ("features",),
+            "there are more than {max_features} features",
+            max_features=max_features,
+        )
+    if max_depth is None and limits.max_vertices is None:
+        return
+
+    # Walks the raw geometries without recursion, leaving malformed ones to
+    # the models to report
+    vertices = 0
+    max_vertices = math.inf if limits.max_vertices is None else limits.max_vertices
+    for index, raw_feature in enumerate(raw_features):
+        stack: list[tuple[Any, int, _Location]] = [
+            (_member(raw_feature, "geometry"), 0, ("features", index, "geometry"))
+        ]
+        while stack:
+            geometry, depth, loc = stack.pop()
+            geometry_type = _member(geometry, "type")
+            if geometry_type == GeoJSONObjectType.GEOMETRY_COLLECTION:
+                if max_depth is not None and depth >= max_depth:
+                    raise _limit_error(
+                        title,
+                        loc,
+                        "geometry collections are nested more than {max_depth} deep",
+                        max_depth=max_depth,
+                    )
+                children = _member(geometry, "geometries")
+                if isinstance(children, list | tuple):
+                    stack.extend(
+                        (child, depth + 1, (*loc, "geometries", i))
+                        for i, child in enumerate(cast(Sequence[Any], children))
+                    )
+            elif geometry_type in NESTING:
+                vertices += _count_positions(
+                    _member(geometry, "coordinates"), NESTING[geometry_type]
+                )
+                if vertices > max_vertices:
+                    raise _limit_error(
+                        title,
+                        loc,
+                        "there are more than {max_vertices} positions",
+                        max_vertices=max_vertices,
+                    )
+
+
+def _count_positions(coordinates: Any, depth: int) -> int:
+    if depth == 0:
+        return 1
+    items = [coordinates]
+    for _ in range(depth - 1):
+        items = [
+            child for item in items if isinstance(item, list | tuple) for child in item
+        ]
+    return sum(len(item) for item in items if isinstance(item, list | tuple))
+
+
+def _limit_error(
+    title: str, loc: _Location, message: LiteralString, **context: Any
+) -> pydantic.ValidationError:
+    error = pydantic_core.PydanticCustomError("limit_exceeded", message, context)
+    return pydantic.ValidationError.from_exception_data(
+        title, [{"type": error, "loc": loc, "input": None}]
+    )
+
+
+def _feature_adapter(model: type[FeatureCollection[Any]]) -> pydantic.TypeAdapter[Any]:
+    (feature_type,) = get_args(model.model_fields["features"].annotation)
+    if isinstance(feature_type, TypeVar):
+        feature_type = feature_type.__bound__
+    return type_adapter(feature_type)
+
+
+def _validate_features[FeatureCollectionT: FeatureCollection[Any]](
+    model: type[FeatureCollectionT],
+    raw: Mapping[str, Any],
+    features: list[Any],
+    indices: Sequence[int],
+    *,
+    max_errors: int | None,
+    include_input: bool,
+) -> tuple[FeatureCollectionT, dict[int, list[pydantic_core.ErrorDetails]]]:
+    # Everything but the features is validated once up front
+    collection = model.model_validate({**raw, "features": []})
+    adapter = _feature_adapter(model)
+    valid: list[Any] = []
+    errors: dict[int, list[pydantic_core.ErrorDetails]] = {}
+    for index, raw_feature in zip(indices, features):
+        try:
+            valid.append(adapter.validate_python(raw_feature))
+        except pydantic.ValidationError as e:
+            errors[index] = e.errors(include_url=False, include_input=include_input)
+            if max_errors is not None and len(errors) >= max_errors:
+                break
+    return collection.model_copy(update={"features": valid}), errors
+
+
+def _with_feature_indices(
+    title: str,
+    error: pydantic.ValidationError,
+    indices: Sequence[int],
+) -> pydantic.ValidationError:
+    # Point feature errors back at the index of the feature in the input data
+    if isinstance(indices, range):
+        return error
+    line_errors: list[pydantic_core.InitErrorDetails] = []
+    for detail in error.errors(include_url=False):
+        loc = detail["loc"]
+        if len(loc) > 1 and loc[0] == "features" and isinstance(loc[1], int):
+            loc = ("features", indices[loc[1]], *loc[2:])
+        line_errors.append(_line_error(loc, detail))
+    return pydantic.ValidationError.from_exception_data(title, line_errors)
+
+
+def _line_error(
+    loc: _Location, detail: pydantic_core.ErrorDetails
+) -> pydantic_core.InitErrorDetails:
+    # Built-in errors are raised again with their context. Custom errors of
+    # validators can only be rebuilt from their rendered message, which is
+    # not formatted again as there is no context
+    line_error: pydantic_core.InitErrorDetails = {
+        "type": detail["type"],
+        "loc": loc,
+        "input": detail.get("input"),
+    }
+    if detail["type"] not in _ERROR_TYPES:
+        line_error["type"] = pydantic_core.PydanticCustomError(
+            cast(Any, detail["type"]), cast(Any, detail["msg"])
+        )
+    elif "ctx" in detail:
+        line_error["ctx"] = detail["ctx"]
+    return line_error
+
+
+type _Extent = tuple[float, float, float, float]
+
+
+def _bbox_2d(bbox: BoundingBox) -> _Extent:
+    if len(bbox) == 4:
+        return bbox
+    return bbox[0], bbox[1], bbox[3], bbox[4]
+
+
+def _raw_feature_intersects(raw_feature: Mapping[str, Any], region: _Extent) -> bool:
+    extent: _Extent | None = None
+    if "bbox" in raw_feature:
+        try:
+            extent = _bbox_2d(bbox_adapter.validate_python(raw_feature["bbox"]))
+        except pydantic.ValidationError:
+            # Keep the feature, so that the model reports the invalid bbox
+            return True
+    else:
+        try:
+            extent = _raw_extent(raw_feature.get("geometry"))
+        except ValueError:
+            return True
+        if extent is None:
+            return False
+    west, south, east, north = region
+    return (
+        antimeridian.longitudes_overlap(extent[0], extent[2], west, east)
+        and extent[1] <= north
+        and south <= extent[3]
+    )
+
+
+def _raw_extent(geometry: Any) -> _Extent | None:
+    # Scans the raw coordinates without recursion, returns None for missing
+    # or empty geometries and raises ValueError for malformed ones
+    if geometry is None:
+        return None
+    min_x = min_y = math.inf
+    max_x = max_y = -math.inf
+    stack = [geometry]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, Mapping):
+            raw_geometry = cast(Mapping[str, Any], item)
+            children = raw_geometry.get("coordinates", raw_geometry.get("geometries"))
+            if not isinstance(children, list | tuple):
+                raise ValueError("malformed geometry")
+            stack.append(children)
+        elif isinstance(item, list | tuple):
+            values = cast(Sequence[Any], item)
+            if values and isinstance(values[0], int | float):
+                if len(values) < 2 or not isinstance(values[1], int | float):
+                    raise ValueError("malformed position")
+                x, y = values[0], values[1]
+                min_x, max_x = min(min_x, x), max(max_x, x)
+                min_y, max_y = min(min_y, y), max(max_y, y)
+            else:
+                stack.extend(values)
+        else:
+            raise ValueError("malformed coordinates")
+    if min_x > max_x:
+        return None
+    return min_x, min_y, max_x, max_y
@@ -0,0 +1,468 @@
+import math
+from collections.abc import Iterable, Sequence
+from itertools import pairwise
+
+type _Edge = tuple[float, float, float, float]
+
+
+class EdgeIndex:
+    # Ring edges bucketed into horizontal bands, so that a crossing test
+    # only visits the edges that span the latitude of the queried point.
+    __slots__ = ("min_x", "min_y", "max_x", "max_y", "_band_height", "_bands")
+
+    def __init__(self, rings: Iterable[Sequence[Sequence[float]]]) -> None:
+        edges: list[_Edge] = []
+        xs: list[float] = []
+        ys: list[float] = []
+        for ring in rings:
+            for (x1, y1, *_), (x2, y2, *_) in pairwise(ring):
+                xs.append(x1)
+                ys.append(y1)
+                # Horizontal edges can never cross a horizontal ray
+                if y1 != y2:
+                    edges.append((x1, y1, x2, y2))
+
+        if not xs:
+            self.min_x = self.min_y = math.inf
+            self.max_x = self.max_y = -math.inf
+            self._band_height = 1.0
+            self._bands: list[list[_Edge]] = [[]]
+            return
+
+        self.min_x, self.max_x = min(xs), max(xs)
+        self.min_y, self.max_y = min(ys), max(ys)
+        band_count = max(1, math.isqrt(len(edges)))
+        self._band_height = (self.max_y - self.min_y) / band_count or 1.0
+        self._bands = [[] for _ in range(band_count)]
+        for edge in edges:
+            _, y1, _, y2 = edge
+            first = self._band(min(y1, y2))
+            last = self._band(max(y1, y2))
+            for band in range(first, last + 1):
+                self._bands[band].append(edge)
+
+    def _band(self, y: float) -> int:
+        band = int((y - self.min_y) / self._band_height)
+        return min(max(band, 0), len(self._bands) - 1)
+
+    def contains(self, x: float, y: float) -> bool:
+        if not (self.min_x <= x <= self.max_x and self.min_y <= y <= self.max_y):
+            return False
+        # Even-odd rule over all rings, which also accounts for holes
+        inside = False
+        for x1, y1, x2, y2 in self._bands[self._band(y)]:
+            if (y1 > y) != (y2 > y) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+                inside = not inside
+        return inside
+
+
+def contains_points(
+    indexes: Sequence[EdgeIndex], points: Iterable[Sequence[float]]
+) -> list[bool]:
+    if not indexes:
+        return [False for _ in points]
+    min_x = min(index.min_x for index in indexes)
+    min_y = min(index.min_y for index in indexes)
+    max_x = max(index.max_x for index in indexes)
+    max_y = max(index.max_y for index in indexes)
+
+    result: list[bool] = []
+    for x, y, *_ in points:
+        if not (min_x <= x <= max_x and min_y <= y <= max_y):
+            result.append(False)
+        else:
+            result.append(any(index.contains(x, y) for index in indexes))
+    return result
+
+
+def length(positions: Sequence[Sequence[float]]) -> float:
+    return sum(
+        math.hypot(x2 - x1, y2 - y1)
+        for (x1, y1, *_), (x2, y2, *_) in pairwise(positions)
+    )
+
+
+def ring_area_centroid(ring: Sequence[Sequence[float]]) -> tuple[float, float, float]:
+    # Shoelace formula, the area is signed by the ring orientation
+    area = cx = cy = 0.0
+    for (x1, y1, *_), (x2, y2, *_) in pairwise(ring):
+        cross = x1 * y2 - x2 * y1
+        area += cross
+        cx += (x1 + x2) * cross
+        cy += (y1 + y2) * cross
+    if not area:
+        return 0.0, math.nan, math.nan
+    return area / 2, cx / (3 * area), cy / (3 * area)
+
+
+def polygons_area_centroid(
+    polygons: Iterable[Sequence[Sequence[Sequence[float]]]],
+) -> tuple[float, float, float]:
+    total = cx = cy = 0.0
+    vertices: list[Sequence[float]] = []
+    for polygon in polygons:
+        for i, ring in enumerate(polygon):
+            area, ring_cx, ring_cy = ring_area_centroid(ring)
+            # The first ring is the exterior, the rest are holes
+            area = abs(area) if i == 0 else -abs(area)
+            if area:
+                total += area
+                cx += ring_cx * area
+                cy += ring_cy * area
+            if i == 0:
+                vertices.extend(ring[:-1])
+
+    if total:
+        return total, cx / total, cy / total
+    if vertices:
+        # Degenerate polygons have no area, fall back to the vertex average
+        return (
+            0.0,
+            math.fsum(x for x, *_ in vertices) / len(vertices),
+            math.fsum(y for _, y, *_ in vertices) / len(vertices),
+        )
+    return 0.0, math.nan, math.nan
+
+
+type XY = tuple[float, float]
+type _Segment = tuple[float, float, float, float]
+
+# Distance under which a point counts as lying on a segment, in coordinate
+# units, which absorbs the rounding of computed midpoints
+_TOLERANCE = 1e-9
+
+_EXTERIOR, _BOUNDARY, _INTERIOR = 0, 1, 2
+
+
+class _SegmentIndex:
+    # Segments bucketed into a grid of cells, keeping horizontal segments
+    # unlike EdgeIndex, for intersection and point-on-segment queries
+    __slots__ = ("_min_x", "_min_y", "_cell_width", "_cell_height", "_size", "_cells")
+
+    def __init__(self, segments: Sequence[_Segment]) -> None:
+        self._size = max(1, math.isqrt(len(segments)))
+        self._cells: dict[tuple[int, int], list[_Segment]] = {}
+        if not segments:
+            self._min_x = self._min_y = 0.0
+            self._cell_width = self._cell_height = 1.0
+            return
+        self._min_x = min(min(x1, x2) for x1, _, x2, _ in segments)
+        self._min_y = min(min(y1, y2) for _, y1, _, y2 in segments)
+        max_x = max(max(x1, x2) for x1, _, x2, _ in segments)
+        max_y = max(max(y1, y2) for _, y1, _, y2 in segments)
+        self._cell_width = (max_x - self._min_x) / self._size or 1.0
+        self._cell_height = (max_y - self._min_y) / self._size or 1.0
+        for segment in segments:
+            for cell in self._cells_of(*segment):
+                self._cells.setdefault(cell, []).append(segment)
+
+    def _cells_of(
+        self, x1: float, y1: float, x2: float, y2: float
+    ) -> Iterable[tuple[int, int]]:
+        last = self._size - 1
+        columns = (
+            int((min(x1, x2) - _TOLERANCE - self._min_x) / self._cell_width),
+            int((max(x1, x2) + _TOLERANCE - self._min_x) / self._cell_width),
+        )
+        rows = (
+            int((min(y1, y2) - _TOLERANCE - self._min_y) / self._cell_height),
+            int((max(y1, y2) + _TOLERANCE - self._min_y) / self._cell_height),
+        )
+        for column in range(max(columns[0], 0), min(columns[1], last) + 1):
+            for row in range(max(rows[0], 0), min(rows[1], last) + 1):
+                yield column, row
+
+    def query(self, x1: float, y1: float, x2: float, y2: float) -> set[_Segment]:
+        low_x, high_x = min(x1, x2) - _TOLERANCE, max(x1, x2) + _TOLERANCE
+        low_y, high_y = min(y1, y2) - _TOLERANCE, max(y1, y2) + _TOLERANCE
+        return {
+            segment
+            for cell in self._cells_of(x1, y1, x2, y2)
+            for segment in self._cells.get(cell, ())
+            if min(segment[0], segment[2]) <= high_x
+            and low_x <= max(segment[0], segment[2])
+            and min(segment[1], segment[3]) <= high_y
+            and low_y <= max(segment[1], segment[3])
+        }
+
+
+class Shape:
+    # The points, lines and polygons of a geometry in two dimensions, indexed
+    # for the spatial predicates
+    __slots__ = (
+        "dimension",
+        "extent",
+        "points",
+        "lines",
+        "polygons",
+        "_point_set",
+        "_line_ends",
+        "_line_segments",
+        "_ring_segments",
+        "_edge_indexes",
+    )
+
+    def __init__(
+        self,
+        points: list[XY],
+        lines: list[list[XY]],
+        polygons: list[list[list[XY]]],
+    ) -> None:
+        self.points = points
+        self.lines = [line for line in lines if line]
+        self.polygons = [polygon for polygon in polygons if polygon and polygon[0]]
+        self.dimension = (
+            2 if self.polygons else 1 if self.lines else 0 if points else -1
+        )
+
+        vertices = [
+            *points,
+            *(p for line in self.lines for p in line),
+            *(p for polygon in self.polygons for p in polygon[0]),
+        ]
+        if vertices:
+            xs = [x for x, _ in vertices]
+            ys = [y for _, y in vertices]
+            self.extent = (min(xs), min(ys), max(xs), max(ys))
+        else:
+            self.extent = (math.inf, math.inf, -math.inf, -math.inf)
+
+        self._point_set = set(points)
+        # Closed lines have no boundary
+        self._line_ends = {
+            p for line in self.lines if line[0] != line[-1] for p in (line[0], line[-1])
+        }
+        self._line_segments = _SegmentIndex(
+            [(*a, *b) for line in self.lines for a, b in pairwise(line)]
+        )
+        self._ring_segments = _SegmentIndex(
+            [
+                (*a, *b)
+                for polygon in self.polygons
+                for ring in polygon
+                for a, b in pairwise(ring)
+            ]
+        )
+        self._edge_indexes = [EdgeIndex(polygon) for polygon in self.polygons]
+
+    def segments(self) -> Iterable[_Segment]:
+        for line in self.lines:
+            for a, b in pairwise(line):
+                yield (*a, *b)
+        for polygon in self.polygons:
+            for ring in polygon:
+                for a, b in pairwise(ring):
+                    yield (*a, *b)
+
+    def crossings(self, other: "Shape") -> Iterable[int]:
+        # Relations between the segments of both shapes whose bounding boxes
+        # overlap, as returned by _segment_relation
+        for segment in self.segments():
+            if not _extents_overlap(_segment_extent(segment), other.extent):
+                continue
+            for index in (other._line_segments, other._ring_segments):
+                for candidate in index.query(*segment):
+                    yield _segment_relation(segment, candidate)
+
+    def locate(self, x: float, y: float) -> int:
+        """Whether the point is in the exterior, boundary or interior."""
+        if (x, y) in self._point_set:
+            return _INTERIOR
+        result = _EXTERIOR
+        for segment in self._line_segments.query(x, y, x, y):
+            if _on_segment(x, y, segment):
+                if (x, y) not in self._line_ends:
+                    return _INTERIOR
+                result = _BOUNDARY
+        if self.in_polygon_boundary(x, y):
+            return _BOUNDARY
+        if any(index.contains(x, y) for index in self._edge_indexes):
+            return _INTERIOR
+        return result
+
+    def in_polygon_boundary(self, x: float, y: float) -> bool:
+        return any(
+            _on_segment(x, y, segment)
+            for segment in self._ring_segments.query(x, y, x, y)
+        )
+
+    def in_polygon_interior(self, x: float, y: float) -> bool:
+        return not self.in_polygon_boundary(x, y) and any(
+            index.contains(x, y) for index in self._edge_indexes
+        )
+
+    def component_points(self) -> list[XY]:
+        # A point of every component, which decides whether a component lies
+        # inside another shape when their boundaries do not intersect
+        return [
+            *self.points,
+            *(line[0] for line in self.lines),
+            *(polygon[0][0] for polygon in self.polygons),
+        ]
+
+    def interior_samples(self) -> list[XY]:
+        samples = list(self.points)
+        for line in self.lines:
+            samples.extend(line[1:-1])
+            samples.extend(_midpoints(line))
+        for polygon in self.polygons:
+            point = _interior_point(polygon)
+            if point is not None:
+                samples.append(point)
+        return samples
+
+    def ring_samples(self) -> list[XY]:
+        samples: list[XY] = []
+        for polygon in self.polygons:
+            for ring in polygon:
+                samples.extend(ring)
+                samples.extend(_midpoints(ring))
+        return samples
+
+    def samples(self) -> list[XY]:
+        return [
+            *self.interior_samples(),
+            *self.ring_samples(),
+            *(p for line in self.lines for p in (line[0], line[-1])),
+        ]
+
+
+def _segment_extent(segment: _Segment) -> tuple[float, float, float, float]:
+    x1, y1, x2, y2 = segment
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+def _midpoints(positions: Sequence[XY]) -> Iterable[XY]:
+    return (
+        ((x1 + x2) / 2, (y1 + y2) / 2) for (x1, y1), (x2, y2) in pairwise(positions)
+    )
+
+
+def _interior_point(polygon: Sequence[Sequence[XY]]) -> XY | None:
+    # Middle of the widest interior interval on a horizontal line between
+    # two distinct latitudes of the rings, so that it misses every vertex
+    # and horizontal edge of the holes too
+    ys = sorted({y for ring in polygon for _, y in ring})
+    if len(ys) < 2:
+        return None
+    middle = (ys[0] + ys[-1]) / 2
+    below = max(y for y in ys[:-1] if y <= middle)
+    y = (below + min(y for y in ys if y > below)) / 2
+    xs = sorted(
+        x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+        for ring in polygon
+        for (x1, y1), (x2, y2) in pairwise(ring)
+        if (y1 > y) != (y2 > y)
+    )
+    intervals = list(zip(xs[::2], xs[1::2]))
+    if not intervals:
+        return None
+    start, end = max(intervals, key=lambda interval: interval[1] - interval[0])
+    if start == end:
+        return None
+    return (start + end) / 2, y
+
+
+def _side(ax: float, ay: float, bx: float, by: float, x: float, y: float) -> int:
+    # Side of the point relative to the line through a and b, 0 if it lies
+    # within the tolerance of that line
+    cross = (bx - ax) * (y - ay) - (by - ay) * (x - ax)
+    if abs(cross) <= _TOLERANCE * math.hypot(bx - ax, by - ay):
+        return 0
+    return 1 if cross > 0 else -1
+
+
+def _on_segment(x: float, y: float, segment: _Segment) -> bool:
+    x1, y1, x2, y2 = segment
+    if not (
+        min(x1, x2) - _TOLERANCE <= x <= max(x1, x2) + _TOLERANCE
+        and min(y1, y2) - _TOLERANCE <= y <= max(y1, y2) + _TOLERANCE
+    ):
+        return False
+    if x1 == x2 and y1 == y2:
+        return math.hypot(x - x1, y - y1) <= _TOLERANCE
+    return _side(x1, y1, x2, y2, x, y) == 0
+
+
+def _segment_relation(first: _Segment, second: _Segment) -> int:
+    # 0 if the segments are disjoint, 2 if they cross at a single point
+    # interior to both, and 1 if they otherwise touch or overlap
+    ax, ay, bx, by = first
+    cx, cy, dx, dy = second
+    d1, d2 = _side(cx, cy, dx, dy, ax, ay), _side(cx, cy, dx, dy, bx, by)
+    d3, d4 = _side(ax, ay, bx, by, cx, cy), _side(ax, ay, bx, by, dx, dy)
+    if d1 * d2 < 0 and d3 * d4 < 0:
+        return 2
+    if (
+        _on_segment(ax, ay, second)
+        or _on_segment(bx, by, second)
+        or _on_segment(cx, cy, first)
+        or _on_segment(dx, dy, first)
+    ):
+        return 1
+    return 0
+
+
+def _extents_overlap(
+    first: tuple[float, float, float, float], second: tuple[float, float, float, float]
+) -> bool:
+    return (
+        first[0] <= second[2] + _TOLERANCE
+        and second[0] <= first[2] + _TOLERANCE
+        and first[1] <= second[3] + _TOLERANCE
+        and second[1] <= first[3] + _TOLERANCE
+    )
+
+
+def intersects(first: Shape, second: Shape) -> bool:
+    if not _extents_overlap(first.extent, second.extent):
+        return False
+    if any(first.crossings(second)):
+        return True
+    # Without intersecting boundaries, components either lie inside the
+    # other shape or are disjoint from it
+    return any(second.locate(*p) for p in first.component_points()) or any(
+        first.locate(*p) for p in second.component_points()
+    )
+
+
+def _interiors_intersect(first: Shape, second: Shape) -> bool:
+    if any(relation == 2 for relation in first.crossings(second)):
+        return True
+    for a, b in ((first, second), (second, first)):
+        if any(b.locate(*p) == _INTERIOR for p in a.interior_samples()):
+            return True
+        # Near a point of the boundary of a polygon, there are points of its
+        # interior, and near a line end, there are points of the line
+        boundary = [
+            *a.ring_samples(),
+            *(p for line in a.lines for p in (line[0], line[-1])),
+        ]
+        if any(b.in_polygon_interior(*p) for p in boundary):
+            return True
+    return False
+
+
+def touches(first: Shape, second: Shape) -> bool:
+    return intersects(first, second) and not _interiors_intersect(first, second)
+
+
+def contains(first: Shape, second: Shape) -> bool:
+    if second.dimension < 0 or first.dimension < second.dimension:
+        return False
+    (x1, y1, x2, y2), (a1, b1, a2, b2) = first.extent, second.extent
+    if not (
+        x1 - _TOLERANCE <= a1
+        and y1 - _TOLERANCE <= b1
+        and a2 <= x2 + _TOLERANCE
+        and b2 <= y2 + _TOLERANCE
+    ):
+        return False
+    if any(relation == 2 for relation in second.crossings(first)):
+        return False
+    if any(first.locate(*p) == _EXTERIOR for p in second.samples()):
+        return False
+    # Holes of the first shape may lie inside the second one
+    if any(second.in_polygon_interior(*p) for p in first.ring_samples()):
+        return False
+    return any(first.locate(*p) == _INTERIOR for p in second.interior_samples())
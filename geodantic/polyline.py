@@ -0,0 +1,194 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+
+from geodantic.geometries import LineString, MultiLineString
+from geodantic.packing import FIXED_SCALES, PackedPositions
+from geodantic.types import GeoJSONObjectType, Position
+
+# Decimal digits of the fixed-point coordinates of PackedPositions
+_FIXED_DIGITS = 7
+
+_LINE_STRING_TAG = 0
+_MULTI_LINE_STRING_TAG = 1
+
+
+def encode_polyline(line: LineString | Sequence[Position], precision: int = 5) -> str:
+    """Encode positions in the encoded polyline format.
+
+    Altitudes are dropped, as the format only stores latitudes and longitudes.
+    """
+    _check_precision(precision)
+    positions = line.coordinates if isinstance(line, LineString) else line
+    factor = 10**precision
+    encoded = bytearray()
+    previous_lat = previous_lng = 0
+    for lng, lat, *_ in positions:
+        lat_value, lng_value = round(lat * factor), round(lng * factor)
+        _append_polyline_value(encoded, lat_value - previous_lat)
+        _append_polyline_value(encoded, lng_value - previous_lng)
+        previous_lat, previous_lng = lat_value, lng_value
+    return encoded.decode("ascii")
+
+
+def decode_polyline(encoded: str | bytes, precision: int = 5) -> LineString:
+    """Decode an encoded polyline into a line string.
+
+    The positions are stored as fixed-point `PackedPositions`, which is
+    lossless for precisions of up to 7 digits and does not build any tuple
+    per position.
+    """
+    _check_precision(precision)
+    data = encoded.encode("ascii") if isinstance(encoded, str) else encoded
+    scale = 10 ** (_FIXED_DIGITS - precision)
+    values: array[int] = array("i")
+    coordinates = [0, 0]
+    axis = result = shift = 0
+    try:
+        for byte in data:
+            byte -= 63
+            if not 0 <= byte < 64:
+                raise ValueError("invalid character in encoded polyline")
+            result |= (byte & 0x1F) << shift
+            if byte & 0x20:
+                shift += 5
+                continue
+            coordinates[axis] += ~(result >> 1) if result & 1 else result >> 1
+            result = shift = 0
+            if axis:
+                # Polylines store the latitude first
+                values.append(coordinates[1] * scale)
+                values.append(coordinates[0] * scale)
+            axis ^= 1
+    except OverflowError:
+        raise ValueError("coordinates must be within [-180, 180, -90, 90]") from None
+    if axis or shift:
+        raise ValueError("truncated encoded polyline")
+    return _line_string(values, 2)
+
+
+def decode_polylines(
+    encoded: Iterable[str | bytes], precision: int = 5
+) -> list[LineString]:
+    """Decode a batch of encoded polylines into line strings."""
+    return [decode_polyline(line, precision) for line in encoded]
+
+
+def encode_delta_varint(geometry: LineString | MultiLineString) -> bytes:
+    """Encode a line string or multi line string as varints of deltas.
+
+    Coordinates are stored like the "fixed" precision of `PackedPositions`,
+    in units of 1e-7 degrees and altitudes in millimeters, as zigzag varints
+    of the difference to the previous position.
+    """
+    lines: Sequence[Sequence[Position]]
+    if isinstance(geometry, LineString):
+        tag, lines = _LINE_STRING_TAG, [geometry.coordinates]
+    else:
+        tag, lines = _MULTI_LINE_STRING_TAG, geometry.coordinates
+    dimensions = next((len(line[0]) for line in lines if line), 2)
+
+    encoded = bytearray()
+    for value in (tag, dimensions, len(lines)):
+        _append_varint(encoded, value)
+    previous = [0] * dimensions
+    for line in lines:
+        _append_varint(encoded, len(line))
+        for axis, value in enumerate(_fixed_values(line, dimensions)):
+            axis %= dimensions
+            delta = value - previous[axis]
+            _append_varint(encoded, delta << 1 if delta >= 0 else ~(delta << 1))
+            previous[axis] = value
+    return bytes(encoded)
+
+
+def decode_delta_varint(data: bytes) -> LineString | MultiLineString:
+    """Decode the output of `encode_delta_varint`."""
+    varints = _read_varints(data)
+    try:
+        tag, dimensions, line_count = [next(varints) for _ in range(3)]
+        if tag not in (_LINE_STRING_TAG, _MULTI_LINE_STRING_TAG):
+            raise ValueError(f"unknown geometry tag {tag}")
+        if dimensions not in (2, 3):
+            raise ValueError("dimensions must be 2 or 3")
+        previous = [0] * dimensions
+        lines: list[LineString] = []
+        for _ in range(line_count):
+            values: array[int] = array("i")
+            for i in range(next(varints) * dimensions):
+                value = next(varints)
+                axis = i % dimensions
+                previous[axis] += ~(value >> 1) if value & 1 else value >> 1
+                values.append(previous[axis])
+            lines.append(_line_string(values, dimensions))
+    except StopIteration:
+        raise ValueError("truncated delta varint data") from None
+    except OverflowError:
+        raise ValueError("coordinates are out of the fixed-point range") from None
+    if next(varints, None) is not None:
+        raise ValueError("unexpected data after the last position")
+
+    if tag == _LINE_STRING_TAG:
+        if len(lines) != 1:
+            raise ValueError("line strings must have exactly one line")
+        return lines[0]
+    return MultiLineString.model_construct(
+        type=GeoJSONObjectType.MULTI_LINE_STRING,
+        coordinates=[line.coordinates for line in lines],
+    )
+
+
+def _check_precision(precision: int) -> None:
+    if not 0 <= precision <= _FIXED_DIGITS:
+        raise ValueError(f"precision must be between 0 and {_FIXED_DIGITS}")
+
+
+def _append_polyline_value(encoded: bytearray, value: int) -> None:
+    value = ~(value << 1) if value < 0 else value << 1
+    while value >= 0x20:
+        encoded.append((0x20 | (value & 0x1F)) + 63)
+        value >>= 5
+    encoded.append(value + 63)
+
+
+def _append_varint(encoded: bytearray, value: int) -> None:
+    while value >= 0x80:
+        encoded.append(0x80 | (value & 0x7F))
+        value >>= 7
+    encoded.append(value)
+
+
+def _read_varints(data: bytes) -> Iterator[int]:
+    result = shift = 0
+    for byte in data:
+        result |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        yield result
+        result = shift = 0
+    if shift:
+        raise ValueError("truncated delta varint data")
+
+
+def _fixed_values(line: Sequence[Position], dimensions: int) -> Iterable[int]:
+    if (
+        isinstance(line, PackedPositions)
+        and line.precision == "fixed"
+        and line.dimensions == dimensions
+    ):
+        return line.values
+    values: list[int] = []
+    for position in line:
+        if len(position) != dimensions:
+            raise ValueError("positions must all have the same number of dimensions")
+        values.extend(round(v * s) for v, s in zip(position, FIXED_SCALES))
+    return values
+
+
+def _line_string(values: array[int], dimensions: int) -> LineString:
+    positions = PackedPositions.from_fixed(values, dimensions)
+    if len(positions) < 2:
+        raise ValueError("line strings must have at least 2 positions")
+    return LineString.model_construct(
+        type=GeoJSONObjectType.LINE_STRING, coordinates=positions
+    )
@@ -0,0 +1,248 @@
+"""Profile parsing GeoJSON with geodantic, plain pydantic models and json.
+
+Run with `geodantic-profile [file ...]`, or `python -m geodantic.profiling`.
+Without files, a synthetic collection of polygons is parsed.
+"""
+
+import argparse
+import cProfile
+import io
+import json
+import pstats
+import time
+import tracemalloc
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated, Any, Literal
+
+import pydantic
+
+from geodantic.features import Feature, FeatureCollection
+from geodantic.geometries import Geometry
+
+# Mirrors of the geodantic models without the constraints of the types
+# module, to tell their cost apart from the cost of pydantic itself
+type _PlainPosition = tuple[float, float] | tuple[float, float, float]
+
+
+class _PlainPoint(pydantic.BaseModel, frozen=True):
+    type: Literal["Point"]
+    coordinates: _PlainPosition
+    bbox: tuple[float, ...] | None = None
+
+
+class _PlainMultiPoint(pydantic.BaseModel, frozen=True):
+    type: Literal["MultiPoint"]
+    coordinates: Sequence[_PlainPosition]
+    bbox: tuple[float, ...] | None = None
+
+
+class _PlainLineString(pydantic.BaseModel, frozen=True):
+    type: Literal["LineString"]
+    coordinates: Sequence[_PlainPosition]
+    bbox: tuple[float, ...] | None = None
+
+
+class _PlainMultiLineString(pydantic.BaseModel, frozen=True):
+    type: Literal["MultiLineString"]
+    coordinates: Sequence[Sequence[_PlainPosition]]
+    bbox: tuple[float, ...] | None = None
+
+
+class _PlainPolygon(pydantic.BaseModel, frozen=True):
+    type: Literal["Polygon"]
+    coordinates: Sequence[Sequence[_PlainPosition]]
+    bbox: tuple[float, ...] | None = None
+
+
+class _PlainMultiPolygon(pydantic.BaseModel, frozen=True):
+    type: Literal["MultiPolygon"]
+    coordinates: Sequence[Sequence[Sequence[_PlainPosition]]]
+    bbox: tuple[float, ...] | None = None
+
+
+class _PlainGeometryCollection(pydantic.BaseModel, frozen=True):
+    type: Literal["GeometryCollection"]
+    geometries: Sequence["_PlainGeometry"]
+    bbox: tuple[float, ...] | None = None
+
+
+type _PlainGeometry = Annotated[
+    _PlainPoint
+    | _PlainMultiPoint
+    | _PlainLineString
+    | _PlainMultiLineString
+    | _PlainPolygon
+    | _PlainMultiPolygon
+    | _PlainGeometryCollection,
+    pydantic.Field(discriminator="type"),
+]
+
+
+class _PlainFeature(pydantic.BaseModel, frozen=True):
+    type: Literal["Feature"]
+    geometry: _PlainGeometry | None
+    properties: dict[str, Any] | None
+    id: str | int | None = None
+    bbox: tuple[float, ...] | None = None
+
+
+class _PlainFeatureCollection(pydantic.BaseModel, frozen=True):
+    type: Literal["FeatureCollection"]
+    features: Sequence[_PlainFeature]
+    bbox: tuple[float, ...] | None = None
+
+
+_GeodanticFeatureCollection = FeatureCollection[
+    Feature[Geometry | None, dict[str, Any] | None]
+]
+
+_STAGES: dict[str, Callable[[bytes], Any]] = {
+    "json.loads": json.loads,
+    "pydantic": _PlainFeatureCollection.model_validate_json,
+    "geodantic": _GeodanticFeatureCollection.model_validate_json,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _Measurement:
+    seconds: float
+    retained_bytes: int
+    retained_blocks: int
+    peak_bytes: int
+
+
+def _measure(parse: Callable[[bytes], Any], data: bytes, repeat: int) -> _Measurement:
+    # Time without tracing, which slows allocations down
+    seconds = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        parse(data)
+        seconds = min(seconds, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        result = parse(data)
+        snapshot = _snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    statistics = snapshot.statistics("filename")
+    return _Measurement(
+        seconds=seconds,
+        retained_bytes=sum(s.size for s in statistics),
+        retained_blocks=sum(s.count for s in statistics),
+        peak_bytes=peak,
+    )
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    # Leaves out the allocations of tracemalloc itself
+    return tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+    )
+
+
+def _hot_functions(parse: Callable[[bytes], Any], data: bytes, top: int) -> str:
+    profile = cProfile.Profile()
+    profile.runcall(parse, data)
+    output = io.StringIO()
+    pstats.Stats(profile, stream=output).sort_stats("cumulative").print_stats(top)
+    return output.getvalue()
+
+
+def _hot_allocations(parse: Callable[[bytes], Any], data: bytes, top: int) -> str:
+    tracemalloc.start()
+    try:
+        result = parse(data)
+        snapshot = _snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    return "\n".join(str(s) for s in snapshot.statistics("lineno")[:top])
+
+
+def _sample(count: int) -> bytes:
+    return json.dumps(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "Polygon",
+                        "coordinates": [
+                            [
+                                [i % 170, i % 80],
+                                [i % 170 + 1, i % 80],
+                                [i % 170 + 1, i % 80 + 1],
+                                [i % 170, i % 80],
+                            ]
+                        ],
+                    },
+                    "properties": {"name": f"feature {i}", "value": i},
+                }
+                for i in range(count)
+            ],
+        }
+    ).encode()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="geodantic-profile",
+        description="Compare the cost of parsing GeoJSON feature collections "
+        "with geodantic, with plain pydantic models and with json.loads.",
+    )
+    parser.add_argument("files", nargs="*", type=Path, help="GeoJSON files")
+    parser.add_argument(
+        "--features",
+        type=int,
+        default=10_000,
+        help="number of features of the synthetic sample used without files",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timed runs per stage, best is kept"
+    )
+    parser.add_argument(
+        "--top", type=int, default=15, help="hot functions and allocations shown"
+    )
+    parser.add_argument(
+        "--no-breakdown",
+        action="store_true",
+        help="skip the cProfile and tracemalloc breakdown of geodantic",
+    )
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    samples = [(str(path), path.read_bytes()) for path in args.files]
+    if not samples:
+        samples = [(f"synthetic {args.features} polygons", _sample(args.features))]
+
+    for name, data in samples:
+        print(f"{name} ({len(data) / 1e6:.1f} MB)")
+        print(
+            f"  {'stage':<10} {'time':>10} {'retained':>12} {'blocks':>10} {'peak':>12}"
+        )
+        for stage, parse in _STAGES.items():
+            m = _measure(parse, data, args.repeat)
+            print(
+                f"  {stage:<10} {m.seconds * 1e3:>8.1f}ms"
+                f" {m.retained_bytes / 1e6:>10.1f}MB {m.retained_blocks:>10}"
+                f" {m.peak_bytes / 1e6:>10.1f}MB"
+            )
+        if not args.no_breakdown:
+            geodantic = _STAGES["geodantic"]
+            print("\nHot functions of geodantic")
+            print(_hot_functions(geodantic, data, args.top))
+            print("Largest allocations retained by geodantic")
+            print(_hot_allocations(geodantic, data, args.top))
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,49 @@
+import math
+from array import array
+from collections.abc import Callable, Sequence
+
+# Transforms map arrays of x and y coordinates to sequences of the same
+# length, like `pyproj.Transformer.transform` does
+type CoordinateTransform = Callable[
+    [array[float], array[float]], tuple[Sequence[float], Sequence[float]]
+]
+
+# Semi-major axis of WGS84, which EPSG:3857 uses as the radius of the sphere
+_EARTH_RADIUS = 6378137.0
+
+# Web Mercator tiles stop at the latitude which makes the world square
+MAX_MERCATOR_LATITUDE = math.degrees(math.atan(math.sinh(math.pi)))
+
+
+def web_mercator(
+    xs: array[float], ys: array[float]
+) -> tuple[array[float], array[float]]:
+    scale = math.radians(_EARTH_RADIUS)
+    limit = MAX_MERCATOR_LATITUDE
+    return (
+        array("d", [x * scale for x in xs]),
+        array(
+            "d",
+            [
+                _EARTH_RADIUS
+                * math.asinh(math.tan(math.radians(max(min(y, limit), -limit))))
+                for y in ys
+            ],
+        ),
+    )
+
+
+def affine(
+    matrix: tuple[float, float, float, float, float, float],
+) -> CoordinateTransform:
+    a, b, d, e, x_offset, y_offset = matrix
+
+    def transform(
+        xs: array[float], ys: array[float]
+    ) -> tuple[array[float], array[float]]:
+        return (
+            array("d", [a * x + b * y + x_offset for x, y in zip(xs, ys)]),
+            array("d", [d * x + e * y + y_offset for x, y in zip(xs, ys)]),
+        )
+
+    return transform
@@ -0,0 +1,83 @@
+import sys
+import threading
+import weakref
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+import pydantic
+from pydantic_core import core_schema
+
+
+class _PropertySchema:
+    __slots__ = ("keys", "index", "__weakref__")
+
+    def __init__(self, keys: tuple[str, ...]) -> None:
+        self.keys = tuple(sys.intern(key) for key in keys)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+
+
+# Schemas are shared by all records with the same keys in the same order,
+# and dropped once no record uses them anymore
+_schemas: weakref.WeakValueDictionary[tuple[str, ...], _PropertySchema] = (
+    weakref.WeakValueDictionary()
+)
+_schemas_lock = threading.Lock()
+
+
+def _schema_for(keys: tuple[str, ...]) -> _PropertySchema:
+    schema = _schemas.get(keys)
+    if schema is None:
+        with _schemas_lock:
+            schema = _schemas.setdefault(keys, _PropertySchema(keys))
+    return schema
+
+
+class CompactProperties(Mapping[str, Any]):
+    """Read-only feature properties stored as a tuple of values.
+
+    The keys are interned and kept in a schema that is shared by all
+    properties with the same keys, so repeated keys cost no memory per
+    feature. Use it as the properties type of a `Feature`.
+    """
+
+    __slots__ = ("_schema", "_values")
+
+    def __init__(self, properties: Mapping[str, Any] | None = None, /) -> None:
+        properties = properties or {}
+        self._schema = _schema_for(tuple(properties))
+        self._values = tuple(properties.values())
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[self._schema.index[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema.keys)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._schema.index
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(zip(self._schema.keys, self._values))
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: pydantic.GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        from_mapping = core_schema.no_info_after_validator_function(
+            cls, core_schema.dict_schema(core_schema.str_schema())
+        )
+        return core_schema.json_or_python_schema(
+            json_schema=from_mapping,
+            python_schema=core_schema.union_schema(
+                [core_schema.is_instance_schema(cls), from_mapping]
+            ),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls.to_dict, return_schema=core_schema.dict_schema()
+            ),
+        )
@@ -0,0 +1,101 @@
+from bisect import bisect_right
+from collections.abc import Iterator, Sequence
+from itertools import accumulate, chain, islice
+from typing import cast, overload
+
+
+class SequenceView[T](Sequence[T]):
+    # Read-only views compare equal to any sequence with the same items,
+    # so that they can stand in for lists in model fields
+    __slots__ = ()
+    __hash__ = None  # type: ignore[assignment]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str | bytes):
+            return NotImplemented
+        other_items = cast(Sequence[object], other)
+        return len(self) == len(other_items) and all(
+            a == b for a, b in zip(self, other_items)
+        )
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class ConcatenatedSequence[T](SequenceView[T]):
+    __slots__ = ("_parts", "_ends")
+    _parts: tuple[Sequence[T], ...]
+    _ends: list[int]
+
+    def __init__(self, parts: Sequence[Sequence[T]]) -> None:
+        flattened: list[Sequence[T]] = []
+        for part in parts:
+            if isinstance(part, ConcatenatedSequence):
+                flattened.extend(part._parts)
+            elif part:
+                flattened.append(part)
+        self._parts = tuple(flattened)
+        self._ends = list(accumulate(len(part) for part in self._parts))
+
+    def __len__(self) -> int:
+        return self._ends[-1] if self._ends else 0
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | Sequence[T]:
+        if isinstance(index, slice):
+            return SlicedSequence(self, range(len(self))[index])
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index out of range")
+        part = bisect_right(self._ends, index)
+        start = self._ends[part - 1] if part else 0
+        return self._parts[part][index - start]
+
+    def __iter__(self) -> Iterator[T]:
+        return chain.from_iterable(self._parts)
+
+
+class SlicedSequence[T](SequenceView[T]):
+    __slots__ = ("_base", "_indices")
+    _base: Sequence[T]
+    _indices: range
+
+    def __init__(self, base: Sequence[T], indices: range) -> None:
+        if isinstance(base, SlicedSequence):
+            # Map the indices into the base range instead of nesting views
+            outer = base._indices
+            indices = range(
+                outer.start + indices.start * outer.step,
+                outer.start + indices.stop * outer.step,
+                outer.step * indices.step,
+            )
+            base = base._base
+        self._base = base
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | Sequence[T]:
+        if isinstance(index, slice):
+            return SlicedSequence(self._base, self._indices[index])
+        return self._base[self._indices[index]]
+
+    def __iter__(self) -> Iterator[T]:
+        # Other bases may build their items on access, so skipped items are
+        # not iterated over
+        if self._indices.step == 1 and isinstance(self._base, list):
+            return islice(self._base, self._indices.start, self._indices.stop)
+        return (self._base[i] for i in self._indices)
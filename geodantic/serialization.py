@@ -0,0 +1,201 @@
+import gzip
+import os
+from collections.abc import Iterable, Mapping
+from io import BytesIO
+from types import TracebackType
+from typing import Any, BinaryIO, Protocol, Self, cast
+
+import pydantic
+import pydantic_core
+
+from geodantic.features import Feature, FeatureCollection, bbox_adapter
+from geodantic.geometries import GeometryCollection
+from geodantic.types import BoundingBox, GeoJSONObjectType
+
+
+class _GeoJSON(Protocol):
+    # Geometries, features and feature collections
+
+    @property
+    def type(self) -> GeoJSONObjectType: ...
+
+    @property
+    def bbox(self) -> BoundingBox | None: ...
+
+
+class _Writable(Protocol):
+    def write(self, data: bytes, /) -> object: ...
+
+    def flush(self) -> object: ...
+
+
+def write_geojson(obj: _GeoJSON, stream: _Writable | bytearray) -> None:
+    """Write an object as minimal GeoJSON to a binary stream or bytearray.
+
+    Members which are not set are left out instead of being written as null,
+    except for the geometry and properties of features, which GeoJSON
+    requires. Features of collections are written one at a time.
+    """
+    write = stream.extend if isinstance(stream, bytearray) else stream.write
+    if isinstance(obj, FeatureCollection):
+        write(b'{"type":"FeatureCollection"')
+        if obj.bbox is not None:
+            write(b',"bbox":' + pydantic_core.to_json(obj.bbox))
+        write(b',"features":[')
+        separator = b""
+        for feature in obj.features:
+            write(separator + _feature_json(feature))
+            separator = b","
+        write(b"]}")
+    elif isinstance(obj, Feature):
+        write(_feature_json(obj))
+    else:
+        write(_geometry_json(obj))
+
+
+def dump_geojson(obj: _GeoJSON) -> bytes:
+    """Serialize an object as minimal GeoJSON, like `write_geojson`."""
+    stream = BytesIO()
+    write_geojson(obj, stream)
+    return stream.getvalue()
+
+
+class FeatureCollectionWriter:
+    """Write a feature collection to a file or stream one feature at a time.
+
+    Features are serialized like `write_geojson` and buffered up to
+    `buffer_size` bytes, so memory stays bounded whatever the number of
+    features. The target is a path, which is opened and closed by the
+    writer, or a binary stream, such as `socket.makefile("wb")`, which is
+    left open. With `compress`, the output is gzip compressed.
+
+    Use it as a context manager, or call `close` to end the collection. If
+    the context exits with an exception, the collection is left unclosed,
+    so that readers do not mistake it for a complete one.
+    """
+
+    def __init__(
+        self,
+        target: str | os.PathLike[str] | _Writable,
+        *,
+        bbox: BoundingBox | None = None,
+        compress: bool = False,
+        compresslevel: int = 6,
+        buffer_size: int = 1 << 16,
+    ) -> None:
+        if bbox is not None:
+            bbox = bbox_adapter.validate_python(bbox)
+        stream: _Writable
+        self._file: BinaryIO | None = None
+        if isinstance(target, str | os.PathLike):
+            self._file = stream = open(target, "wb")
+        else:
+            stream = target
+        self._output = stream
+        self._gzip: gzip.GzipFile | None = None
+        if compress:
+            self._gzip = stream = gzip.GzipFile(
+                fileobj=stream, mode="wb", compresslevel=compresslevel
+            )
+        self._stream = stream
+        self._buffer_size = buffer_size
+        self._buffer = bytearray(b'{"type":"FeatureCollection"')
+        if bbox is not None:
+            self._buffer += b',"bbox":' + pydantic_core.to_json(bbox)
+        self._buffer += b',"features":['
+        self._count = 0
+        self._closed = False
+
+    def __len__(self) -> int:
+        return self._count
+
+    def write(self, feature: object) -> None:
+        # Checked at runtime, since a partial feature would corrupt the stream
+        if self._closed:
+            raise ValueError("writer is closed")
+        if not isinstance(feature, Feature):
+            raise TypeError(f"expected a Feature, got {type(feature).__name__}")
+        if self._count:
+            self._buffer += b","
+        self._buffer += _feature_json(feature)
+        self._count += 1
+        if len(self._buffer) >= self._buffer_size:
+            self._flush()
+
+    def write_all(self, features: Iterable["Feature[Any, Any]"]) -> None:
+        for feature in features:
+            self.write(feature)
+
+    def close(self) -> None:
+        if not self._closed:
+            self._buffer += b"]}"
+            self._finish()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        elif not self._closed:
+            self._finish()
+
+    def _flush(self) -> None:
+        self._stream.write(bytes(self._buffer))
+        self._buffer.clear()
+
+    def _finish(self) -> None:
+        self._closed = True
+        self._flush()
+        if self._gzip is not None:
+            self._gzip.close()
+        if self._file is not None:
+            self._file.close()
+        else:
+            self._output.flush()
+
+
+def _feature_json(feature: "Feature[Any, Any]") -> bytes:
+    parts = [b'{"type":"Feature"']
+    if feature.bbox is not None:
+        parts.append(b',"bbox":' + pydantic_core.to_json(feature.bbox))
+    parts.append(b',"geometry":')
+    parts.append(
+        b"null" if feature.geometry is None else _geometry_json(feature.geometry)
+    )
+    parts.append(b',"properties":')
+    parts.append(_properties_json(feature.properties))
+    if feature.id is not None:
+        parts.append(b',"id":' + pydantic_core.to_json(feature.id))
+    parts.append(b"}")
+    return b"".join(parts)
+
+
+def _geometry_json(geometry: Any) -> bytes:
+    parts = [b'{"type":"', geometry.type.encode(), b'"']
+    if geometry.bbox is not None:
+        parts.append(b',"bbox":' + pydantic_core.to_json(geometry.bbox))
+    if isinstance(geometry, GeometryCollection):
+        parts.append(b',"geometries":[')
+        parts.append(b",".join(_geometry_json(child) for child in geometry.geometries))
+        parts.append(b"]}")
+    else:
+        parts.append(b',"coordinates":')
+        parts.append(pydantic_core.to_json(geometry.coordinates))
+        parts.append(b"}")
+    return b"".join(parts)
+
+
+def _properties_json(properties: Any) -> bytes:
+    if properties is None:
+        return b"null"
+    if isinstance(properties, pydantic.BaseModel):
+        return properties.model_dump_json().encode()
+    if not isinstance(properties, dict) and isinstance(properties, Mapping):
+        return pydantic_core.to_json(dict(cast(Mapping[str, Any], properties)))
+    return pydantic_core.to_json(properties)
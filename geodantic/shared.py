@@ -0,0 +1,284 @@
+import json
+import struct
+import sys
+from array import array
+from collections.abc import Iterator, Sequence
+from itertools import chain
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Self, overload
+
+from geodantic.features import Feature, FeatureCollection
+from geodantic.geometries import (
+    GEOMETRY_CLASSES,
+    NESTING,
+    Geometry,
+    flatten_coordinates,
+    unflatten_coordinates,
+)
+from geodantic.sequences import SequenceView
+from geodantic.types import GeoJSONObjectType, Position
+
+# A model class rather than a type statement, since older pydantic versions
+# cannot parametrize generic models with type aliases
+SharedFeature = Feature[Geometry | None, dict[str, Any] | None]
+
+_MAGIC = b"GEOSHM01"
+# Magic, feature count and the byte sizes of the table, coordinate,
+# structure and blob sections. The sections are in native byte order, as
+# shared memory is only read on the host which wrote it
+_HEADER = struct.Struct("<8s5Q")
+
+# Geometry type codes, besides the indexes in _TYPES
+_NO_GEOMETRY = -1
+_JSON_GEOMETRY = -2
+_TYPES = list(GEOMETRY_CLASSES)
+
+# Per feature: geometry type code, dimensions and the start and end of its
+# coordinates, structure and blob
+_FIELDS = 8
+
+# Segments created by this process, which stay registered for cleanup
+_created: set[str] = set()
+
+
+class SharedFeatureCollection:
+    """Features stored once in shared memory and read from any process.
+
+    Coordinates are stored as float64 values, the nesting of the geometries
+    as lengths of their parts, and ids, properties and bboxes as JSON.
+    Features are materialized on each access, so every process only holds
+    the features it uses. Geometry collections are stored as JSON.
+
+    The creating process owns the segment and must `unlink` it once no
+    process needs it anymore. Other processes `attach` to it by name.
+    """
+
+    __slots__ = ("_memory", "_table", "_coords", "_structure", "_blob", "_count")
+
+    def __init__(self, memory: shared_memory.SharedMemory) -> None:
+        buffer = _buffer(memory)
+        magic, count, table, coords, structure, blob = _HEADER.unpack_from(buffer)
+        if magic != _MAGIC:
+            raise ValueError("shared memory does not hold a feature collection")
+        self._memory = memory
+        self._count: int = count
+        view = buffer.toreadonly()
+        table_end = _HEADER.size + table
+        coords_end = table_end + coords
+        structure_end = coords_end + structure
+        self._table = view[_HEADER.size : table_end].cast("q")
+        self._coords = view[table_end:coords_end].cast("d")
+        self._structure = view[coords_end:structure_end].cast("q")
+        self._blob = view[structure_end : structure_end + blob]
+
+    @classmethod
+    def create(
+        cls, collection: "FeatureCollection[Any]", *, name: str | None = None
+    ) -> Self:
+        table: array[int] = array("q")
+        coords: array[float] = array("d")
+        structure: array[int] = array("q")
+        blob = bytearray()
+        for feature in collection.features:
+            extra = feature.model_dump(
+                mode="json", include={"id", "properties", "bbox"}, exclude_unset=True
+            )
+            geometry = feature.geometry
+            code = _NO_GEOMETRY
+            dimensions = 0
+            coords_start, structure_start = len(coords), len(structure)
+            if geometry is not None:
+                if geometry.bbox is not None:
+                    extra["geometry_bbox"] = geometry.bbox
+                if geometry.type in NESTING:
+                    code = _TYPES.index(geometry.type)
+                    positions: list[Position] = []
+                    flatten_coordinates(
+                        geometry.coordinates,
+                        NESTING[geometry.type],
+                        positions,
+                        structure,
+                    )
+                    dimensions = len(positions[0]) if positions else 2
+                    if any(len(p) != dimensions for p in positions):
+                        raise ValueError(
+                            "positions must all have the same number of dimensions"
+                        )
+                    coords.extend(chain.from_iterable(positions))
+                else:
+                    code = _JSON_GEOMETRY
+                    extra["geometry"] = geometry.model_dump(
+                        mode="json", exclude_unset=True
+                    )
+            blob_start = len(blob)
+            blob.extend(json.dumps(extra, separators=(",", ":")).encode())
+            table.extend(
+                (
+                    code,
+                    dimensions,
+                    coords_start,
+                    len(coords),
+                    structure_start,
+                    len(structure),
+                    blob_start,
+                    len(blob),
+                )
+            )
+
+        sections = [memoryview(s).cast("B") for s in (table, coords, structure)]
+        sections.append(memoryview(blob))
+        header = _HEADER.pack(
+            _MAGIC, len(collection.features), *(s.nbytes for s in sections)
+        )
+        size = len(header) + sum(s.nbytes for s in sections)
+        memory = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _created.add(memory.name)
+        buffer = _buffer(memory)
+        buffer[: len(header)] = header
+        offset = len(header)
+        for section in sections:
+            buffer[offset : offset + section.nbytes] = section
+            offset += section.nbytes
+            section.release()
+        return cls(memory)
+
+    @classmethod
+    def attach(cls, name: str) -> Self:
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name=name)
+            # Attaching registers the segment with the resource tracker, which
+            # would unlink it when this process exits
+            if memory.name not in _created:
+                resource_tracker.unregister(
+                    memory._name, "shared_memory"  # type: ignore[attr-defined]
+                )
+        return cls(memory)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def features(self) -> Sequence[SharedFeature]:
+        return _SharedFeatures(
+            self._count, self._table, self._coords, self._structure, self._blob
+        )
+
+    def to_collection(self) -> FeatureCollection[SharedFeature]:
+        """A collection whose features are materialized on each access."""
+        return FeatureCollection[SharedFeature].model_construct(
+            type=GeoJSONObjectType.FEATURE_COLLECTION, features=self.features
+        )
+
+    def close(self) -> None:
+        for view in (self._table, self._coords, self._structure, self._blob):
+            view.release()
+        self._memory.close()
+
+    def unlink(self) -> None:
+        self._memory.unlink()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+
+class _SharedFeatures(SequenceView[SharedFeature]):
+    # Holds the views of the collection, which are released when it is closed
+    __slots__ = ("_count", "_table", "_coords", "_structure", "_blob")
+
+    def __init__(
+        self,
+        count: int,
+        table: "memoryview[int]",
+        coords: "memoryview[float]",
+        structure: "memoryview[int]",
+        blob: "memoryview[int]",
+    ) -> None:
+        self._count = count
+        self._table = table
+        self._coords = coords
+        self._structure = structure
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> SharedFeature: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[SharedFeature]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> SharedFeature | Sequence[SharedFeature]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index out of range")
+        return self._feature(index)
+
+    def __iter__(self) -> Iterator[SharedFeature]:
+        return map(self._feature, range(len(self)))
+
+    def _feature(self, index: int) -> SharedFeature:
+        start = index * _FIELDS
+        (
+            code,
+            dimensions,
+            coords_start,
+            coords_end,
+            structure_start,
+            structure_end,
+            blob_start,
+            blob_end,
+        ) = self._table[start : start + _FIELDS].tolist()
+        extra = json.loads(self._blob[blob_start:blob_end].tobytes())
+
+        geometry: Any = None
+        if code == _JSON_GEOMETRY:
+            geometry = (
+                Feature[Geometry | None, None]
+                .model_validate(
+                    {
+                        "type": GeoJSONObjectType.FEATURE,
+                        "geometry": extra.pop("geometry"),
+                        "properties": None,
+                    }
+                )
+                .geometry
+            )
+        elif code != _NO_GEOMETRY:
+            geometry_type = _TYPES[code]
+            values = iter(self._coords[coords_start:coords_end].tolist())
+            positions: Iterator[Any] = zip(*[values] * dimensions)
+            lengths = iter(self._structure[structure_start:structure_end].tolist())
+            coordinates = unflatten_coordinates(
+                positions, NESTING[geometry_type], lengths
+            )
+            fields: dict[str, Any] = {"type": geometry_type, "coordinates": coordinates}
+            if "geometry_bbox" in extra:
+                fields["bbox"] = tuple(extra.pop("geometry_bbox"))
+            geometry = GEOMETRY_CLASSES[geometry_type].model_construct(**fields)
+        if "bbox" in extra:
+            extra["bbox"] = tuple(extra["bbox"])
+
+        return Feature[Geometry | None, dict[str, Any] | None].model_construct(
+            type=GeoJSONObjectType.FEATURE, geometry=geometry, **extra
+        )
+
+
+def _buffer(memory: shared_memory.SharedMemory) -> memoryview:
+    if memory.buf is None:
+        raise ValueError("shared memory is closed")
+    return memory.buf
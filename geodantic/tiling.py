@@ -0,0 +1,118 @@
+import math
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple
+
+from geodantic import antimeridian
+from geodantic.geometries import Geometry, GeometryCollection, Point
+from geodantic.projections import MAX_MERCATOR_LATITUDE
+
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+class TileKey(NamedTuple):
+    """Key of an XYZ Web Mercator tile."""
+
+    zoom: int
+    x: int
+    y: int
+
+
+def geometry_centers(
+    geometries: Iterable[Geometry | None],
+) -> list[tuple[float, float] | None]:
+    # Points are keyed by their position and other geometries by the center
+    # of their bbox, None for missing or empty geometries
+    centers: list[tuple[float, float] | None] = []
+    for geometry in geometries:
+        if isinstance(geometry, Point):
+            x, y, *_ = geometry.coordinates
+            centers.append((x, y))
+            continue
+        extent = None
+        if geometry is not None:
+            extent = _extent(geometry) if geometry.bbox is None else geometry.bbox
+        if extent is None:
+            centers.append(None)
+        else:
+            middle = len(extent) // 2
+            centers.append(
+                (
+                    antimeridian.center_longitude(extent[0], extent[middle]),
+                    (extent[1] + extent[middle + 1]) / 2,
+                )
+            )
+    return centers
+
+
+def _extent(geometry: Geometry) -> tuple[float, float, float, float] | None:
+    xs: list[float] = []
+    ys: list[float] = []
+    stack: list[Any] = [geometry]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, GeometryCollection):
+            stack.extend(item.geometries)
+        elif hasattr(item, "coordinates"):
+            stack.append(item.coordinates)
+        elif item and isinstance(item[0], int | float):
+            xs.append(item[0])
+            ys.append(item[1])
+        else:
+            stack.extend(item)
+    if not xs:
+        return None
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def geohashes(
+    centers: Sequence[tuple[float, float] | None], precision: int
+) -> list[str | None]:
+    if not 1 <= precision <= 12:
+        raise ValueError("precision must be between 1 and 12")
+    bits = 5 * precision
+    lon_bits, lat_bits = (bits + 1) // 2, bits // 2
+    lon_cells, lat_cells = 1 << lon_bits, 1 << lat_bits
+    result: list[str | None] = []
+    for center in centers:
+        if center is None:
+            result.append(None)
+            continue
+        lon, lat = center
+        x = min(int((lon + 180) / 360 * lon_cells), lon_cells - 1)
+        y = min(int((lat + 90) / 180 * lat_cells), lat_cells - 1)
+        # Interleave the bits, starting with the longitude
+        code = 0
+        for i in range(bits):
+            if i % 2 == 0:
+                bit = x >> (lon_bits - 1 - i // 2) & 1
+            else:
+                bit = y >> (lat_bits - 1 - i // 2) & 1
+            code = code << 1 | bit
+        result.append(
+            "".join(
+                _GEOHASH_ALPHABET[code >> shift & 0x1F]
+                for shift in range(bits - 5, -1, -5)
+            )
+        )
+    return result
+
+
+def tile_keys(
+    centers: Sequence[tuple[float, float] | None], zoom: int
+) -> list[TileKey | None]:
+    if not 0 <= zoom <= 30:
+        raise ValueError("zoom must be between 0 and 30")
+    tiles = 1 << zoom
+    result: list[TileKey | None] = []
+    for center in centers:
+        if center is None:
+            result.append(None)
+            continue
+        lon, lat = center
+        lat = max(min(lat, MAX_MERCATOR_LATITUDE), -MAX_MERCATOR_LATITUDE)
+        x = int((lon + 180) / 360 * tiles)
+        y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * tiles)
+        result.append(
+            TileKey(zoom, min(max(x, 0), tiles - 1), min(max(y, 0), tiles - 1))
+        )
+    return result
@@ -0,0 +1,341 @@
+import json
+from collections.abc import Mapping, Sequence
+from typing import Any, cast
+
+from geodantic.features import FeatureCollection
+from geodantic.geometries import NESTING
+from geodantic.types import GeoJSONObjectType
+
+type _Position = tuple[float, ...]
+
+# Nesting level of the lines in the coordinates, and whether they are rings
+_LINES = {
+    GeoJSONObjectType.LINE_STRING: (0, False),
+    GeoJSONObjectType.MULTI_LINE_STRING: (1, False),
+    GeoJSONObjectType.POLYGON: (1, True),
+    GeoJSONObjectType.MULTI_POLYGON: (2, True),
+}
+
+
+class _ArcIndex:
+    # Collects lines and rings, then cuts them into arcs at the junctions
+    # where they meet, storing every arc once whatever its direction
+    __slots__ = ("_lines",)
+
+    def __init__(self) -> None:
+        self._lines: list[tuple[list[_Position], bool, list[int]]] = []
+
+    def add(self, positions: list[_Position], ring: bool) -> list[int]:
+        # The returned arc references are filled in by `build`
+        refs: list[int] = []
+        self._lines.append((positions, ring, refs))
+        return refs
+
+    def build(self) -> list[list[_Position]]:
+        junctions = self._junctions()
+        arcs: list[list[_Position]] = []
+        ids: dict[tuple[_Position, ...], int] = {}
+        for positions, ring, refs in self._lines:
+            for piece in _cut(positions, ring, junctions):
+                key = tuple(piece)
+                if key in ids:
+                    refs.append(ids[key])
+                elif key[::-1] in ids:
+                    refs.append(~ids[key[::-1]])
+                else:
+                    ids[key] = len(arcs)
+                    refs.append(len(arcs))
+                    arcs.append(piece)
+        return arcs
+
+    def _junctions(self) -> set[_Position]:
+        # A position is a junction if it is the end of a line, or if it is
+        # not always visited between the same two neighbours
+        neighbours: dict[_Position, tuple[_Position, _Position]] = {}
+        junctions: set[_Position] = set()
+        for positions, ring, _ in self._lines:
+            if ring:
+                points = positions[:-1]
+            else:
+                points = positions
+                junctions.add(points[0])
+                junctions.add(points[-1])
+            count = len(points)
+            for i, point in enumerate(points):
+                if not ring and (i == 0 or i == count - 1):
+                    continue
+                previous, following = points[i - 1], points[(i + 1) % count]
+                pair = (
+                    (previous, following)
+                    if previous <= following
+                    else (following, previous)
+                )
+                if neighbours.setdefault(point, pair) != pair:
+                    junctions.add(point)
+        return junctions
+
+
+def _cut(
+    positions: list[_Position], ring: bool, junctions: set[_Position]
+) -> list[list[_Position]]:
+    if ring:
+        points = positions[:-1]
+        starts = [i for i, point in enumerate(points) if point in junctions]
+        # Rings without junctions start at their smallest position, so that
+        # equal rings produce equal arcs whatever their first position
+        start = starts[0] if starts else points.index(min(points))
+        points = points[start:] + points[:start]
+        positions = [*points, points[0]]
+        if not starts:
+            return [positions]
+
+    pieces: list[list[_Position]] = []
+    start = 0
+    for i in range(1, len(positions) - 1):
+        if positions[i] in junctions:
+            pieces.append(positions[start : i + 1])
+            start = i
+    pieces.append(positions[start:])
+    return pieces
+
+
+class _Quantizer:
+    __slots__ = ("scale", "translate")
+
+    def __init__(self, positions: Sequence[_Position], quantization: int) -> None:
+        if quantization < 2:
+            raise ValueError("quantization must be at least 2")
+        if positions:
+            x0, y0 = min(p[0] for p in positions), min(p[1] for p in positions)
+            x1, y1 = max(p[0] for p in positions), max(p[1] for p in positions)
+        else:
+            x0 = y0 = x1 = y1 = 0.0
+        self.translate = (x0, y0)
+        self.scale = (
+            (x1 - x0) / (quantization - 1) or 1.0,
+            (y1 - y0) / (quantization - 1) or 1.0,
+        )
+
+    def __call__(self, position: Sequence[float]) -> _Position:
+        x, y, *rest = position
+        return (
+            round((x - self.translate[0]) / self.scale[0]),
+            round((y - self.translate[1]) / self.scale[1]),
+            *rest,
+        )
+
+
+def to_topojson(
+    collection: "FeatureCollection[Any]",
+    *,
+    quantization: int | None = None,
+    name: str = "features",
+) -> dict[str, Any]:
+    """Convert a feature collection to a TopoJSON topology.
+
+    Lines and rings are cut into arcs where they meet, and arcs shared by
+    several geometries are stored once. If `quantization` is given,
+    positions are snapped to a grid of that many steps across the extent of
+    the collection and arcs are delta-encoded. Bounding boxes are not kept.
+    """
+    quantize: Any = tuple
+    transform = None
+    if quantization is not None:
+        quantize = _Quantizer(_all_positions(collection), quantization)
+        transform = {
+            "scale": list(quantize.scale),
+            "translate": list(quantize.translate),
+        }
+
+    index = _ArcIndex()
+    geometries: list[dict[str, Any]] = []
+    for feature in collection.features:
+        encoded = _encode(feature.geometry, index, quantize)
+        encoded.update(
+            feature.model_dump(
+                mode="json", include={"id", "properties"}, exclude_unset=True
+            )
+        )
+        geometries.append(encoded)
+
+    arcs = index.build()
+    topology: dict[str, Any] = {"type": "Topology"}
+    if transform is not None:
+        topology["transform"] = transform
+    topology["objects"] = {
+        name: {"type": "GeometryCollection", "geometries": geometries}
+    }
+    topology["arcs"] = [
+        _delta_encode(arc) if transform is not None else [list(p) for p in arc]
+        for arc in arcs
+    ]
+    return topology
+
+
+def from_topojson[FeatureCollectionT: FeatureCollection[Any]](
+    model: type[FeatureCollectionT],
+    data: str | bytes | Mapping[str, Any],
+    *,
+    name: str | None = None,
+) -> FeatureCollectionT:
+    """Parse an object of a TopoJSON topology as a feature collection.
+
+    `name` selects the object and may be omitted if there is only one.
+    """
+    raw: Any = json.loads(data) if isinstance(data, str | bytes) else data
+    if not isinstance(raw, Mapping):
+        raise ValueError("data must be a TopoJSON topology")
+    topology = cast(Mapping[str, Any], raw)
+    if topology.get("type") != "Topology":
+        raise ValueError("data must be a TopoJSON topology")
+    objects: Mapping[str, Any] = topology.get("objects", {})
+    if name is None:
+        if len(objects) != 1:
+            raise ValueError("name is required unless there is exactly one object")
+        (name,) = objects
+    if name not in objects:
+        raise ValueError(f"topology has no object named {name!r}")
+
+    transform: Mapping[str, Any] | None = topology.get("transform")
+    raw_arcs: list[list[list[float]]] = topology.get("arcs", [])
+    arcs = [_decode_arc(arc, transform) for arc in raw_arcs]
+    obj: Mapping[str, Any] = objects[name]
+    items: list[Mapping[str, Any]] = (
+        obj["geometries"] if obj.get("type") == "GeometryCollection" else [obj]
+    )
+    features: list[dict[str, Any]] = []
+    for item in items:
+        feature: dict[str, Any] = {
+            "type": GeoJSONObjectType.FEATURE,
+            "geometry": _decode(item, arcs, transform),
+            "properties": item.get("properties"),
+        }
+        if "id" in item:
+            feature["id"] = item["id"]
+        features.append(feature)
+    return model.model_validate(
+        {"type": GeoJSONObjectType.FEATURE_COLLECTION, "features": features}
+    )
+
+
+def _all_positions(collection: "FeatureCollection[Any]") -> list[_Position]:
+    positions: list[_Position] = []
+    stack: list[Any] = [feature.geometry for feature in collection.features]
+    while stack:
+        geometry = stack.pop()
+        if geometry is None:
+            continue
+        if geometry.type == GeoJSONObjectType.GEOMETRY_COLLECTION:
+            stack.extend(geometry.geometries)
+            continue
+        items: list[Any] = [geometry.coordinates]
+        for _ in range(NESTING[geometry.type]):
+            items = [child for item in items for child in item]
+        positions.extend(items)
+    return positions
+
+
+def _encode(geometry: Any, index: _ArcIndex, quantize: Any) -> dict[str, Any]:
+    if geometry is None:
+        return {"type": None}
+    if geometry.type == GeoJSONObjectType.GEOMETRY_COLLECTION:
+        return {
+            "type": geometry.type,
+            "geometries": [
+                _encode(child, index, quantize) for child in geometry.geometries
+            ],
+        }
+
+    coordinates: Any = geometry.coordinates
+    if geometry.type == GeoJSONObjectType.POINT:
+        return {"type": geometry.type, "coordinates": list(quantize(coordinates))}
+    if geometry.type == GeoJSONObjectType.MULTI_POINT:
+        return {
+            "type": geometry.type,
+            "coordinates": [list(quantize(p)) for p in coordinates],
+        }
+
+    depth, ring = _LINES[geometry.type]
+
+    def encode_lines(items: Any, level: int) -> list[Any]:
+        if level == depth:
+            return index.add([quantize(p) for p in items], ring)
+        return [encode_lines(item, level + 1) for item in items]
+
+    return {"type": geometry.type, "arcs": encode_lines(coordinates, 0)}
+
+
+def _delta_encode(arc: list[_Position]) -> list[list[float]]:
+    encoded = [list(arc[0])]
+    for (x0, y0, *_), (x1, y1, *rest) in zip(arc, arc[1:]):
+        encoded.append([x1 - x0, y1 - y0, *rest])
+    return encoded
+
+
+def _decode_arc(
+    arc: list[list[float]], transform: Mapping[str, Any] | None
+) -> list[_Position]:
+    if transform is None:
+        return [tuple(p) for p in arc]
+    x = y = 0.0
+    positions: list[_Position] = []
+    for qx, qy, *rest in arc:
+        x += qx
+        y += qy
+        positions.append((*_dequantize(x, y, transform), *rest))
+    return positions
+
+
+def _dequantize(x: float, y: float, transform: Mapping[str, Any]) -> _Position:
+    # Rescaling may round positions on the world bounds just past them
+    (kx, ky), (dx, dy) = transform["scale"], transform["translate"]
+    return (
+        min(max(x * kx + dx, -180.0), 180.0),
+        min(max(y * ky + dy, -90.0), 90.0),
+    )
+
+
+def _decode(
+    item: Mapping[str, Any],
+    arcs: list[list[_Position]],
+    transform: Mapping[str, Any] | None,
+) -> Any:
+    geometry_type = item.get("type")
+    if geometry_type is None:
+        return None
+    if geometry_type == GeoJSONObjectType.GEOMETRY_COLLECTION:
+        return {
+            "type": geometry_type,
+            "geometries": [
+                _decode(child, arcs, transform) for child in item["geometries"]
+            ],
+        }
+
+    def point(position: Sequence[float]) -> _Position:
+        if transform is None:
+            return tuple(position)
+        x, y, *rest = position
+        return (*_dequantize(x, y, transform), *rest)
+
+    if geometry_type == GeoJSONObjectType.POINT:
+        return {"type": geometry_type, "coordinates": point(item["coordinates"])}
+    if geometry_type == GeoJSONObjectType.MULTI_POINT:
+        return {
+            "type": geometry_type,
+            "coordinates": [point(p) for p in item["coordinates"]],
+        }
+
+    depth, _ = _LINES[geometry_type]
+
+    def decode_lines(refs: list[Any], level: int) -> list[Any]:
+        if level < depth:
+            return [decode_lines(child, level + 1) for child in refs]
+        positions: list[_Position] = []
+        ref: int
+        for ref in refs:
+            arc = arcs[ref] if ref >= 0 else arcs[~ref][::-1]
+            # Consecutive arcs share their end and start positions
+            positions.extend(arc[1:] if positions else arc)
+        return positions
+
+    return {"type": geometry_type, "coordinates": decode_lines(item["arcs"], 0)}
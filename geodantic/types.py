@@ -13,8 +13,10 @@ type Position = Position2D | Position3D
 
 
 def _validate_bbox(bbox: tuple[float, ...]) -> bool:
+    # The west edge may be east of the east edge if the bbox crosses the
+    # antimeridian, so only the latitudes are ordered
     middle = len(bbox) // 2
-    return bbox[0] <= bbox[middle] and bbox[1] <= bbox[middle + 1]
+    return bbox[1] <= bbox[middle + 1]
 
 
 type BoundingBox2D = Annotated[
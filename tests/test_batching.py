@@ -0,0 +1,165 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pydantic
+import pytest
+
+from geodantic import (
+    CompactProperties,
+    Feature,
+    FeatureCollection,
+    Geometry,
+    Point,
+    Polygon,
+    validate_json_batch,
+    validate_many,
+)
+
+
+def _point(x: float) -> str:
+    return json.dumps({"type": "Point", "coordinates": [x, 0]})
+
+
+def test_validate_json_batch_keeps_order() -> None:
+    # given
+    payloads = [_point(i) for i in range(100)]
+
+    # when
+    result = validate_json_batch(Geometry, payloads, max_workers=4, chunk_size=7)
+
+    # then
+    assert [point.coordinates for point in result] == [(i, 0) for i in range(100)]
+    assert all(isinstance(point, Point) for point in result)
+
+
+def test_validate_json_batch_with_invalid_payload() -> None:
+    # given
+    payloads = [_point(1), _point(200), _point(2)]
+
+    with pytest.raises(pydantic.ValidationError):
+        # when
+        validate_json_batch(Point, payloads, chunk_size=1)
+
+
+def test_validate_json_batch_with_invalid_chunk_size() -> None:
+    with pytest.raises(ValueError):
+        # when
+        validate_json_batch(Point, [_point(1)], chunk_size=0)
+
+
+def _in_threads(function: Any, count: int = 8) -> list[Any]:
+    # Starts all calls at once to make races likely
+    barrier = threading.Barrier(count)
+
+    def call(_: int) -> Any:
+        barrier.wait()
+        return function()
+
+    with ThreadPoolExecutor(count) as executor:
+        return list(executor.map(call, range(count)))
+
+
+def test_parametrize_generic_model_from_threads() -> None:
+    # when
+    models = _in_threads(lambda: FeatureCollection[Feature[Polygon, dict[str, int]]])
+
+    # then
+    assert all(model is models[0] for model in models)
+
+
+def test_compact_properties_from_threads_share_schema() -> None:
+    # given
+    model = Feature[Point, CompactProperties]
+    payload = json.dumps(
+        {
+            "type": "Feature",
+            "geometry": json.loads(_point(1)),
+            "properties": {"threaded_a": 1, "threaded_b": 2},
+        }
+    )
+
+    # when
+    features = _in_threads(lambda: model.model_validate_json(payload))
+
+    # then
+    schemas = {id(feature.properties._schema) for feature in features}
+    assert len(schemas) == 1
+
+
+def test_validate_many() -> None:
+    # given
+    rows = [
+        {"type": "Point", "coordinates": [1, 2]},
+        {"type": "LineString", "coordinates": [[1, 2]]},
+        {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]]},
+        {"type": "Point", "coordinates": [200, 0]},
+    ]
+
+    # when
+    result = validate_many(Geometry, iter(rows))
+
+    # then
+    assert list(result.valid) == [0, 2]
+    assert isinstance(result.valid[0], Point)
+    assert isinstance(result.valid[2], Polygon)
+    assert list(result.errors) == [1, 3]
+    assert ("LineString", "coordinates") in [error["loc"] for error in result.errors[1]]
+    assert all("input" not in error for error in result.errors[1])
+
+
+def test_validate_many_features() -> None:
+    # given
+    rows = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [i, 0]},
+            "properties": {"value": i},
+        }
+        for i in range(3)
+    ]
+
+    # when
+    result = validate_many(Feature[Point, dict[str, int]], rows)
+
+    # then
+    assert not result.errors
+    assert [feature.properties["value"] for feature in result.valid.values()] == [
+        0,
+        1,
+        2,
+    ]
+
+
+def test_validate_many_reports_errors_of_the_tagged_geometry() -> None:
+    # given
+    rows = [{"type": "Point", "coordinates": [200, 0]}]
+
+    # when
+    result = validate_many(Geometry | None, rows)
+
+    # then
+    assert {error["loc"][0] for error in result.errors[0]} == {"Point"}
+
+
+def test_validate_many_validates_each_item_once() -> None:
+    # given
+    validated: list[int] = []
+
+    class Row(pydantic.BaseModel):
+        value: int
+
+        @pydantic.field_validator("value")
+        @classmethod
+        def _record(cls, value: int) -> int:
+            validated.append(value)
+            return value
+
+    # when
+    result = validate_many(Row, [{"value": 1}, {"value": "a"}, {"value": 2}])
+
+    # then
+    assert list(result.valid) == [0, 2]
+    assert list(result.errors) == [1]
+    assert validated == [1, 2]
@@ -109,9 +109,7 @@ def test_parse_object_with_too_long_bbox() -> None:
 @pytest.mark.parametrize(
     "bbox",
     [
-        [1, 2, 0, 4],
         [1, 2, 3, 1],
-        [1, 2, 1000, 0, 4, 1000],
         [1, 2, 1000, 3, 1, 1000],
     ],
 )
@@ -126,3 +124,40 @@ def test_parse_object_with_bbox_with_invalid_axes(bbox: BoundingBox) -> None:
     with pytest.raises(pydantic.ValidationError):
         # when
         Point(**data)
+
+
+@pytest.mark.parametrize(
+    "bbox",
+    [
+        (170.0, -10.0, -170.0, 10.0),
+        (170.0, -10.0, 0.0, -170.0, 10.0, 1000.0),
+    ],
+)
+def test_parse_object_with_bbox_crossing_antimeridian(bbox: BoundingBox) -> None:
+    # given
+    data = {
+        "type": "Point",
+        "coordinates": [180, 0],
+        "bbox": bbox,
+    }
+
+    # when
+    point = Point(**data)
+
+    # then
+    assert point.bbox == bbox
+
+
+def test_parse_object_with_3d_bbox_with_unordered_altitudes() -> None:
+    # given
+    data = {
+        "type": "Point",
+        "coordinates": [1, 2],
+        "bbox": [1, 2, 1000, 3, 4, 0],
+    }
+
+    # when
+    point = Point(**data)
+
+    # then
+    assert point.bbox == (1, 2, 1000, 3, 4, 0)
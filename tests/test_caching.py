@@ -0,0 +1,102 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pydantic
+import pytest
+
+from geodantic import CacheInfo, MultiPolygon, Polygon, ValidationCache
+
+
+def _polygon(x: float) -> str:
+    return json.dumps(
+        {
+            "type": "Polygon",
+            "coordinates": [[[x, 0], [x + 1, 0], [x + 1, 1], [x, 0]]],
+        }
+    )
+
+
+def test_validation_cache_returns_same_instance() -> None:
+    # given
+    cache = ValidationCache[Polygon | MultiPolygon](Polygon | MultiPolygon)
+
+    # when
+    first = cache.validate_json(_polygon(0))
+    second = cache.validate_json(_polygon(0).encode())
+
+    # then
+    assert isinstance(first, Polygon)
+    assert second is first
+    assert cache.cache_info() == CacheInfo(
+        hits=1, misses=1, evictions=0, size=1, maxsize=128
+    )
+
+
+def test_validation_cache_evicts_least_recently_used() -> None:
+    # given
+    cache = ValidationCache[Polygon](Polygon, maxsize=2)
+    first = cache.validate_json(_polygon(0))
+    cache.validate_json(_polygon(1))
+    cache.validate_json(_polygon(0))
+
+    # when
+    cache.validate_json(_polygon(2))
+
+    # then
+    assert cache.validate_json(_polygon(0)) is first
+    assert cache.cache_info() == CacheInfo(
+        hits=2, misses=3, evictions=1, size=2, maxsize=2
+    )
+
+
+def test_validation_cache_does_not_cache_errors() -> None:
+    # given
+    cache = ValidationCache[Polygon](Polygon)
+    payload = json.dumps({"type": "Polygon", "coordinates": [[[0, 0], [1, 1]]]})
+
+    for _ in range(2):
+        with pytest.raises(pydantic.ValidationError):
+            # when
+            cache.validate_json(payload)
+
+    # then
+    assert cache.cache_info() == CacheInfo(
+        hits=0, misses=2, evictions=0, size=0, maxsize=128
+    )
+
+
+def test_validation_cache_clear() -> None:
+    # given
+    cache = ValidationCache[Polygon](Polygon)
+    cache.validate_json(_polygon(0))
+
+    # when
+    cache.cache_clear()
+
+    # then
+    assert cache.cache_info() == CacheInfo(
+        hits=0, misses=0, evictions=0, size=0, maxsize=128
+    )
+
+
+def test_validation_cache_is_thread_safe() -> None:
+    # given
+    cache = ValidationCache[Polygon](Polygon, maxsize=4)
+    payloads = [_polygon(i % 8) for i in range(400)]
+
+    # when
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(cache.validate_json, payloads))
+
+    # then
+    assert [polygon.coordinates[0][0][0] for polygon in results] == [
+        i % 8 for i in range(400)
+    ]
+    info = cache.cache_info()
+    assert info.hits + info.misses == 400
+    assert info.size == 4
+
+
+def test_validation_cache_rejects_invalid_maxsize() -> None:
+    with pytest.raises(ValueError):
+        ValidationCache[Polygon](Polygon, maxsize=0)
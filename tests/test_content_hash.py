@@ -0,0 +1,200 @@
+from typing import Any
+
+import pytest
+
+from geodantic import (
+    Feature,
+    FeatureCollection,
+    GeometryCollection,
+    LineString,
+    MultiPoint,
+    MultiPolygon,
+    Point,
+)
+
+
+@pytest.mark.parametrize(
+    "model,data",
+    [
+        (Point, {"type": "Point", "coordinates": [1, 2]}),
+        (MultiPoint, {"type": "MultiPoint", "coordinates": [[1, 2], [3, 4, 5]]}),
+        (LineString, {"type": "LineString", "coordinates": [[1, 2], [3, 4]]}),
+        (
+            MultiPolygon,
+            {
+                "type": "MultiPolygon",
+                "coordinates": [[[[1, 2], [3, 4], [5, 6], [1, 2]]]],
+                "bbox": [1, 2, 5, 6],
+            },
+        ),
+        (
+            GeometryCollection,
+            {
+                "type": "GeometryCollection",
+                "geometries": [{"type": "Point", "coordinates": [1, 2]}],
+            },
+        ),
+        (
+            Feature,
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [1, 2]},
+                "properties": {"a": 1, "b": [1, 2]},
+                "id": 1,
+            },
+        ),
+    ],
+)
+def test_equal_objects_have_equal_content_hashes(
+    model: type[Any], data: dict[str, Any]
+) -> None:
+    # given
+    first = model(**data)
+    second = model(**data)
+
+    # then
+    assert first.content_hash == second.content_hash
+    assert len(first.content_hash) == 16
+
+
+@pytest.mark.parametrize(
+    "first,second",
+    [
+        (
+            {"type": "Point", "coordinates": [1, 2]},
+            {"type": "Point", "coordinates": [2, 1]},
+        ),
+        (
+            {"type": "Point", "coordinates": [1, 2]},
+            {"type": "Point", "coordinates": [1, 2], "bbox": [1, 2, 1, 2]},
+        ),
+        (
+            {"type": "MultiPoint", "coordinates": [[1, 2, 3], [4, 5]]},
+            {"type": "MultiPoint", "coordinates": [[1, 2], [3, 4, 5]]},
+        ),
+        (
+            {"type": "MultiPoint", "coordinates": [[1, 2], [3, 4]]},
+            {"type": "LineString", "coordinates": [[1, 2], [3, 4]]},
+        ),
+        (
+            {
+                "type": "Polygon",
+                "coordinates": [
+                    [[1, 2], [3, 4], [5, 6], [1, 2]],
+                    [[1, 2], [3, 4], [5, 6], [1, 2]],
+                ],
+            },
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [[[1, 2], [3, 4], [5, 6], [1, 2]]],
+                    [[[1, 2], [3, 4], [5, 6], [1, 2]]],
+                ],
+            },
+        ),
+    ],
+)
+def test_different_geometries_have_different_content_hashes(
+    first: dict[str, Any], second: dict[str, Any]
+) -> None:
+    # given
+    first_geometry = GeometryCollection(type="GeometryCollection", geometries=[first])
+    second_geometry = GeometryCollection(type="GeometryCollection", geometries=[second])
+
+    # then
+    assert (
+        first_geometry.geometries[0].content_hash
+        != second_geometry.geometries[0].content_hash
+    )
+    assert first_geometry.content_hash != second_geometry.content_hash
+
+
+def test_feature_content_hash_ignores_property_order() -> None:
+    # given
+    geometry = {"type": "Point", "coordinates": [1, 2]}
+    first = Feature(type="Feature", geometry=geometry, properties={"a": 1, "b": 2})
+    second = Feature(type="Feature", geometry=geometry, properties={"b": 2, "a": 1})
+    third = Feature(type="Feature", geometry=geometry, properties={"a": 1, "b": 3})
+    fourth = Feature(
+        type="Feature", geometry=geometry, properties={"a": 1, "b": 2}, id="1"
+    )
+    fifth = Feature(
+        type="Feature", geometry=geometry, properties={"a": 1, "b": 2}, id=1
+    )
+
+    # then
+    assert first.content_hash == second.content_hash
+    assert (
+        len(
+            {
+                first.content_hash,
+                third.content_hash,
+                fourth.content_hash,
+                fifth.content_hash,
+            }
+        )
+        == 4
+    )
+
+
+def test_model_copy_with_update_drops_cached_properties() -> None:
+    # given
+    line_string = LineString(type="LineString", coordinates=[(0, 0), (1, 0)])
+    other = LineString(type="LineString", coordinates=[(0, 0), (3, 4)])
+    content_hash, length = line_string.content_hash, line_string.length
+
+    # when
+    copy = line_string.model_copy(update={"coordinates": other.coordinates})
+    unchanged = line_string.model_copy()
+
+    # then
+    assert copy.content_hash == other.content_hash != content_hash
+    assert copy.length == 5 != length
+    assert unchanged.content_hash == content_hash
+
+
+def test_cached_properties_do_not_affect_equality() -> None:
+    # given
+    line_string = LineString(type="LineString", coordinates=[(0, 0), (3, 4)])
+    other = LineString(type="LineString", coordinates=[(0, 0), (3, 4)])
+
+    # when
+    line_string.content_hash, line_string.length
+
+    # then
+    assert line_string == other
+    assert other == line_string
+
+
+def test_deduplicate_feature_collection() -> None:
+    # given
+    data = {
+        "type": "FeatureCollection",
+        "bbox": [1, 2, 3, 4],
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [1, 2]},
+                "properties": {"a": 1},
+            },
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [3, 4]},
+                "properties": {"a": 1},
+            },
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [1, 2]},
+                "properties": {"a": 1},
+            },
+        ],
+    }
+    feature_collection = FeatureCollection(**data)
+
+    # when
+    result = feature_collection.deduplicate()
+
+    # then
+    assert result.bbox == (1, 2, 3, 4)
+    assert result.features == feature_collection.features[:2]
+    assert result.features[0] is feature_collection.features[0]
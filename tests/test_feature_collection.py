@@ -1,3 +1,4 @@
+import math
 from typing import Any
 
 import pydantic
@@ -6,9 +7,12 @@ import pytest
 from geodantic import (
     Feature,
     FeatureCollection,
+    FeatureCollectionBuilder,
     GeoJSONObjectType,
     GeometryCollection,
+    LineString,
     Point,
+    TileKey,
 )
 
 
@@ -169,3 +173,278 @@ def test_parse_invalid_bounded_feature_collection() -> None:
     with pytest.raises(pydantic.ValidationError):
         # when
         FeatureCollection[Feature[GeometryCollection[Point], dict[str, Any]]](**data)
+
+
+def test_feature_collection_measurements() -> None:
+    # given
+    data = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "LineString", "coordinates": [[0, 0], [3, 4]]},
+                "properties": None,
+            },
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [[[0, 0], [2, 0], [2, 2], [0, 2], [0, 0]]],
+                },
+                "properties": None,
+            },
+            {"type": "Feature", "geometry": None, "properties": None},
+        ],
+    }
+    feature_collection = FeatureCollection(**data)
+
+    # when
+    lengths = feature_collection.lengths(geodesic=False)
+    areas = feature_collection.areas(geodesic=False)
+    geodesic_areas = feature_collection.areas()
+    centroids = feature_collection.centroids()
+
+    # then
+    assert lengths[0] == 5
+    assert all(math.isnan(value) for value in lengths[1:])
+    assert areas[1] == 4
+    assert math.isnan(areas[0]) and math.isnan(areas[2])
+    assert geodesic_areas[1] == pytest.approx(4 * 12_308_778_361, rel=1e-3)
+    assert list(centroids[2:4]) == [1, 1]
+    assert len(centroids) == 6
+
+
+def _point_features(count: int) -> list[Feature[Point, dict[str, Any]]]:
+    return [
+        Feature[Point, dict[str, Any]](
+            type=GeoJSONObjectType.FEATURE,
+            geometry=Point(type=GeoJSONObjectType.POINT, coordinates=(i, i)),
+            properties={"index": i},
+        )
+        for i in range(count)
+    ]
+
+
+def test_feature_collection_from_features() -> None:
+    # given
+    features = _point_features(3)
+
+    # when
+    feature_collection = FeatureCollection[
+        Feature[Point, dict[str, Any]]
+    ].from_features(features, bbox=(0, 0, 2, 2))
+
+    # then
+    assert feature_collection.type is GeoJSONObjectType.FEATURE_COLLECTION
+    assert feature_collection.bbox == (0, 0, 2, 2)
+    assert all(a is b for a, b in zip(feature_collection.features, features))
+    assert feature_collection == FeatureCollection(
+        **feature_collection.model_dump(exclude_unset=True)
+    )
+
+
+def test_feature_collection_from_invalid_features() -> None:
+    with pytest.raises(TypeError):
+        # when
+        FeatureCollection.from_features([{"type": "Feature"}])
+
+
+def test_feature_collection_from_features_of_other_feature_class() -> None:
+    # given
+    point = Feature.model_validate(
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [1, 2]},
+            "properties": {"index": 0},
+        }
+    )
+    polygon = Feature.model_validate(
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]],
+            },
+            "properties": {},
+        }
+    )
+    model = FeatureCollection[Feature[Point, dict[str, Any]]]
+    points = model.from_features(_point_features(2))
+
+    # when
+    feature_collection = model.from_features([point])
+
+    # then
+    assert type(feature_collection.features[0]) is Feature[Point, dict[str, Any]]
+    assert feature_collection.features == [point]
+    with pytest.raises(pydantic.ValidationError):
+        model.from_features([polygon])
+    with pytest.raises(pydantic.ValidationError):
+        points.append(polygon)
+    with pytest.raises(pydantic.ValidationError):
+        points.concat(FeatureCollection.from_features([polygon]))
+    with pytest.raises(pydantic.ValidationError):
+        FeatureCollectionBuilder(model).extend([polygon])
+    assert points.concat(feature_collection).features == [
+        *points.features,
+        point,
+    ]
+
+
+def test_feature_collection_concat_slice_and_append() -> None:
+    # given
+    features = _point_features(6)
+    first = FeatureCollection.from_features(features[:3])
+    second = FeatureCollection.from_features(features[3:])
+
+    # when
+    concatenated = first.concat(second)
+    sliced = concatenated.sliced(1, None, 2)
+    appended = sliced.append(features[0])
+
+    # then
+    assert concatenated.features == features
+    assert sliced.features == features[1::2]
+    assert appended.features == [*features[1::2], features[0]]
+    assert all(a is b for a, b in zip(sliced.features, features[1::2]))
+    assert first.features == features[:3]
+    assert (
+        appended.model_dump_json()
+        == FeatureCollection.from_features(
+            [*features[1::2], features[0]]
+        ).model_dump_json()
+    )
+
+
+def test_feature_collection_builder() -> None:
+    # given
+    features = _point_features(5)
+    builder = FeatureCollectionBuilder(
+        FeatureCollection[Feature[Point, dict[str, Any]]]
+    )
+
+    # when
+    builder.extend(features[:2])
+    first = builder.build()
+    builder.append(features[2])
+    builder.extend(first.concat(first).features)
+    second = builder.build(bbox=(0, 0, 1, 1))
+
+    # then
+    assert len(builder) == 7
+    assert first.features == features[:2]
+    assert second.features == [*features[:3], *features[:2], *features[:2]]
+    assert second.bbox == (0, 0, 1, 1)
+
+
+def _bucketing_collection() -> FeatureCollection[Any]:
+    return FeatureCollection.model_validate(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [-5.6, 42.6]},
+                    "properties": None,
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": [[-5.7, 42.5], [-5.5, 42.7]],
+                    },
+                    "properties": None,
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "Polygon",
+                        "bbox": [10, 10, 11, 11],
+                        "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]],
+                    },
+                    "properties": None,
+                },
+                {"type": "Feature", "geometry": None, "properties": None},
+            ],
+        }
+    )
+
+
+def test_feature_collection_geohashes() -> None:
+    # given
+    feature_collection = _bucketing_collection()
+
+    # when
+    geohashes = feature_collection.geohashes(5)
+
+    # then
+    assert geohashes == ["ezs42", "ezs42", "s1z7w", None]
+
+
+def test_feature_collection_tile_keys() -> None:
+    # given
+    feature_collection = _bucketing_collection()
+
+    # when
+    tile_keys = feature_collection.tile_keys(10)
+
+    # then
+    assert tile_keys == [
+        TileKey(10, 496, 377),
+        TileKey(10, 496, 377),
+        TileKey(10, 541, 481),
+        None,
+    ]
+
+
+def test_feature_collection_tile_keys_of_bbox_crossing_antimeridian() -> None:
+    # given
+    feature_collection = FeatureCollection[Feature[LineString, None]].model_validate(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "LineString",
+                        "bbox": [178, 0, -172, 10],
+                        "coordinates": [[178, 0], [-172, 10]],
+                    },
+                    "properties": None,
+                },
+            ],
+        }
+    )
+
+    # when
+    tile_keys = feature_collection.tile_keys(1)
+
+    # then
+    assert tile_keys == [TileKey(1, 0, 0)]
+
+
+@pytest.mark.parametrize(
+    "method, argument", [("geohashes", 0), ("geohashes", 13), ("tile_keys", 31)]
+)
+def test_feature_collection_bucketing_invalid_arguments(
+    method: str, argument: int
+) -> None:
+    with pytest.raises(ValueError):
+        getattr(_bucketing_collection(), method)(argument)
+
+
+def test_feature_collection_partition_by() -> None:
+    # given
+    feature_collection = _bucketing_collection()
+
+    # when
+    partitions = feature_collection.partition_by(feature_collection.geohashes(3))
+
+    # then
+    assert list(partitions) == ["ezs", "s1z", None]
+    assert [len(p.features) for p in partitions.values()] == [2, 1, 1]
+    assert all(
+        a is b for a, b in zip(partitions["ezs"].features, feature_collection.features)
+    )
+    with pytest.raises(ValueError):
+        feature_collection.partition_by(["a"])
@@ -0,0 +1,211 @@
+import math
+from array import array
+
+import pytest
+
+from geodantic import (
+    FeatureCollection,
+    GeoArrowArray,
+    GeoJSONObjectType,
+    GeometryCollection,
+    from_geoarrow,
+    to_geoarrow,
+)
+
+
+def test_point_collection_to_geoarrow() -> None:
+    # given
+    data = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [1, 2]},
+                "properties": None,
+            },
+            {"type": "Feature", "geometry": None, "properties": None},
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [3, 4]},
+                "properties": None,
+            },
+        ],
+    }
+    feature_collection = FeatureCollection(**data)
+
+    # when
+    result = to_geoarrow(feature_collection)
+
+    # then
+    assert result.geometry_type is GeoJSONObjectType.POINT
+    assert result.extension_name == "geoarrow.point"
+    assert result.dimensions == 2
+    assert result.offsets == ()
+    assert len(result) == 3
+    assert [result.is_valid(i) for i in range(3)] == [True, False, True]
+    assert result.coords[:2].tolist() == [1, 2]
+    assert all(math.isnan(value) for value in result.coords[2:4].tolist())
+    assert result.coords[4:].tolist() == [3, 4]
+
+
+def test_multi_polygon_collection_to_geoarrow() -> None:
+    # given
+    data = {
+        "type": "GeometryCollection",
+        "geometries": [
+            {
+                "type": "MultiPolygon",
+                "coordinates": [
+                    [
+                        [[0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 0, 1]],
+                        [[0, 0, 2], [1, 0, 2], [1, 1, 2], [0, 0, 2]],
+                    ],
+                    [[[5, 5, 3], [6, 5, 3], [6, 6, 3], [5, 5, 3]]],
+                ],
+            },
+            {"type": "MultiPolygon", "coordinates": []},
+        ],
+    }
+    geometry_collection = GeometryCollection(**data)
+
+    # when
+    result = to_geoarrow(geometry_collection)
+
+    # then
+    assert result.geometry_type is GeoJSONObjectType.MULTI_POLYGON
+    assert result.dimensions == 3
+    assert [offsets.tolist() for offsets in result.offsets] == [
+        [0, 2, 2],
+        [0, 2, 3],
+        [0, 4, 8, 12],
+    ]
+    assert len(result.coords) == 36
+    assert result.validity is None
+
+
+def test_mixed_geometry_types_to_geoarrow() -> None:
+    # given
+    data = {
+        "type": "GeometryCollection",
+        "geometries": [
+            {"type": "Point", "coordinates": [1, 2]},
+            {"type": "MultiPoint", "coordinates": [[1, 2]]},
+        ],
+    }
+    geometry_collection = GeometryCollection(**data)
+
+    with pytest.raises(ValueError):
+        # when
+        to_geoarrow(geometry_collection)
+
+
+def test_mixed_dimensions_to_geoarrow() -> None:
+    # given
+    data = {
+        "type": "GeometryCollection",
+        "geometries": [{"type": "MultiPoint", "coordinates": [[1, 2], [1, 2, 3]]}],
+    }
+    geometry_collection = GeometryCollection(**data)
+
+    with pytest.raises(ValueError):
+        # when
+        to_geoarrow(geometry_collection)
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        {"type": "Point", "coordinates": [1, 2, 3]},
+        {"type": "MultiPoint", "coordinates": [[1, 2], [3, 4]]},
+        {"type": "LineString", "coordinates": [[1, 2], [3, 4]]},
+        {
+            "type": "MultiLineString",
+            "coordinates": [[[1, 2], [3, 4]], [[5, 6], [7, 8]]],
+        },
+        {
+            "type": "Polygon",
+            "coordinates": [[[1, 2], [3, 4], [5, 6], [1, 2]]],
+        },
+        {
+            "type": "MultiPolygon",
+            "coordinates": [[[[1, 2], [3, 4], [5, 6], [1, 2]]], []],
+        },
+    ],
+)
+def test_geoarrow_round_trip(geometry: dict[str, object]) -> None:
+    # given
+    data = {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": geometry, "properties": None},
+            {"type": "Feature", "geometry": None, "properties": None},
+        ],
+    }
+    feature_collection = FeatureCollection(**data)
+
+    # when
+    result = from_geoarrow(to_geoarrow(feature_collection))
+
+    # then
+    assert [feature.geometry for feature in result.features] == [
+        feature.geometry for feature in feature_collection.features
+    ]
+    assert result == FeatureCollection(**data)
+
+
+def test_from_external_geoarrow_buffers() -> None:
+    # given
+    data = GeoArrowArray(
+        geometry_type=GeoJSONObjectType.LINE_STRING,
+        dimensions=2,
+        coords=memoryview(array("d", [0, 0, 1, 1, 2, 2, 10, 10, 20, 20])),
+        offsets=(memoryview(array("q", [0, 3, 5])),),
+    )
+
+    # when
+    result = from_geoarrow(data)
+
+    # then
+    assert [feature.geometry.coordinates for feature in result.features] == [
+        [(0, 0), (1, 1), (2, 2)],
+        [(10, 10), (20, 20)],
+    ]
+
+
+@pytest.mark.parametrize(
+    "geometry_type,coords,offsets",
+    [
+        (GeoJSONObjectType.LINE_STRING, [0, 0, 1, 1], [0, 1, 2]),
+        (GeoJSONObjectType.LINE_STRING, [0, 0, 181, 1], [0, 2]),
+        (GeoJSONObjectType.LINE_STRING, [0, 0, 1, math.nan], [0, 2]),
+        (GeoJSONObjectType.MULTI_POINT, [0, 0, 1, -91], [0, 2]),
+    ],
+)
+def test_from_invalid_geoarrow_buffers(
+    geometry_type: GeoJSONObjectType, coords: list[float], offsets: list[int]
+) -> None:
+    # given
+    data = GeoArrowArray(
+        geometry_type=geometry_type,
+        dimensions=2,
+        coords=memoryview(array("d", coords)),
+        offsets=(memoryview(array("i", offsets)),),
+    )
+
+    with pytest.raises(ValueError):
+        # when
+        from_geoarrow(data)
+
+
+def test_from_geoarrow_with_unclosed_ring() -> None:
+    # given
+    data = GeoArrowArray(
+        geometry_type=GeoJSONObjectType.POLYGON,
+        dimensions=2,
+        coords=memoryview(array("d", [0, 0, 1, 0, 1, 1, 0, 1])),
+        offsets=(memoryview(array("i", [0, 1])), memoryview(array("i", [0, 4]))),
+    )
+
+    with pytest.raises(ValueError):
+        # when
+        from_geoarrow(data)
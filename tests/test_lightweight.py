@@ -0,0 +1,151 @@
+import json
+from typing import Any
+
+import pydantic
+import pytest
+
+from geodantic import (
+    Feature,
+    GeoJSONObjectType,
+    GeometryCollection,
+    LightFeature,
+    LightGeometry,
+    Point,
+    Polygon,
+    parse_light_features,
+)
+
+DATA = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [1, 2]},
+            "properties": {"name": "a"},
+            "id": 1,
+        },
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [[1, 2], [3, 4]],
+                "bbox": [1, 2, 3, 4],
+            },
+            "properties": None,
+        },
+        {
+            "type": "Feature",
+            "geometry": None,
+            "properties": {"name": "c"},
+        },
+    ],
+}
+
+EXPECTED = [
+    LightFeature(LightGeometry(GeoJSONObjectType.POINT, (1.0, 2.0)), {"name": "a"}, 1),
+    LightFeature(
+        LightGeometry(
+            GeoJSONObjectType.LINE_STRING,
+            [(1.0, 2.0), (3.0, 4.0)],
+            (1.0, 2.0, 3.0, 4.0),
+        ),
+        None,
+    ),
+    LightFeature(None, {"name": "c"}),
+]
+
+
+@pytest.mark.parametrize("data", [DATA, json.dumps(DATA), json.dumps(DATA).encode()])
+def test_parse_light_features(data: Any) -> None:
+    # when
+    features = parse_light_features(data)
+
+    # then
+    assert features == EXPECTED
+
+
+def test_parse_light_features_with_filters() -> None:
+    # when
+    features = parse_light_features(
+        json.dumps(DATA),
+        where=lambda properties: properties is not None,
+        intersecting=(0, 0, 2, 3),
+    )
+
+    # then
+    assert features == [EXPECTED[0]]
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        {"type": "Point", "coordinates": [1000, 2]},
+        {"type": "LineString", "coordinates": [[1, 2]]},
+        {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 1]]]},
+        {"type": "GeometryCollection", "geometries": []},
+    ],
+)
+def test_parse_light_features_rejects_invalid_geometries(geometry: Any) -> None:
+    # given
+    data = {
+        **DATA,
+        "features": [
+            *DATA["features"],
+            {"type": "Feature", "geometry": geometry, "properties": None},
+        ],
+    }
+
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        # when
+        parse_light_features(data, where=lambda properties: properties is None)
+
+    # then
+    assert {error["loc"][:3] for error in exc_info.value.errors()} == {
+        ("features", 3, "geometry")
+    }
+
+
+def test_light_feature_model_round_trip() -> None:
+    # given
+    feature = Feature[Polygon, dict[str, Any]](
+        type="Feature",
+        geometry={
+            "type": "Polygon",
+            "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]],
+        },
+        properties={"name": "a"},
+        id="x",
+        bbox=(0, 0, 1, 1),
+    )
+
+    # when
+    light = LightFeature.from_model(feature)
+
+    # then
+    assert light.geometry is not None
+    assert light.geometry.type == GeoJSONObjectType.POLYGON
+    assert light.id == "x"
+    assert light.to_model(Feature[Polygon, dict[str, Any]]) == feature
+
+
+def test_light_geometry_to_model_validates() -> None:
+    # given
+    geometry = LightGeometry(GeoJSONObjectType.POINT, (1000.0, 2.0))
+
+    with pytest.raises(pydantic.ValidationError):
+        # when
+        geometry.to_model()
+
+    # then
+    assert LightGeometry(GeoJSONObjectType.POINT, (1.0, 2.0)).to_model() == Point(
+        type="Point", coordinates=(1, 2)
+    )
+
+
+def test_light_geometry_rejects_geometry_collections() -> None:
+    # given
+    collection = GeometryCollection[Point](type="GeometryCollection", geometries=[])
+
+    with pytest.raises(ValueError):
+        # when
+        LightGeometry.from_model(collection)
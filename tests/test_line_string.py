@@ -53,3 +53,74 @@ def test_parse_line_string_with_invalid_position() -> None:
     with pytest.raises(pydantic.ValidationError):
         # when
         LineString(**data)
+
+
+def test_line_string_length() -> None:
+    # given
+    line_string = LineString(
+        type=GeoJSONObjectType.LINE_STRING,
+        coordinates=[(0, 0), (3, 4), (3, 5)],
+    )
+
+    # then
+    assert line_string.length == 6
+    assert line_string.geodesic_length == pytest.approx(664_640, rel=1e-4)
+
+
+def test_line_string_geodesic_length_along_equator() -> None:
+    # given
+    line_string = LineString(
+        type=GeoJSONObjectType.LINE_STRING,
+        coordinates=[(0, 0), (1, 0)],
+    )
+
+    # then
+    assert line_string.geodesic_length == pytest.approx(111_319.491, abs=1e-3)
+
+
+def test_line_string_split_antimeridian() -> None:
+    # given
+    line_string = LineString(
+        type=GeoJSONObjectType.LINE_STRING,
+        coordinates=[(170, 0, 0), (-170, 10, 100), (-160, 10, 100)],
+    )
+
+    # when
+    result = line_string.split_antimeridian()
+
+    # then
+    assert result.type is GeoJSONObjectType.MULTI_LINE_STRING
+    assert result.coordinates == [
+        [(170, 0, 0), (180, 5, 50)],
+        [(-180, 5, 50), (-170, 10, 100), (-160, 10, 100)],
+    ]
+
+
+def test_line_string_split_antimeridian_at_vertices_on_antimeridian() -> None:
+    # given
+    line_string = LineString(
+        type=GeoJSONObjectType.LINE_STRING,
+        coordinates=[(170, 0), (180, 0), (-180, 0), (-170, 0)],
+    )
+
+    # when
+    result = line_string.split_antimeridian()
+
+    # then
+    assert result.coordinates == [[(170, 0), (180, 0)], [(-180, 0), (-170, 0)]]
+
+
+def test_line_string_split_antimeridian_without_crossing() -> None:
+    # given
+    line_string = LineString(
+        type=GeoJSONObjectType.LINE_STRING,
+        coordinates=[(170, 0), (180, 10)],
+        bbox=(170, 0, 180, 10),
+    )
+
+    # when
+    result = line_string.split_antimeridian()
+
+    # then
+    assert result.coordinates == [[(170, 0), (180, 10)]]
+    assert result.bbox == (170, 0, 180, 10)
@@ -74,3 +74,17 @@ def test_parse_multi_line_string_with_invalid_line_string() -> None:
     with pytest.raises(pydantic.ValidationError):
         # when
         MultiLineString(**data)
+
+
+def test_multi_line_string_length() -> None:
+    # given
+    multi_line_string = MultiLineString(
+        type=GeoJSONObjectType.MULTI_LINE_STRING,
+        coordinates=[[(0, 0), (1, 0)], [(10, 0), (10, 0.5), (10, 1)]],
+    )
+
+    # then
+    assert multi_line_string.length == 2
+    assert multi_line_string.geodesic_length == pytest.approx(
+        111_319.491 + 110_574.389, abs=1e-3
+    )
@@ -83,3 +83,81 @@ def test_parse_multi_polygon_with_non_closed_ring() -> None:
     with pytest.raises(pydantic.ValidationError):
         # when
         MultiPolygon(**data)
+
+
+def test_multi_polygon_contains_points() -> None:
+    # given
+    multi_polygon = MultiPolygon(
+        type=GeoJSONObjectType.MULTI_POLYGON,
+        coordinates=[
+            [
+                [(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)],
+                [(4, 4), (6, 4), (6, 6), (4, 6), (4, 4)],
+            ],
+            [[(20, 20), (30, 20), (30, 30), (20, 20)]],
+        ],
+    )
+
+    # when
+    result = multi_polygon.contains_points([(1, 1), (5, 5), (29, 21), (21, 29)])
+
+    # then
+    assert result == [True, False, True, False]
+
+
+def test_multi_polygon_with_overlapping_polygons_contains_points() -> None:
+    # given
+    multi_polygon = MultiPolygon(
+        type=GeoJSONObjectType.MULTI_POLYGON,
+        coordinates=[
+            [[(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)]],
+            [[(5, 5), (15, 5), (15, 15), (5, 15), (5, 5)]],
+        ],
+    )
+
+    # when
+    result = multi_polygon.contains_points([(7, 7), (12, 12), (12, 2)])
+
+    # then
+    assert result == [True, True, False]
+
+
+def test_multi_polygon_area_and_centroid() -> None:
+    # given
+    multi_polygon = MultiPolygon(
+        type=GeoJSONObjectType.MULTI_POLYGON,
+        coordinates=[
+            [[(0, 0), (2, 0), (2, 2), (0, 2), (0, 0)]],
+            [[(4, 0), (6, 0), (6, 2), (4, 2), (4, 0)]],
+        ],
+    )
+
+    # then
+    assert multi_polygon.area == 8
+    assert multi_polygon.centroid == pytest.approx((3, 1))
+    assert multi_polygon.geodesic_area == pytest.approx(
+        2 * 4 * 12_308_778_361, rel=1e-3
+    )
+
+
+def test_multi_polygon_split_antimeridian() -> None:
+    # given
+    multi_polygon = MultiPolygon(
+        type=GeoJSONObjectType.MULTI_POLYGON,
+        coordinates=[
+            [[(170, 0), (-170, 0), (-170, 10), (170, 0)]],
+            [[(0, 0), (1, 0), (1, 1), (0, 0)]],
+        ],
+        bbox=(170, 0, -170, 10),
+    )
+
+    # when
+    result = multi_polygon.split_antimeridian()
+
+    # then
+    assert result.coordinates == [
+        [[(180, 5), (170, 0), (180, 0), (180, 5)]],
+        [[(-180, 0), (-170, 0), (-170, 10), (-180, 5), (-180, 0)]],
+        [[(0, 0), (1, 0), (1, 1), (0, 0)]],
+    ]
+    assert result.bbox == (170, 0, -170, 10)
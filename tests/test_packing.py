@@ -0,0 +1,143 @@
+from array import array
+
+import pytest
+
+from geodantic import (
+    FeatureCollection,
+    GeometryCollection,
+    LineString,
+    MultiPolygon,
+    PackedPositions,
+    Point,
+    pack_coordinates,
+)
+
+
+def test_pack_float32_positions() -> None:
+    # given
+    positions = [(0.1, 0.2), (179.99999999, -89.99999999)]
+
+    # when
+    packed = PackedPositions(positions)
+
+    # then
+    assert packed.precision == "float32"
+    assert packed.nbytes == 16
+    assert len(packed) == 2
+    assert packed[-1] == (180.0, -90.0)
+    assert list(packed) == [packed[0], packed[1]]
+    assert packed[:1] == [packed[0]]
+    assert all(
+        abs(a - b) <= 7.7e-6
+        for position, packed_position in zip(positions, packed)
+        for a, b in zip(position, packed_position)
+    )
+
+
+def test_pack_fixed_point_positions() -> None:
+    # given
+    positions = [(0.12345678, 0.2, 123.4567), (-180, 90, -5)]
+
+    # when
+    packed = PackedPositions(positions, "fixed")
+
+    # then
+    assert packed.nbytes == 24
+    assert packed == [(0.1234568, 0.2, 123.457), (-180, 90, -5)]
+
+
+def test_packed_positions_from_fixed_values() -> None:
+    # given
+    values = array("i", [10_000_000, -20_000_000, 1_800_000_000, 900_000_000])
+
+    # when
+    packed = PackedPositions.from_fixed(values, 2)
+
+    # then
+    assert packed == [(1, -2), (180, 90)]
+    assert packed.precision == "fixed"
+    assert packed.dimensions == 2
+    assert packed.values is values
+
+
+@pytest.mark.parametrize(
+    "positions",
+    [
+        [(1, 2), (1, 2, 3)],
+        [(180.1, 0)],
+        [(0, -90.1)],
+        [(0, float("nan"))],
+    ],
+)
+def test_pack_invalid_positions(positions: list[tuple[float, ...]]) -> None:
+    with pytest.raises(ValueError):
+        # when
+        PackedPositions(positions)
+
+
+def test_pack_geometry_coordinates() -> None:
+    # given
+    multi_polygon = MultiPolygon(
+        type="MultiPolygon",
+        coordinates=[[[[0, 0], [1.1, 0], [1.1, 1.1], [0, 0]]]],
+        bbox=(0, 0, 1.1, 1.1),
+    )
+
+    # when
+    packed = pack_coordinates(multi_polygon, "fixed")
+
+    # then
+    assert isinstance(packed.coordinates[0][0], PackedPositions)
+    assert packed == multi_polygon
+    assert packed.model_fields_set == multi_polygon.model_fields_set
+    assert packed.model_dump_json() == multi_polygon.model_dump_json()
+    assert MultiPolygon.model_validate_json(packed.model_dump_json()) == packed
+    assert packed.model_dump() == multi_polygon.model_dump()
+
+
+def test_pack_feature_collection_coordinates() -> None:
+    # given
+    data = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [0.1, 0.2]},
+                "properties": None,
+            },
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "GeometryCollection",
+                    "geometries": [
+                        {"type": "LineString", "coordinates": [[0.1, 0.2], [1, 2]]}
+                    ],
+                },
+                "properties": {"a": 1},
+            },
+            {"type": "Feature", "geometry": None, "properties": None},
+        ],
+    }
+    feature_collection = FeatureCollection(**data)
+
+    # when
+    packed = pack_coordinates(feature_collection)
+
+    # then
+    point = packed.features[0].geometry
+    collection = packed.features[1].geometry
+    assert isinstance(point, Point)
+    assert point.coordinates == pytest.approx((0.1, 0.2))
+    assert point.coordinates != (0.1, 0.2)
+    assert isinstance(collection, GeometryCollection)
+    line_string = collection.geometries[0]
+    assert isinstance(line_string, LineString)
+    assert isinstance(line_string.coordinates, PackedPositions)
+    assert packed.features[1].properties == {"a": 1}
+    assert packed.features[2].geometry is None
+    assert (
+        FeatureCollection.model_validate_json(
+            packed.model_dump_json(exclude_unset=True)
+        )
+        == packed
+    )
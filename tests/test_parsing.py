@@ -0,0 +1,453 @@
+import json
+from typing import Annotated, Any
+
+import pydantic
+import pydantic_core
+import pytest
+from pydantic import AfterValidator
+
+from geodantic import (
+    Feature,
+    FeatureCollection,
+    Geometry,
+    ParseLimits,
+    Point,
+    parse_feature_collection,
+    parse_light_features,
+    partition_feature_collection,
+)
+
+DATA = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [1, 2]},
+            "properties": {"layer": "roads", "name": "a", "extra": 1},
+        },
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [1000, 2000]},
+            "properties": {"layer": "rivers", "name": "b", "extra": 2},
+        },
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [3, 4]},
+            "properties": {"layer": "roads", "name": "c"},
+        },
+        {
+            "type": "Feature",
+            "geometry": None,
+            "properties": None,
+        },
+    ],
+}
+
+
+def test_parse_feature_collection_without_options() -> None:
+    # given
+    data = {**DATA, "features": DATA["features"][::2]}
+
+    # when
+    result = parse_feature_collection(FeatureCollection, json.dumps(data))
+
+    # then
+    assert result == FeatureCollection(**data)
+
+
+def test_parse_feature_collection_with_predicate() -> None:
+    # when
+    result = parse_feature_collection(
+        FeatureCollection[Feature[Point | None, dict[str, Any] | None]],
+        DATA,
+        where=lambda properties: properties is not None
+        and properties["layer"] == "roads",
+    )
+
+    # then
+    assert [feature.properties for feature in result.features] == [
+        {"layer": "roads", "name": "a", "extra": 1},
+        {"layer": "roads", "name": "c"},
+    ]
+
+
+def test_parse_feature_collection_with_projection() -> None:
+    # when
+    result = parse_feature_collection(
+        FeatureCollection,
+        json.dumps(DATA).encode(),
+        properties={"name", "missing"},
+        where=lambda properties: properties is None or properties["name"] != "b",
+    )
+
+    # then
+    assert [feature.properties for feature in result.features] == [
+        {"name": "a"},
+        {"name": "c"},
+        None,
+    ]
+    assert DATA["features"][0]["properties"] == {
+        "layer": "roads",
+        "name": "a",
+        "extra": 1,
+    }
+
+
+def test_parse_feature_collection_with_invalid_remaining_feature() -> None:
+    with pytest.raises(pydantic.ValidationError):
+        # when
+        parse_feature_collection(
+            FeatureCollection,
+            DATA,
+            where=lambda properties: properties is not None
+            and properties["layer"] == "rivers",
+        )
+
+
+@pytest.mark.parametrize(
+    "intersecting,expected_names",
+    [
+        ((0, 0, 2, 3), ["a", "d"]),
+        ((2.5, 3.5, 0, 10, 10, 0), ["c", "d"]),
+        ((50, 50, 60, 60), ["e"]),
+        ((-10, -10, -5, -5), []),
+        ((179, 1, 179.5, 2), ["f"]),
+        ((100, 0, 2, 3), ["a", "d", "f"]),
+    ],
+)
+def test_parse_feature_collection_with_spatial_filter(
+    intersecting: tuple[float, ...], expected_names: list[str]
+) -> None:
+    # given
+    data = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [1, 2]},
+                "properties": {"name": "a"},
+            },
+            {
+                "type": "Feature",
+                "geometry": None,
+                "properties": {"name": "b"},
+            },
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [3, 4]},
+                "properties": {"name": "c"},
+            },
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "GeometryCollection",
+                    "geometries": [
+                        {"type": "LineString", "coordinates": [[2, 3], [4, 5, 6]]},
+                        {"type": "MultiPolygon", "coordinates": []},
+                    ],
+                },
+                "properties": {"name": "d"},
+            },
+            {
+                "type": "Feature",
+                # The bbox takes precedence over the coordinates
+                "bbox": [40, 40, 55, 55],
+                "geometry": {"type": "Point", "coordinates": [1, 2]},
+                "properties": {"name": "e"},
+            },
+            {
+                "type": "Feature",
+                # The bbox crosses the antimeridian
+                "bbox": [175, 0, -175, 5],
+                "geometry": None,
+                "properties": {"name": "f"},
+            },
+        ],
+    }
+
+    # when
+    result = parse_feature_collection(
+        FeatureCollection, data, intersecting=intersecting
+    )
+
+    # then
+    assert [feature.properties["name"] for feature in result.features] == (
+        expected_names
+    )
+
+
+@pytest.mark.parametrize(
+    "feature",
+    [
+        {
+            "type": "Feature",
+            "bbox": [10, 10, 0, 0],
+            "geometry": None,
+            "properties": None,
+        },
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": ["a", "b"]},
+            "properties": None,
+        },
+    ],
+)
+def test_parse_feature_collection_with_spatial_filter_and_invalid_feature(
+    feature: dict[str, Any],
+) -> None:
+    # given
+    data = {"type": "FeatureCollection", "features": [feature]}
+
+    with pytest.raises(pydantic.ValidationError):
+        # when
+        parse_feature_collection(FeatureCollection, data, intersecting=(0, 0, 1, 1))
+
+
+INVALID_DATA = {
+    "type": "FeatureCollection",
+    "features": [
+        {"type": "Feature", "geometry": None, "properties": {"name": "a"}},
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [1000, 0]},
+            "properties": {"name": "b"},
+        },
+        {"type": "Feature", "geometry": None, "properties": {"name": "c"}},
+        {"type": "Feature", "geometry": None, "properties": {"name": "d"}, "id": None},
+        {"type": "Feature", "geometry": None, "properties": {"name": "e"}},
+    ],
+}
+
+
+def test_parse_feature_collection_fail_fast() -> None:
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        # when
+        parse_feature_collection(FeatureCollection, INVALID_DATA, max_errors=1)
+
+    # then
+    assert {error["loc"][:2] for error in exc_info.value.errors()} == {("features", 1)}
+
+
+def test_parse_feature_collection_with_error_budget() -> None:
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        # when
+        parse_feature_collection(
+            FeatureCollection,
+            INVALID_DATA,
+            max_errors=5,
+            where=lambda properties: properties is not None
+            and properties["name"] != "b",
+        )
+
+    # then
+    assert exc_info.value.errors()[0]["loc"] == ("features", 3, "id")
+    assert exc_info.value.errors()[0]["type"] == "value_error"
+
+
+def test_parse_feature_collection_reports_input_indices() -> None:
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        # when
+        parse_feature_collection(
+            FeatureCollection,
+            INVALID_DATA,
+            where=lambda properties: properties is not None
+            and properties["name"] != "b",
+        )
+
+    # then
+    assert [error["loc"] for error in exc_info.value.errors()] == [
+        ("features", 3, "id")
+    ]
+
+
+def test_parse_feature_collection_reports_errors_with_their_context() -> None:
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        # when
+        parse_feature_collection(
+            FeatureCollection[Feature[Point, dict[str, Any]]],
+            DATA,
+            where=lambda properties: properties is not None
+            and properties["name"] == "b",
+        )
+
+    # then
+    error, *_ = exc_info.value.errors()
+    assert error["loc"][:2] == ("features", 1)
+    assert error["type"] == "less_than_equal"
+    assert error["ctx"] == {"le": 180}
+
+
+def test_parse_feature_collection_reports_custom_errors_with_their_message() -> None:
+    # given
+    def check_name(properties: dict[str, Any]) -> dict[str, Any]:
+        raise pydantic_core.PydanticCustomError(
+            "bad_name", "name {name} is not {allowed}", {"name": "b", "allowed": "{}"}
+        )
+
+    model = FeatureCollection[
+        Feature[Point | None, Annotated[dict[str, Any], AfterValidator(check_name)]]
+    ]
+
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        # when
+        parse_feature_collection(model, DATA, max_errors=1, properties={"name"})
+
+    # then
+    (error,) = exc_info.value.errors()
+    assert error["loc"][:2] == ("features", 0)
+    assert error["type"] == "bad_name"
+    assert error["msg"] == "name b is not {}"
+
+
+def test_parse_feature_collection_within_error_budget() -> None:
+    # when
+    result = parse_feature_collection(
+        FeatureCollection[Feature[Point | None, dict[str, Any]]],
+        {**INVALID_DATA, "features": INVALID_DATA["features"][::2]},
+        max_errors=1,
+    )
+
+    # then
+    assert result == parse_feature_collection(
+        FeatureCollection[Feature[Point | None, dict[str, Any]]],
+        {**INVALID_DATA, "features": INVALID_DATA["features"][::2]},
+    )
+
+
+def test_partition_feature_collection() -> None:
+    # when
+    result = partition_feature_collection(
+        FeatureCollection, json.dumps(INVALID_DATA), properties=set()
+    )
+
+    # then
+    assert len(result.valid.features) == 3
+    assert set(result.errors) == {1, 3}
+    assert result.errors[3] == [
+        {
+            "type": "value_error",
+            "loc": ("id",),
+            "msg": "Value error, id cannot be None if present",
+            "ctx": {"error": result.errors[3][0]["ctx"]["error"]},
+        }
+    ]
+
+
+def test_partition_invalid_feature_collection() -> None:
+    with pytest.raises(pydantic.ValidationError):
+        # when
+        partition_feature_collection(
+            FeatureCollection, {**INVALID_DATA, "bbox": [1, 2, 0, 0]}
+        )
+
+
+def _nested_collection(depth: int) -> dict[str, Any]:
+    geometry: dict[str, Any] = {"type": "Point", "coordinates": [1, 2]}
+    for _ in range(depth):
+        geometry = {"type": "GeometryCollection", "geometries": [geometry]}
+    return geometry
+
+
+LIMITED_DATA = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[0, 0], [1, 0], [1, 1], [0, 0]]],
+            },
+            "properties": None,
+        },
+        {
+            "type": "Feature",
+            "geometry": _nested_collection(2),
+            "properties": None,
+        },
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "limits,loc",
+    [
+        (ParseLimits(max_bytes=100), ()),
+        (ParseLimits(max_features=1), ("features",)),
+        (
+            ParseLimits(max_vertices=4),
+            ("features", 1, "geometry", "geometries", 0, "geometries", 0),
+        ),
+        (
+            ParseLimits(max_depth=1),
+            ("features", 1, "geometry", "geometries", 0),
+        ),
+    ],
+)
+def test_parse_feature_collection_exceeding_limits(
+    limits: ParseLimits, loc: tuple[int | str, ...]
+) -> None:
+    # given
+    data = json.dumps(LIMITED_DATA)
+
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        # when
+        parse_feature_collection(
+            FeatureCollection[Feature[Geometry, None]], data, limits=limits
+        )
+
+    # then
+    (error,) = exc_info.value.errors()
+    assert error["type"] == "limit_exceeded"
+    assert error["loc"] == loc
+
+
+def test_parse_feature_collection_within_limits() -> None:
+    # given
+    limits = ParseLimits(max_bytes=1000, max_depth=2, max_vertices=5, max_features=2)
+
+    # when
+    result = parse_feature_collection(
+        FeatureCollection[Feature[Geometry, None]],
+        json.dumps(LIMITED_DATA),
+        limits=limits,
+    )
+
+    # then
+    assert len(result.features) == 2
+
+
+def test_parse_feature_collection_measures_strings_in_bytes() -> None:
+    # given
+    data = json.dumps(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature", "geometry": None, "properties": {"name": "é" * 50}}
+            ],
+        },
+        ensure_ascii=False,
+    )
+    limits = ParseLimits(max_bytes=len(data))
+
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        # when
+        parse_feature_collection(FeatureCollection, data, limits=limits)
+
+    # then
+    assert exc_info.value.errors()[0]["type"] == "limit_exceeded"
+    parsed = parse_feature_collection(
+        FeatureCollection, json.loads(data), limits=limits
+    )
+    assert len(parsed.features) == 1
+
+
+def test_parse_light_features_with_deeply_nested_input() -> None:
+    # given
+    data = "[" * 100_000 + "]" * 100_000
+
+    with pytest.raises(pydantic.ValidationError) as exc_info:
+        # when
+        parse_light_features(data, limits=ParseLimits())
+
+    # then
+    assert exc_info.value.errors()[0]["type"] == "limit_exceeded"
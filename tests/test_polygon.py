@@ -92,3 +92,191 @@ def test_parse_polygon_with_non_closed_ring() -> None:
     with pytest.raises(pydantic.ValidationError):
         # when
         Polygon(**data)
+
+
+def test_polygon_contains_points() -> None:
+    # given
+    polygon = Polygon(
+        type=GeoJSONObjectType.POLYGON,
+        coordinates=[
+            [(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)],
+            [(4, 4), (6, 4), (6, 6), (4, 6), (4, 4)],
+        ],
+    )
+
+    # when
+    result = polygon.contains_points([(1, 1), (5, 5), (11, 5), (3, 5, 100.0)])
+
+    # then
+    assert result == [True, False, False, True]
+
+
+def test_concave_polygon_contains_points() -> None:
+    # given
+    polygon = Polygon(
+        type=GeoJSONObjectType.POLYGON,
+        coordinates=[[(0, 0), (10, 0), (10, 10), (5, 2), (0, 10), (0, 0)]],
+    )
+
+    # when
+    result = polygon.contains_points([(5, 1), (5, 5), (1, 5), (9, 5)])
+
+    # then
+    assert result == [True, False, True, True]
+
+
+def test_polygon_with_zero_rings_contains_no_points() -> None:
+    # given
+    polygon = Polygon(type=GeoJSONObjectType.POLYGON, coordinates=[])
+
+    # when
+    result = polygon.contains_points([(0, 0), (1, 1)])
+
+    # then
+    assert result == [False, False]
+
+
+def test_polygon_area_and_centroid() -> None:
+    # given
+    polygon = Polygon(
+        type=GeoJSONObjectType.POLYGON,
+        coordinates=[
+            [(0, 0), (4, 0), (4, 4), (0, 4), (0, 0)],
+            [(0, 0), (0, 2), (2, 2), (2, 0), (0, 0)],
+        ],
+    )
+
+    # then
+    assert polygon.area == 12
+    assert polygon.centroid == pytest.approx((7 / 3, 7 / 3))
+
+
+def test_polygon_geodesic_area() -> None:
+    # given
+    polygon = Polygon(
+        type=GeoJSONObjectType.POLYGON,
+        coordinates=[[(0, 0), (1, 0), (1, 1), (0, 1), (0, 0)]],
+    )
+
+    # then
+    assert polygon.geodesic_area == pytest.approx(12_308_778_361, rel=1e-4)
+
+
+def test_polygon_split_antimeridian() -> None:
+    # given
+    polygon = Polygon(
+        type=GeoJSONObjectType.POLYGON,
+        coordinates=[
+            [(170, -10), (-170, -10), (-170, 10), (170, 10), (170, -10)],
+            [(175, -5), (175, 5), (-175, 5), (-175, -5), (175, -5)],
+        ],
+    )
+
+    # when
+    result = polygon.split_antimeridian()
+
+    # then
+    assert result.type is GeoJSONObjectType.MULTI_POLYGON
+    assert result.coordinates == [
+        [
+            [
+                (180, 10),
+                (170, 10),
+                (170, -10),
+                (180, -10),
+                (180, -5),
+                (175, -5),
+                (175, 5),
+                (180, 5),
+                (180, 10),
+            ]
+        ],
+        [
+            [
+                (-180, -10),
+                (-170, -10),
+                (-170, 10),
+                (-180, 10),
+                (-180, 5),
+                (-175, 5),
+                (-175, -5),
+                (-180, -5),
+                (-180, -10),
+            ]
+        ],
+    ]
+    assert result.area == 20 * 20 - 10 * 10
+
+
+def test_polygon_split_antimeridian_at_vertices_on_antimeridian() -> None:
+    # given
+    polygon = Polygon(
+        type=GeoJSONObjectType.POLYGON,
+        coordinates=[
+            [
+                (170, -10),
+                (180, -10),
+                (-180, -10),
+                (-170, -10),
+                (-170, 10),
+                (-180, 10),
+                (180, 10),
+                (170, 10),
+                (170, -10),
+            ]
+        ],
+    )
+
+    # when
+    result = polygon.split_antimeridian()
+
+    # then
+    assert result.coordinates == [
+        [[(180, 10), (170, 10), (170, -10), (180, -10), (180, 10)]],
+        [[(-180, -10), (-170, -10), (-170, 10), (-180, 10), (-180, -10)]],
+    ]
+
+
+def test_polygon_split_antimeridian_keeps_holes_on_one_side() -> None:
+    # given
+    polygon = Polygon(
+        type=GeoJSONObjectType.POLYGON,
+        coordinates=[
+            [(170, -10), (-170, -10), (-170, 10), (170, 10), (170, -10)],
+            [(172, -5), (174, -5), (174, 5), (172, -5)],
+        ],
+    )
+
+    # when
+    result = polygon.split_antimeridian()
+
+    # then
+    assert [len(rings) for rings in result.coordinates] == [2, 1]
+    assert result.coordinates[0][1] == [(172, -5), (174, 5), (174, -5), (172, -5)]
+
+
+def test_polygon_split_antimeridian_around_pole() -> None:
+    # given
+    polygon = Polygon(
+        type=GeoJSONObjectType.POLYGON,
+        coordinates=[[(-90, 80), (0, 80), (90, 80), (180, 80), (-90, 80)]],
+    )
+
+    # when
+    result = polygon.split_antimeridian()
+
+    # then
+    assert result.coordinates == [
+        [
+            [
+                (180, 90),
+                (-90, 90),
+                (-90, 80),
+                (0, 80),
+                (90, 80),
+                (180, 80),
+                (180, 90),
+            ]
+        ],
+        [[(-180, 80), (-90, 80), (-90, 90), (-180, 90), (-180, 80)]],
+    ]
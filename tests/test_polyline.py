@@ -0,0 +1,114 @@
+import pytest
+
+from geodantic import (
+    LineString,
+    MultiLineString,
+    PackedPositions,
+    decode_delta_varint,
+    decode_polyline,
+    decode_polylines,
+    encode_delta_varint,
+    encode_polyline,
+)
+
+# The example of the encoded polyline format documentation
+ENCODED = "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+POSITIONS = [(-120.2, 38.5), (-120.95, 40.7), (-126.453, 43.252)]
+
+
+def test_decode_polyline() -> None:
+    # when
+    line = decode_polyline(ENCODED)
+
+    # then
+    assert isinstance(line.coordinates, PackedPositions)
+    assert line.coordinates.precision == "fixed"
+    assert line == LineString(type="LineString", coordinates=POSITIONS)
+
+
+def test_encode_polyline() -> None:
+    # given
+    line = LineString(type="LineString", coordinates=[(*p, 10) for p in POSITIONS])
+
+    # then
+    assert encode_polyline(line) == ENCODED
+    assert encode_polyline(POSITIONS) == ENCODED
+
+
+def test_polyline_round_trip_with_precision() -> None:
+    # given
+    line = LineString(
+        type="LineString", coordinates=[(13.4050001, 52.52), (-0.1276, 51.5073509)]
+    )
+
+    # when
+    result = decode_polyline(encode_polyline(line, precision=7), precision=7)
+
+    # then
+    assert result == line
+
+
+def test_decode_polylines() -> None:
+    # when
+    lines = decode_polylines([ENCODED, ENCODED.encode()])
+
+    # then
+    assert [list(line.coordinates) for line in lines] == [POSITIONS, POSITIONS]
+
+
+@pytest.mark.parametrize(
+    "encoded",
+    [
+        ENCODED[:-1],
+        ENCODED[:5],
+        "_p~iF~ps|U",
+        "_p~iF~ps|U ",
+        encode_polyline([(0, 91), (0, 0)]),
+    ],
+)
+def test_decode_invalid_polyline(encoded: str) -> None:
+    with pytest.raises(ValueError):
+        decode_polyline(encoded)
+
+
+@pytest.mark.parametrize("precision", [-1, 8])
+def test_polyline_invalid_precision(precision: int) -> None:
+    with pytest.raises(ValueError):
+        decode_polyline(ENCODED, precision)
+
+
+@pytest.mark.parametrize(
+    "geometry",
+    [
+        LineString(type="LineString", coordinates=POSITIONS),
+        LineString(type="LineString", coordinates=[(1, 2, -3.5), (-4, 5, 6)]),
+        decode_polyline(ENCODED),
+        MultiLineString(
+            type="MultiLineString",
+            coordinates=[POSITIONS, [(179.9999999, -89.9999999), (0, 0)]],
+        ),
+        MultiLineString(type="MultiLineString", coordinates=[]),
+    ],
+)
+def test_delta_varint_round_trip(geometry: LineString | MultiLineString) -> None:
+    # when
+    encoded = encode_delta_varint(geometry)
+
+    # then
+    assert decode_delta_varint(encoded) == geometry
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        encode_delta_varint(LineString(type="LineString", coordinates=POSITIONS))[:-1],
+        encode_delta_varint(LineString(type="LineString", coordinates=POSITIONS))
+        + b"\x00",
+        b"\x02\x02\x00",
+        b"\x00\x04\x00",
+        b"\x00\x02\x01\x01\x00\x00",
+    ],
+)
+def test_decode_invalid_delta_varint(data: bytes) -> None:
+    with pytest.raises(ValueError):
+        decode_delta_varint(data)
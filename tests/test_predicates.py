@@ -0,0 +1,199 @@
+from typing import Any
+
+import pydantic
+import pytest
+
+from geodantic import Geometry
+
+_adapter: pydantic.TypeAdapter[Any] = pydantic.TypeAdapter(Geometry)
+
+
+def _geometry(data: dict[str, Any]) -> Any:
+    return _adapter.validate_python(data)
+
+
+def _square(x0: float, y0: float, x1: float, y1: float) -> dict[str, Any]:
+    return {
+        "type": "Polygon",
+        "coordinates": [[[x0, y0], [x1, y0], [x1, y1], [x0, y1], [x0, y0]]],
+    }
+
+
+SQUARE = _square(0, 0, 2, 2)
+WITH_HOLE = {
+    "type": "Polygon",
+    "coordinates": [
+        [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]],
+        [[1, 1], [3, 1], [3, 3], [1, 3], [1, 1]],
+    ],
+}
+# The hole ends halfway up the exterior ring
+WITH_LOW_HOLE = {
+    "type": "Polygon",
+    "coordinates": [
+        [[0, 0], [10, 0], [10, 10], [0, 10], [0, 0]],
+        [[2, 2], [5, 2], [5, 5], [2, 5], [2, 2]],
+    ],
+}
+
+
+@pytest.mark.parametrize(
+    "first, second, intersects, touches",
+    [
+        (SQUARE, _square(2, 0, 3, 2), True, True),
+        (SQUARE, _square(2, 2, 3, 3), True, True),
+        (SQUARE, _square(1, 1, 3, 3), True, False),
+        (SQUARE, _square(0.5, 0.5, 1, 1), True, False),
+        (SQUARE, _square(5, 5, 6, 6), False, False),
+        (SQUARE, SQUARE, True, False),
+        (WITH_HOLE, _square(1.5, 1.5, 2, 2), False, False),
+        (WITH_HOLE, _square(1, 1, 3, 3), True, True),
+        (SQUARE, {"type": "Point", "coordinates": [2, 1]}, True, True),
+        (SQUARE, {"type": "Point", "coordinates": [1, 1]}, True, False),
+        (SQUARE, {"type": "Point", "coordinates": [3, 1]}, False, False),
+        (SQUARE, {"type": "LineString", "coordinates": [[2, 0], [2, 2]]}, True, True),
+        (SQUARE, {"type": "LineString", "coordinates": [[-1, 1], [3, 1]]}, True, False),
+        (SQUARE, {"type": "LineString", "coordinates": [[2, 1], [3, 1]]}, True, True),
+        (
+            {"type": "LineString", "coordinates": [[0, 0], [2, 2]]},
+            {"type": "LineString", "coordinates": [[0, 2], [2, 0]]},
+            True,
+            False,
+        ),
+        (
+            {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+            {"type": "LineString", "coordinates": [[1, 1], [2, 0]]},
+            True,
+            True,
+        ),
+        (
+            {"type": "MultiPoint", "coordinates": [[5, 5], [1, 1]]},
+            {"type": "MultiPolygon", "coordinates": [SQUARE["coordinates"]]},
+            True,
+            False,
+        ),
+        (
+            {
+                "type": "GeometryCollection",
+                "geometries": [
+                    {"type": "Point", "coordinates": [2, 1]},
+                    _square(5, 5, 6, 6),
+                ],
+            },
+            SQUARE,
+            True,
+            True,
+        ),
+    ],
+)
+def test_intersects_and_touches(
+    first: dict[str, Any], second: dict[str, Any], intersects: bool, touches: bool
+) -> None:
+    # given
+    a, b = _geometry(first), _geometry(second)
+
+    # then
+    assert a.intersects(b) is intersects
+    assert b.intersects(a) is intersects
+    assert a.touches(b) is touches
+    assert b.touches(a) is touches
+
+
+@pytest.mark.parametrize(
+    "first, second, contains",
+    [
+        (SQUARE, _square(0.5, 0.5, 1, 1), True),
+        (SQUARE, _square(0, 0, 1, 1), True),
+        (SQUARE, SQUARE, True),
+        (SQUARE, _square(1, 1, 3, 3), False),
+        (SQUARE, _square(2, 0, 3, 2), False),
+        (WITH_HOLE, _square(0.5, 0.5, 3.5, 3.5), False),
+        (WITH_HOLE, _square(1.5, 1.5, 2, 2), False),
+        (WITH_HOLE, _square(0.2, 0.2, 0.8, 0.8), True),
+        (WITH_HOLE, WITH_HOLE, True),
+        (WITH_LOW_HOLE, WITH_LOW_HOLE, True),
+        (SQUARE, {"type": "Point", "coordinates": [1, 1]}, True),
+        (SQUARE, {"type": "Point", "coordinates": [2, 1]}, False),
+        (SQUARE, {"type": "LineString", "coordinates": [[0, 0], [2, 2]]}, True),
+        (SQUARE, {"type": "LineString", "coordinates": [[2, 0], [2, 2]]}, False),
+        (SQUARE, {"type": "LineString", "coordinates": [[1, 1], [3, 1]]}, False),
+        (
+            {"type": "LineString", "coordinates": [[0, 0], [2, 0], [2, 2]]},
+            {"type": "LineString", "coordinates": [[1, 0], [2, 0], [2, 1]]},
+            True,
+        ),
+        (
+            {"type": "LineString", "coordinates": [[0, 0], [2, 0]]},
+            {"type": "Point", "coordinates": [0, 0]},
+            False,
+        ),
+        (
+            {"type": "MultiPoint", "coordinates": [[0, 0], [1, 1]]},
+            {"type": "Point", "coordinates": [1, 1]},
+            True,
+        ),
+        ({"type": "Point", "coordinates": [1, 1]}, SQUARE, False),
+        (
+            {
+                "type": "GeometryCollection",
+                "geometries": [SQUARE, _square(5, 5, 6, 6)],
+            },
+            {"type": "MultiPoint", "coordinates": [[1, 1], [5.5, 5.5]]},
+            True,
+        ),
+    ],
+)
+def test_contains_and_within(
+    first: dict[str, Any], second: dict[str, Any], contains: bool
+) -> None:
+    # given
+    a, b = _geometry(first), _geometry(second)
+
+    # then
+    assert a.contains(b) is contains
+    assert b.within(a) is contains
+
+
+@pytest.mark.parametrize(
+    "first, second, tolerance, equal",
+    [
+        (SQUARE, _square(0, 0, 2, 2), 0, True),
+        (SQUARE, _square(0, 0, 2, 2.0001), 0, False),
+        (SQUARE, _square(0, 0, 2, 2.0001), 0.001, True),
+        (SQUARE, _square(0, 0, 2, 2.01), 0.001, False),
+        (SQUARE, WITH_HOLE, 10, False),
+        (
+            {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+            {"type": "MultiPoint", "coordinates": [[0, 0], [1, 1]]},
+            0,
+            False,
+        ),
+        (
+            {"type": "Point", "coordinates": [0, 0]},
+            {"type": "Point", "coordinates": [0, 0, 0]},
+            1,
+            False,
+        ),
+        (
+            {"type": "GeometryCollection", "geometries": [SQUARE]},
+            {"type": "GeometryCollection", "geometries": [_square(0, 0, 2, 2.0001)]},
+            0.001,
+            True,
+        ),
+        (
+            {"type": "GeometryCollection", "geometries": [SQUARE]},
+            {"type": "GeometryCollection", "geometries": [SQUARE, SQUARE]},
+            0,
+            False,
+        ),
+    ],
+)
+def test_equals_exact(
+    first: dict[str, Any], second: dict[str, Any], tolerance: float, equal: bool
+) -> None:
+    # given
+    a, b = _geometry(first), _geometry(second)
+
+    # then
+    assert a.equals_exact(b, tolerance) is equal
+    assert b.equals_exact(a, tolerance) is equal
@@ -0,0 +1,47 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from geodantic.profiling import main
+
+
+def test_profile_file(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    # given
+    path = tmp_path / "sample.geojson"
+    path.write_text(
+        json.dumps(
+            {
+                "type": "FeatureCollection",
+                "features": [
+                    {
+                        "type": "Feature",
+                        "geometry": {"type": "Point", "coordinates": [1, 2]},
+                        "properties": None,
+                    }
+                ],
+            }
+        )
+    )
+
+    # when
+    status = main([str(path), "--repeat", "1", "--top", "3"])
+
+    # then
+    output = capsys.readouterr().out
+    assert status == 0
+    assert str(path) in output
+    for stage in ("json.loads", "pydantic", "geodantic", "Hot functions"):
+        assert stage in output
+
+
+def test_profile_synthetic_sample_without_breakdown(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    # when
+    main(["--features", "10", "--repeat", "1", "--no-breakdown"])
+
+    # then
+    output = capsys.readouterr().out
+    assert "synthetic 10 polygons" in output
+    assert "Hot functions" not in output
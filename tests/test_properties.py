@@ -0,0 +1,95 @@
+from typing import Any
+
+import pydantic
+import pytest
+
+from geodantic import CompactProperties, Feature, FeatureCollection, Point
+
+
+def test_compact_properties_mapping_api() -> None:
+    # given
+    properties = CompactProperties({"a": 1, "b": None})
+
+    # then
+    assert properties["a"] == 1
+    assert properties.get("c", 2) == 2
+    assert list(properties) == ["a", "b"]
+    assert len(properties) == 2
+    assert "b" in properties
+    assert properties == {"a": 1, "b": None}
+    assert properties.to_dict() == {"a": 1, "b": None}
+    with pytest.raises(KeyError):
+        properties["c"]
+
+
+def test_parse_features_with_compact_properties() -> None:
+    # given
+    data = {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [1, 2]},
+                "properties": {"name": "a", "values": [1, 2]},
+            },
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [3, 4]},
+                "properties": {"name": "b", "values": []},
+            },
+        ],
+    }
+
+    # when
+    feature_collection = FeatureCollection[
+        Feature[Point, CompactProperties]
+    ].model_validate(data)
+
+    # then
+    first, second = (feature.properties for feature in feature_collection.features)
+    assert isinstance(first, CompactProperties)
+    assert first == {"name": "a", "values": [1, 2]}
+    assert first._schema is second._schema
+    assert feature_collection.model_dump(exclude_unset=True) == {
+        **data,
+        "features": [
+            {**feature, "geometry": {**feature["geometry"], "coordinates": (x, y)}}
+            for feature, (x, y) in zip(data["features"], [(1.0, 2.0), (3.0, 4.0)])
+        ],
+    }
+    assert (
+        FeatureCollection[Feature[Point, CompactProperties]].model_validate_json(
+            feature_collection.model_dump_json(exclude_unset=True)
+        )
+        == feature_collection
+    )
+
+
+@pytest.mark.parametrize("properties", [None, [1, 2], {1: "a"}])
+def test_parse_invalid_compact_properties(properties: Any) -> None:
+    # given
+    data = {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [1, 2]},
+        "properties": properties,
+    }
+
+    with pytest.raises(pydantic.ValidationError):
+        # when
+        Feature[Point, CompactProperties](**data)
+
+
+def test_compact_properties_content_hash_matches_dict() -> None:
+    # given
+    data = {
+        "type": "Feature",
+        "geometry": {"type": "Point", "coordinates": [1, 2]},
+        "properties": {"b": 1, "a": [2]},
+    }
+
+    # when
+    compact = Feature[Point, CompactProperties](**data)
+    plain = Feature[Point, dict[str, Any]](**data)
+
+    # then
+    assert compact.content_hash == plain.content_hash
@@ -0,0 +1,209 @@
+import gzip
+import io
+import json
+import socket
+from pathlib import Path
+from typing import Any
+
+import pydantic
+import pytest
+
+from geodantic import (
+    CompactProperties,
+    Feature,
+    FeatureCollection,
+    FeatureCollectionWriter,
+    Geometry,
+    GeometryCollection,
+    LineString,
+    Point,
+    dump_geojson,
+    pack_coordinates,
+    write_geojson,
+)
+
+COLLECTION = {
+    "type": "FeatureCollection",
+    "bbox": [0, 0, 2, 2],
+    "features": [
+        {
+            "type": "Feature",
+            "id": 7,
+            "geometry": {"type": "Point", "coordinates": [1, 2]},
+            "properties": {"name": "a", "tags": ["x", "y"]},
+        },
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "GeometryCollection",
+                "bbox": [0, 0, 2, 2],
+                "geometries": [
+                    {"type": "LineString", "coordinates": [[0, 0], [2, 2, 5]]},
+                ],
+            },
+            "properties": None,
+        },
+        {"type": "Feature", "geometry": None, "properties": {}},
+    ],
+}
+
+
+def test_dump_geojson_leaves_out_unset_members() -> None:
+    # given
+    collection = FeatureCollection[Feature[Geometry | None, dict[str, Any] | None]](
+        **COLLECTION
+    )
+
+    # when
+    result = dump_geojson(collection)
+
+    # then
+    assert b'"bbox":null' not in result
+    assert b'"id":null' not in result
+    assert json.loads(result) == json.loads(
+        collection.model_dump_json(exclude_unset=True)
+    )
+
+
+def test_write_geojson_to_stream_and_bytearray() -> None:
+    # given
+    point = Point(type="Point", coordinates=(1.5, -2))
+    stream = io.BytesIO()
+    buffer = bytearray(b"prefix:")
+
+    # when
+    write_geojson(point, stream)
+    write_geojson(point, buffer)
+
+    # then
+    assert stream.getvalue() == b'{"type":"Point","coordinates":[1.5,-2.0]}'
+    assert buffer == b"prefix:" + stream.getvalue()
+
+
+class _Properties(pydantic.BaseModel):
+    name: str
+
+
+def test_dump_geojson_with_other_properties_and_packed_coordinates() -> None:
+    # given
+    line = pack_coordinates(LineString(type="LineString", coordinates=[(0, 0), (1, 1)]))
+    compact = Feature[LineString, CompactProperties].model_validate(
+        {"type": "Feature", "geometry": line, "properties": {"a": 1}}
+    )
+    modelled = Feature[GeometryCollection[Point], _Properties].model_validate(
+        {
+            "type": "Feature",
+            "id": "x",
+            "geometry": {"type": "GeometryCollection", "geometries": []},
+            "properties": {"name": "b"},
+        }
+    )
+
+    # when
+    results = [dump_geojson(compact), dump_geojson(modelled)]
+
+    # then
+    assert results == [
+        b'{"type":"Feature","geometry":{"type":"LineString",'
+        b'"coordinates":[[0.0,0.0],[1.0,1.0]]},"properties":{"a":1}}',
+        b'{"type":"Feature","geometry":{"type":"GeometryCollection",'
+        b'"geometries":[]},"properties":{"name":"b"},"id":"x"}',
+    ]
+
+
+def _points(count: int) -> list[Feature[Point, dict[str, int]]]:
+    return [
+        Feature[Point, dict[str, int]](
+            type="Feature",
+            geometry=Point(type="Point", coordinates=(i, 0)),
+            properties={"i": i},
+        )
+        for i in range(count)
+    ]
+
+
+def test_feature_collection_writer_to_stream() -> None:
+    # given
+    stream = io.BytesIO()
+
+    # when
+    with FeatureCollectionWriter(stream, bbox=(0, 0, 9, 0), buffer_size=100) as writer:
+        writer.write_all(_points(10))
+
+    # then
+    assert len(writer) == 10
+    collection = FeatureCollection[Feature[Point, dict[str, int]]].model_validate_json(
+        stream.getvalue()
+    )
+    assert collection.bbox == (0, 0, 9, 0)
+    assert [feature.properties["i"] for feature in collection.features] == list(
+        range(10)
+    )
+
+
+def test_feature_collection_writer_to_gzip_file(tmp_path: Path) -> None:
+    # given
+    path = tmp_path / "features.json.gz"
+
+    # when
+    with FeatureCollectionWriter(path, compress=True) as writer:
+        writer.write_all(_points(3))
+
+    # then
+    data = json.loads(gzip.decompress(path.read_bytes()))
+    assert [feature["properties"]["i"] for feature in data["features"]] == [0, 1, 2]
+
+
+def test_feature_collection_writer_to_socket() -> None:
+    # given
+    sender, receiver = socket.socketpair()
+
+    # when
+    with sender, receiver:
+        with sender.makefile("wb") as stream, FeatureCollectionWriter(stream) as writer:
+            writer.write_all(_points(2))
+        sender.shutdown(socket.SHUT_WR)
+        received = receiver.makefile("rb").read()
+
+    # then
+    assert len(json.loads(received)["features"]) == 2
+
+
+def test_feature_collection_writer_without_features() -> None:
+    # given
+    stream = io.BytesIO()
+
+    # when
+    FeatureCollectionWriter(stream).close()
+
+    # then
+    assert stream.getvalue() == b'{"type":"FeatureCollection","features":[]}'
+
+
+def test_feature_collection_writer_leaves_collection_open_on_error() -> None:
+    # given
+    stream = io.BytesIO()
+
+    with pytest.raises(RuntimeError):
+        # when
+        with FeatureCollectionWriter(stream) as writer:
+            writer.write_all(_points(1))
+            raise RuntimeError
+
+    # then
+    assert not stream.getvalue().endswith(b"]}")
+    with pytest.raises(ValueError):
+        writer.write(_points(1)[0])
+
+
+def test_feature_collection_writer_rejects_other_objects() -> None:
+    # given
+    stream = io.BytesIO()
+
+    with FeatureCollectionWriter(stream) as writer:
+        with pytest.raises(TypeError):
+            # when
+            writer.write(Point(type="Point", coordinates=(1, 2)))
+
+    # then
+    assert json.loads(stream.getvalue())["features"] == []
@@ -0,0 +1,176 @@
+import multiprocessing
+from typing import Any
+
+import pytest
+
+from geodantic import FeatureCollection, SharedFeatureCollection
+from geodantic.shared import _SharedFeatures
+
+DATA = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [-5.6, 42.6, 3]},
+            "properties": None,
+            "id": "x",
+        },
+        {
+            "type": "Feature",
+            "bbox": [0, 0, 1, 1],
+            "geometry": {
+                "type": "MultiPolygon",
+                "bbox": [0, 0, 1, 1],
+                "coordinates": [
+                    [[[0, 0], [1, 0], [1, 1], [0, 0]]],
+                    [
+                        [[0, 0], [1, 0], [1, 1], [0, 0]],
+                        [[0, 0], [1, 0], [1, 1], [0, 0]],
+                    ],
+                ],
+            },
+            "properties": {"name": "a", "values": [1, 2]},
+            "id": 2,
+        },
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "GeometryCollection",
+                "geometries": [{"type": "Point", "coordinates": [1, 2]}],
+            },
+            "properties": {},
+        },
+        {"type": "Feature", "geometry": None, "properties": None},
+    ],
+}
+
+
+def _read_shared(name: str) -> Any:
+    with SharedFeatureCollection.attach(name) as shared:
+        return shared.to_collection().model_dump(mode="json", exclude_unset=True)
+
+
+def test_shared_feature_collection_round_trip() -> None:
+    # given
+    collection = FeatureCollection.model_validate(DATA)
+
+    # when
+    shared = SharedFeatureCollection.create(collection)
+
+    # then
+    try:
+        assert len(shared) == 4
+        assert shared.features == collection.features
+        assert shared.features[-1] == collection.features[-1]
+        assert shared.features[1:3] == collection.features[1:3]
+        assert shared.to_collection().model_dump_json(
+            exclude_unset=True
+        ) == collection.model_dump_json(exclude_unset=True)
+        with pytest.raises(IndexError):
+            shared.features[4]
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def test_shared_feature_collection_attach_from_other_process() -> None:
+    # given
+    collection = FeatureCollection.model_validate(DATA)
+    shared = SharedFeatureCollection.create(collection)
+
+    try:
+        # when
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            result = pool.apply(_read_shared, (shared.name,))
+
+        # then
+        assert result == collection.model_dump(mode="json", exclude_unset=True)
+        with SharedFeatureCollection.attach(shared.name) as attached:
+            assert attached.features[0].id == "x"
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def test_shared_feature_collection_rejects_mixed_dimensions() -> None:
+    # given
+    collection = FeatureCollection.model_validate(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": [[0, 0], [1, 1, 1]],
+                    },
+                    "properties": None,
+                }
+            ],
+        }
+    )
+
+    with pytest.raises(ValueError):
+        # when
+        SharedFeatureCollection.create(collection)
+
+
+def test_shared_feature_collection_last_feature_of_large_collection() -> None:
+    # given
+    collection = FeatureCollection.model_validate(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "MultiLineString",
+                        "coordinates": [
+                            [[j, i % 80], [j + 1, i % 80]] for j in range(i % 3 + 1)
+                        ],
+                    },
+                    "properties": {"index": i},
+                }
+                for i in range(20_000)
+            ],
+        }
+    )
+    shared = SharedFeatureCollection.create(collection)
+
+    try:
+        # when
+        last = shared.features[-1]
+
+        # then
+        assert last == collection.features[-1]
+        assert sum(1 for _ in shared.features) == 20_000
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def test_shared_feature_collection_slice_builds_only_selected_features(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # given
+    collection = FeatureCollection.model_validate(DATA)
+    shared = SharedFeatureCollection.create(collection)
+    built: list[int] = []
+    feature = _SharedFeatures._feature
+
+    def counting_feature(self: _SharedFeatures, index: int) -> Any:
+        built.append(index)
+        return feature(self, index)
+
+    monkeypatch.setattr(_SharedFeatures, "_feature", counting_feature)
+
+    try:
+        # when
+        features = list(shared.to_collection().sliced(2, 4).features)
+
+        # then
+        assert features == collection.features[2:4]
+        assert built == [2, 3]
+    finally:
+        shared.close()
+        shared.unlink()
@@ -0,0 +1,178 @@
+import json
+from typing import Any
+
+import pytest
+
+from geodantic import Feature, FeatureCollection, Polygon, from_topojson, to_topojson
+
+SQUARES = {
+    "type": "FeatureCollection",
+    "features": [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[1, 0], [1, 1], [0, 1], [0, 0], [1, 0]]],
+            },
+            "properties": {"name": "a"},
+            "id": 1,
+        },
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [[[1, 0], [2, 0], [2, 1], [1, 1], [1, 0]]],
+            },
+            "properties": {"name": "b"},
+        },
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [5, 5]},
+            "properties": None,
+        },
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "MultiLineString",
+                "coordinates": [[[3, 3], [3, 4]], [[4, 4], [4, 5]]],
+            },
+            "properties": None,
+        },
+        {"type": "Feature", "geometry": None, "properties": None},
+    ],
+}
+
+
+def test_to_topojson_stores_shared_arcs_once() -> None:
+    # given
+    collection = FeatureCollection.model_validate(SQUARES)
+
+    # when
+    topology = to_topojson(collection)
+
+    # then
+    geometries = topology["objects"]["features"]["geometries"]
+    assert topology["arcs"][0] == [[1, 0], [1, 1]]
+    assert geometries[0] == {
+        "type": "Polygon",
+        "arcs": [[0, 1]],
+        "properties": {"name": "a"},
+        "id": 1,
+    }
+    # The second square walks the shared edge in the opposite direction
+    assert geometries[1]["arcs"] == [[2, ~0]]
+    assert geometries[2] == {
+        "type": "Point",
+        "coordinates": [5, 5],
+        "properties": None,
+    }
+    assert geometries[4] == {"type": None, "properties": None}
+
+
+def test_topojson_round_trip() -> None:
+    # given
+    collection = FeatureCollection.model_validate(SQUARES)
+
+    # when
+    result = from_topojson(FeatureCollection, json.dumps(to_topojson(collection)))
+
+    # then
+    assert result == collection
+
+
+def test_topojson_quantized_round_trip() -> None:
+    # given
+    model = FeatureCollection[Feature[Polygon, dict[str, Any]]]
+    collection = model.model_validate({**SQUARES, "features": SQUARES["features"][:2]})
+
+    # when
+    topology = to_topojson(collection, quantization=3)
+    result = from_topojson(model, topology)
+
+    # then
+    assert topology["transform"] == {"scale": [1.0, 0.5], "translate": [0, 0]}
+    assert topology["arcs"][0] == [[1, 0], [0, 2]]
+    assert result == collection
+
+
+def test_topojson_quantized_round_trip_on_world_corner() -> None:
+    # given
+    collection = FeatureCollection.model_validate(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": [[-131.629, 62.538], [180, 90]],
+                    },
+                    "properties": None,
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [180, 90]},
+                    "properties": None,
+                },
+            ],
+        }
+    )
+
+    # when
+    result = from_topojson(
+        FeatureCollection, to_topojson(collection, quantization=1035)
+    )
+
+    # then
+    line, point = (feature.geometry for feature in result.features)
+    assert line.coordinates[-1] == (180, 90)
+    assert point.coordinates == (180, 90)
+
+
+def test_topojson_rings_without_junctions_are_shared() -> None:
+    # given
+    ring = [[0, 0], [1, 0], [1, 1], [0, 0]]
+    collection = FeatureCollection.model_validate(
+        {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Polygon", "coordinates": [ring]},
+                    "properties": None,
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "Polygon",
+                        "coordinates": [[*ring[1:], ring[1]][::-1]],
+                    },
+                    "properties": None,
+                },
+            ],
+        }
+    )
+
+    # when
+    topology = to_topojson(collection)
+
+    # then
+    assert len(topology["arcs"]) == 1
+    assert [g["arcs"] for g in topology["objects"]["features"]["geometries"]] == [
+        [[0]],
+        [[~0]],
+    ]
+
+
+@pytest.mark.parametrize(
+    "data, name",
+    [
+        ({"type": "FeatureCollection", "features": []}, None),
+        ({"type": "Topology", "objects": {}, "arcs": []}, None),
+        ({"type": "Topology", "objects": {"a": {}, "b": {}}, "arcs": []}, None),
+        ({"type": "Topology", "objects": {"a": {}}, "arcs": []}, "b"),
+    ],
+)
+def test_from_topojson_rejects_invalid_objects(data: Any, name: str | None) -> None:
+    with pytest.raises(ValueError):
+        from_topojson(FeatureCollection, data, name=name)
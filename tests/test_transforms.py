@@ -0,0 +1,110 @@
+from array import array
+from collections.abc import Sequence
+
+import pydantic
+import pytest
+
+from geodantic import (
+    GeoJSONObjectType,
+    GeometryCollection,
+    LineString,
+    MultiPolygon,
+    Point,
+    Polygon,
+)
+
+
+def test_transform_calls_function_once() -> None:
+    # given
+    polygon = Polygon(
+        type=GeoJSONObjectType.POLYGON,
+        coordinates=[
+            [(0, 0, 5), (2, 0, 5), (2, 2, 5), (0, 0, 5)],
+            [(0.5, 0.5, 5), (1, 0.5, 5), (1, 1, 5), (0.5, 0.5, 5)],
+        ],
+    )
+    calls: list[int] = []
+
+    def shift(
+        xs: array[float], ys: array[float]
+    ) -> tuple[Sequence[float], Sequence[float]]:
+        calls.append(len(xs))
+        return [x + 10 for x in xs], [y - 1 for y in ys]
+
+    # when
+    result = polygon.transform(shift)
+
+    # then
+    assert calls == [8]
+    assert isinstance(result, Polygon)
+    assert result.coordinates == [
+        [(10, -1, 5), (12, -1, 5), (12, 1, 5), (10, -1, 5)],
+        [(10.5, -0.5, 5), (11, -0.5, 5), (11, 0, 5), (10.5, -0.5, 5)],
+    ]
+
+
+def test_transform_with_wrong_number_of_coordinates() -> None:
+    # given
+    point = Point(type=GeoJSONObjectType.POINT, coordinates=(1, 2))
+
+    with pytest.raises(ValueError):
+        # when
+        point.transform(lambda xs, ys: ([], []))
+
+
+def test_to_web_mercator() -> None:
+    # given
+    line_string = LineString(
+        type=GeoJSONObjectType.LINE_STRING,
+        coordinates=[(0, 0), (180, 85.0511287798066), (-90, 90)],
+    )
+
+    # when
+    result = line_string.to_web_mercator()
+
+    # then
+    assert result.coordinates == [
+        pytest.approx((0, 0)),
+        pytest.approx((20037508.342789244, 20037508.342789244)),
+        pytest.approx((-10018754.171394622, 20037508.342789244)),
+    ]
+
+
+def test_to_web_mercator_result_is_not_valid_geojson() -> None:
+    # given
+    point = Point(type=GeoJSONObjectType.POINT, coordinates=(90, 45))
+
+    # when
+    result = point.to_web_mercator()
+
+    # then
+    assert result.coordinates == pytest.approx((10018754.171394622, 5621521.486192066))
+    with pytest.raises(pydantic.ValidationError):
+        Point.model_validate(result.model_dump())
+
+
+def test_affine_on_geometry_collection_recomputes_bbox() -> None:
+    # given
+    collection = GeometryCollection[Point | MultiPolygon](
+        type=GeoJSONObjectType.GEOMETRY_COLLECTION,
+        bbox=(0, 0, 1, 1),
+        geometries=[
+            Point(type=GeoJSONObjectType.POINT, coordinates=(1, 1)),
+            MultiPolygon(
+                type=GeoJSONObjectType.MULTI_POLYGON,
+                bbox=(0, 0, 1, 1),
+                coordinates=[[[(0, 0), (1, 0), (1, 1), (0, 0)]]],
+            ),
+        ],
+    )
+
+    # when
+    result = collection.affine((2, 0, 0, 3, 1, -1))
+
+    # then
+    point, multi_polygon = result.geometries
+    assert point.coordinates == (3, 2)
+    assert multi_polygon.coordinates == [[[(1, -1), (3, -1), (3, 2), (1, -1)]]]
+    assert multi_polygon.bbox == (1, -1, 3, 2)
+    assert result.bbox == (1, -1, 3, 2)
+    assert "bbox" not in point.model_fields_set